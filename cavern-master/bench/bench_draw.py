@@ -0,0 +1,50 @@
+"""
+bench_draw.py — Frame time of Game.draw on SDL's dummy video driver.
+
+Steps a demo game and times each Game.draw call onto an offscreen pgzero
+screen.  Run from the project root:
+
+    python bench/bench_draw.py [frames]
+"""
+
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame  # noqa: E402
+import pgzero.loaders  # noqa: E402
+from pgzero.screen import Screen  # noqa: E402
+
+from src.constants import HEIGHT, WIDTH  # noqa: E402
+from src.game import Game  # noqa: E402
+
+
+def main(frames: int = 2000) -> None:
+    pygame.init()
+    screen = Screen(pygame.display.set_mode((WIDTH, HEIGHT)))
+    pgzero.loaders.set_root(ROOT)
+
+    game = Game()
+    game.draw(screen)   # warm the image cache
+    times = []
+    for _ in range(frames):
+        game.update()
+        start = time.perf_counter()
+        game.draw(screen)
+        times.append(time.perf_counter() - start)
+
+    times.sort()
+    mean = sum(times) / len(times)
+    print(f"Game.draw over {frames} frames: "
+          f"mean {mean * 1e3:.3f} ms, "
+          f"p50 {times[len(times) // 2] * 1e3:.3f} ms, "
+          f"p99 {times[int(len(times) * 0.99)] * 1e3:.3f} ms")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
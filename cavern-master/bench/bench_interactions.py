@@ -0,0 +1,127 @@
+"""
+bench_interactions.py — Orb interaction queries: linear scans vs. indexes.
+
+Builds a field of robots, bolts and orbs and, for each simulated tick, runs
+the three orb queries the game makes — bolt hits, aggressive-robot
+targeting and robot capture — three ways: as the original linear scans over
+every orb; with every query through spatial hashes, as the registry used to
+do; and through the registry as it is now, which scans up to SCAN_ORBS
+orbs and otherwise uses the band index for targeting and capture.  Index refreshes are included in the timings.  Orbs drift
+upwards between ticks as floating orbs do.  Run from the project root:
+
+    python bench/bench_interactions.py
+"""
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.entities.bolt import Bolt  # noqa: E402
+from src.entities.robot import Robot  # noqa: E402
+from src.registry import EntityRegistry  # noqa: E402
+from src.spatial import SpatialHash, point_extent  # noqa: E402
+
+# (robots, bolts, orbs) — all but the first go past the normal caps
+CONFIGS = [(8, 6, 5), (16, 20, 30), (40, 60, 200), (40, 60, 1000)]
+TICKS = 300
+
+
+def _populate(robots, bolts, orbs, rng):
+    registry = EntityRegistry(rng)
+    for i in range(orbs):
+        orb = registry.spawn_orb((rng.randint(80, 720), rng.randint(40, 440)), 1)
+        orb.timer = rng.randint(0, 200)
+        orb.frame = orb.FLOAT_FRAMES[i % 4]
+    field_robots = [
+        Robot((rng.randint(80, 720), rng.randint(80, 460)), i % 2, rng) for i in range(robots)
+    ]
+    field_bolts = [
+        Bolt((rng.randint(80, 720), rng.randint(40, 440)), 1) for _ in range(bolts)
+    ]
+    return registry, field_robots, field_bolts
+
+
+def _drift(orbs, tick):
+    for orb in orbs:
+        orb.y = (orb.y - 1 - (tick + orb.serial) % 2) % 480
+
+
+def _linear(registry, robots, bolts):
+    orbs = registry.orbs
+    for bolt in bolts:
+        for orb in orbs:
+            if orb.collidepoint(bolt.pos):
+                break
+    for robot in robots:
+        for orb in orbs:
+            if robot.top <= orb.y < robot.bottom and abs(orb.x - robot.x) < 200:
+                break
+        for orb in orbs:
+            if orb.trapped_enemy_type is None and robot.collidepoint(orb.center):
+                break
+
+
+def _hashed(registry, robots, bolts):
+    points = registry.orb_points
+    rects = registry.orb_rects
+    points.refresh(registry.orbs)
+    rects.refresh(registry.orbs)
+    for bolt in bolts:
+        found = None
+        for orb in rects.at(*bolt.pos):
+            if orb.collidepoint(bolt.pos) and (found is None or orb.serial < found.serial):
+                found = orb
+    for robot in robots:
+        x = robot.x
+        found = None
+        for orbs in points.within(x - 200, robot.top, x + 200, robot.bottom):
+            for orb in orbs:
+                if robot.top <= orb.y < robot.bottom and abs(orb.x - x) < 200 \
+                        and (found is None or orb.serial < found.serial):
+                    found = orb
+        found = None
+        for orbs in points.within(robot.left, robot.top, robot.right, robot.bottom):
+            for orb in orbs:
+                if orb.trapped_enemy_type is None and robot.collidepoint(orb.center) \
+                        and (found is None or orb.serial < found.serial):
+                    found = orb
+
+
+def _indexed(registry, robots, bolts):
+    registry.refresh_indexes()
+    for bolt in bolts:
+        registry.orb_at(bolt.pos)
+    for robot in robots:
+        registry.orb_in_band(robot.top, robot.bottom, robot.x, 200)
+        registry.free_orb_centred_in(robot)
+
+
+def _time(query, config):
+    registry, robots, bolts = _populate(*config, random.Random(1))
+    registry.orb_points = SpatialHash(point_extent)
+    total = 0.0
+    for tick in range(TICKS):
+        _drift(registry.orbs, tick)
+        start = time.perf_counter()
+        query(registry, robots, bolts)
+        total += time.perf_counter() - start
+    return total / TICKS
+
+
+def main():
+    print(f"{'robots/bolts/orbs':<20}{'linear':>12}{'hashed':>12}{'banded':>12}"
+          f"{'vs linear':>11}{'vs hashed':>11}")
+    for config in CONFIGS:
+        linear = _time(_linear, config)
+        hashed = _time(_hashed, config)
+        banded = _time(_indexed, config)
+        label = "/".join(str(n) for n in config)
+        print(f"{label:<20}{linear * 1e6:>10.1f}µs{hashed * 1e6:>10.1f}µs"
+              f"{banded * 1e6:>10.1f}µs{linear / banded:>10.1f}x{hashed / banded:>10.1f}x")
+
+
+if __name__ == "__main__":
+    main()
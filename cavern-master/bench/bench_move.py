@@ -0,0 +1,73 @@
+"""
+bench_move.py — Per-call cost of CollideActor.move: swept vs. stepwise.
+
+Times the calls the game actually makes (bolt flight, gravity falls, robot
+walking, orb floating) against the pixel-by-pixel reference loop, on every
+level layout.  The two are timed in alternating runs and each reports its
+median, so a burst of machine noise can't favour either.  Run from the
+project root:
+
+    python bench/bench_move.py
+"""
+
+import os
+import statistics
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.entities.base import CollideActor  # noqa: E402
+from src.levelpack import builtin_pack  # noqa: E402
+from src.scripted import LevelOnly  # noqa: E402
+
+
+_ROW = [(x, 200) for x in range(80, 720, 37)]
+_FIELD = [(x, y) for x in range(80, 720, 53) for y in range(0, 450, 41)]
+
+# (label, start positions, dx, dy, speed)
+CASES = [
+    ("bolt    (→, speed 7)", _ROW, 1, 0, 7),
+    ("bolt    (←, speed 7)", _ROW, -1, 0, 7),
+    ("gravity (↓, speed 10)", _FIELD, 0, 1, 10),
+    ("robot   (→, speed 3)", [(x, 350) for x in range(80, 720, 29)], 1, 0, 3),
+    ("robot   (←, speed 1)", [(x, 350) for x in range(80, 720, 29)], -1, 0, 1),
+    ("orb     (↑, speed 2)", _FIELD, 0, -1, 2),
+]
+
+
+def _runner(method, levels, starts, dx, dy, speed):
+    actor = CollideActor((0, 0))
+    move = getattr(actor, method)
+
+    def run():
+        for level in levels:
+            for pos in starts:
+                actor.pos = pos
+                move(level, dx, dy, speed)
+    return run
+
+
+def _times_per_call(levels, starts, dx, dy, speed, repeat=15) -> tuple:
+    """Median seconds per call of (_move_stepwise, move)."""
+    runs = [_runner(method, levels, starts, dx, dy, speed)
+            for method in ("_move_stepwise", "move")]
+    calls = len(levels) * len(starts)
+    number = max(1, 20000 // calls)
+    samples = ([], [])
+    for _ in range(repeat):
+        for run, times in zip(runs, samples):
+            times.append(timeit.timeit(run, number=number))
+    return tuple(statistics.median(times) / (number * calls) for times in samples)
+
+
+def main():
+    levels = [LevelOnly(level_map) for level_map in builtin_pack()]
+    print(f"{'case':<24}{'stepwise':>12}{'swept':>12}{'speed-up':>10}")
+    for label, starts, dx, dy, speed in CASES:
+        old, new = _times_per_call(levels, starts, dx, dy, speed)
+        print(f"{label:<24}{old * 1e6:>10.2f}µs{new * 1e6:>10.2f}µs{old / new:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,255 @@
+"""
+bench_stress.py — Worst-case scenarios, timed and compared against a baseline.
+
+Each scenario builds a deterministic heavy Game state and keeps it heavy
+while it runs, then times Game.update and Game.draw separately on SDL's
+dummy video driver:
+
+    robots_level_N   eight robots on layout N, replaced as they are caught
+    trapped_orbs     five floating orbs with trapped robots, replaced as
+                     they pop (so fruit keeps dropping)
+    bolt_storm       eight robots with fire_probability() forced to 1
+    orb_swarm        eight robots among SWARM_ORBS free orbs, with the
+                     player's orb cap (Game.max_orbs) raised to match;
+                     orbs are replaced as robots are caught in them
+    level_100        level 100 difficulty with its natural spawning
+    menu_attract     the menu screen's playerless demo game and title
+
+A scripted player runs through every game scenario and never runs out of
+lives.  Run from the project root:
+
+    python bench/bench_stress.py                          # print results
+    python bench/bench_stress.py --save baseline.json     # record a baseline
+    python bench/bench_stress.py --compare baseline.json  # flag regressions
+
+--compare exits with status 1 if any scenario's p50 update or draw time is
+more than --tolerance (default 25%) slower than the baseline.
+bench/baselines/stress.json is a reference run.  Record a new one on the
+machine you compare on.
+"""
+
+import argparse
+import gc
+import json
+import os
+import platform
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame  # noqa: E402
+import pgzero.loaders  # noqa: E402
+from pgzero.screen import Screen  # noqa: E402
+
+from src.constants import HEIGHT, LEVELS, WIDTH  # noqa: E402
+from src.entities.player import Player  # noqa: E402
+from src.entities.robot import Robot  # noqa: E402
+from src.game import Game  # noqa: E402
+from src.input import InputState  # noqa: E402
+from src.screens.menu import MenuScreen  # noqa: E402
+from src.scripted import scripted_inputs  # noqa: E402
+
+FRAMES = 1500
+MAX_ROBOTS = 8
+MAX_ORBS = 5
+SWARM_ORBS = 60
+
+
+# ----------------------------------------------------------------------
+# Scenario setup.  Each returns (update, draw) callables for one frame.
+# ----------------------------------------------------------------------
+
+def _game_on_level(level: int) -> Game:
+    game = Game(Player(), seed=level + 1)
+    game.level = level - 1
+    game.next_level()
+    return game
+
+
+def _top_up_robots(game) -> None:
+    rng = game.rng
+    while len(game.enemies) < MAX_ROBOTS:
+        robot_type = len(game.enemies) % 2
+        pos = (game.get_robot_spawn_x(), rng.randint(-30, 300))
+        game.entities.add_enemy(Robot(pos, robot_type, rng))
+
+
+def _top_up_trapped_orbs(game) -> None:
+    rng = game.rng
+    while len(game.orbs) < MAX_ORBS:
+        orb = game.entities.spawn_orb((rng.randint(80, 720), rng.randint(100, 420)), 1)
+        orb.floating = True
+        orb.trapped_enemy_type = len(game.orbs) % 2
+        orb.timer = rng.randint(10, 200)
+
+
+def _top_up_swarm(game) -> None:
+    _top_up_robots(game)
+    rng = game.rng
+    while len(game.orbs) < SWARM_ORBS:
+        orb = game.entities.spawn_orb((rng.randint(80, 720), rng.randint(60, 440)), 1)
+        orb.floating = True
+        orb.timer = rng.randint(10, 200)
+
+
+def _play(game, before_update=None):
+    inputs = scripted_inputs(game.level)
+
+    def update():
+        game.pending_enemies[:] = game.pending_enemies or [Robot.TYPE_NORMAL]
+        game.player.lives = max(game.player.lives, 2)
+        if before_update:
+            before_update(game)
+        game.update(next(inputs))
+
+    return update, game.draw
+
+
+def robots_on_level(level: int):
+    return _play(_game_on_level(level), _top_up_robots)
+
+
+def trapped_orbs():
+    return _play(_game_on_level(1), _top_up_trapped_orbs)
+
+
+def bolt_storm():
+    game = _game_on_level(2)
+    game.fire_probability = lambda: 1.0
+    return _play(game, _top_up_robots)
+
+
+def orb_swarm():
+    game = _game_on_level(0)
+    game.max_orbs = SWARM_ORBS
+    return _play(game, _top_up_swarm)
+
+
+def level_100():
+    return _play(_game_on_level(100))
+
+
+def menu_attract():
+    menu = MenuScreen(Game(seed=0))
+    idle = InputState()
+    return (lambda: menu.update(idle, None)), menu.draw
+
+
+SCENARIOS = {f"robots_level_{n}": (lambda n=n: robots_on_level(n)) for n in range(len(LEVELS))}
+SCENARIOS.update(
+    trapped_orbs=trapped_orbs,
+    bolt_storm=bolt_storm,
+    orb_swarm=orb_swarm,
+    level_100=level_100,
+    menu_attract=menu_attract,
+)
+
+
+# ----------------------------------------------------------------------
+# Measurement
+# ----------------------------------------------------------------------
+
+def _stats(times: list) -> dict:
+    times = sorted(times)
+    return {
+        "mean_ms": round(sum(times) / len(times) * 1e3, 4),
+        "p50_ms": round(times[len(times) // 2] * 1e3, 4),
+        "p99_ms": round(times[int(len(times) * 0.99)] * 1e3, 4),
+    }
+
+
+def _run_once(setup, screen, frames: int) -> dict:
+    update, draw = setup()
+    gc.collect()
+    draw(screen)   # warm the image and level-layer caches
+    update_times = []
+    draw_times = []
+    clock = time.perf_counter
+    for _ in range(frames):
+        start = clock()
+        update()
+        middle = clock()
+        draw(screen)
+        end = clock()
+        update_times.append(middle - start)
+        draw_times.append(end - middle)
+    return {"update": _stats(update_times), "draw": _stats(draw_times)}
+
+
+def run_scenario(setup, screen, frames: int, repeats: int) -> dict:
+    """Best (lowest) of each statistic over *repeats* fresh runs, which
+    filters out most of the noise from other processes."""
+    runs = [_run_once(setup, screen, frames) for _ in range(repeats)]
+    return {
+        part: {stat: min(run[part][stat] for run in runs) for stat in runs[0][part]}
+        for part in ("update", "draw")
+    }
+
+
+def compare(results: dict, baseline: dict, tolerance: float) -> bool:
+    """Print each scenario against *baseline*; True if nothing regressed."""
+    ok = True
+    print(f"\n{'vs baseline (p50)':<20}{'update':>10}{'draw':>10}")
+    for name, result in results.items():
+        old = baseline["scenarios"].get(name)
+        if old is None:
+            print(f"{name:<20}{'new':>10}")
+            continue
+        cells = []
+        for part in ("update", "draw"):
+            ratio = result[part]["p50_ms"] / max(old[part]["p50_ms"], 1e-6)
+            flag = "!" if ratio > 1 + tolerance else " "
+            ok = ok and flag == " "
+            cells.append(f"{(ratio - 1) * 100:+8.1f}%{flag}")
+        print(f"{name:<20}" + "".join(cells))
+    return ok
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--frames", type=int, default=FRAMES)
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--only", help="run only scenarios whose name contains this")
+    parser.add_argument("--save", metavar="PATH", help="write results as a baseline")
+    parser.add_argument("--compare", metavar="PATH", help="compare with a baseline")
+    parser.add_argument("--tolerance", type=float, default=0.25)
+    args = parser.parse_args()
+
+    pygame.init()
+    screen = Screen(pygame.display.set_mode((WIDTH, HEIGHT)))
+    pgzero.loaders.set_root(ROOT)
+
+    results = {}
+    print(f"{'scenario':<20}{'update p50':>11}{'p99':>8}{'draw p50':>10}{'p99':>8}  (ms)")
+    for name, setup in SCENARIOS.items():
+        if args.only and args.only not in name:
+            continue
+        result = results[name] = run_scenario(setup, screen, args.frames, args.repeats)
+        update, draw = result["update"], result["draw"]
+        print(f"{name:<20}{update['p50_ms']:>11.3f}{update['p99_ms']:>8.3f}"
+              f"{draw['p50_ms']:>10.3f}{draw['p99_ms']:>8.3f}")
+
+    if args.save:
+        with open(args.save, "w") as f:
+            json.dump({
+                "frames": args.frames,
+                "repeats": args.repeats,
+                "python": platform.python_version(),
+                "machine": platform.machine(),
+                "scenarios": results,
+            }, f, indent=1)
+            f.write("\n")
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        if not compare(results, baseline, args.tolerance):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
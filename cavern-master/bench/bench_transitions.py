@@ -0,0 +1,76 @@
+"""
+bench_transitions.py — Screen transition cost and time to first frame.
+
+Cycles App through menu → play → game over → menu, ticking and drawing a
+few frames on each screen.  For every transition it reports:
+
+    switch   time spent in App.change_screen
+    first    time from change_screen to the end of the new screen's first
+             draw (App.last_transition)
+
+The first cycle is shown separately, because first visits are when images
+get loaded.  Run from the project root:
+
+    python bench/bench_transitions.py          # images preloaded, as main.py does
+    python bench/bench_transitions.py --cold   # images loaded on first use
+"""
+
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame  # noqa: E402
+import pgzero.loaders  # noqa: E402
+from pgzero.screen import Screen  # noqa: E402
+
+from src.app import App  # noqa: E402
+from src.constants import HEIGHT, WIDTH  # noqa: E402
+from src.input import InputState  # noqa: E402
+from src.render import preload_images  # noqa: E402
+
+CYCLES = 50
+FRAMES_PER_SCREEN = 5
+ROUTE = (("play", {}), ("game_over", {"score": 12340}), ("menu", {}))
+
+
+def main() -> None:
+    pygame.init()
+    screen = Screen(pygame.display.set_mode((WIDTH, HEIGHT)))
+    pgzero.loaders.set_root(ROOT)
+
+    if "--cold" not in sys.argv:
+        start = time.perf_counter()
+        preload_images()
+        print(f"preload_images: {(time.perf_counter() - start) * 1000:.1f} ms")
+
+    app = App(seed=1)
+    idle = InputState()
+    app.update(idle)
+    app.draw(screen)
+
+    results = {name: [] for name, _ in ROUTE}   # name → [(switch ms, first ms)]
+    for _ in range(CYCLES):
+        for name, kwargs in ROUTE:
+            start = time.perf_counter()
+            app.change_screen(name, **kwargs)
+            switch = (time.perf_counter() - start) * 1000
+            for _ in range(FRAMES_PER_SCREEN):
+                app.update(idle)
+                app.draw(screen)
+            results[name].append((switch, app.last_transition[1]))
+
+    print(f"{'to':<10}{'first cycle':>22}{'later cycles (p50)':>26}")
+    print(f"{'':<10}{'switch':>11}{'first':>11}{'switch':>13}{'first':>13}  (ms)")
+    for name, times in results.items():
+        later = sorted(times[1:])
+        switch = sorted(s for s, _ in later)[len(later) // 2]
+        first = sorted(f for _, f in later)[len(later) // 2]
+        print(f"{name:<10}{times[0][0]:>11.3f}{times[0][1]:>11.3f}{switch:>13.3f}{first:>13.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,41 @@
+"""
+bench_vecenv.py — Throughput of VecCavern per backend.
+
+Steps a batch of envs with random actions on each backend and reports env
+steps per second.  The process backend scales with physical cores, and the
+thread backend only helps where the GIL is released.  Run from the
+project root:
+
+    python bench/bench_vecenv.py [num_envs] [workers]
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np  # noqa: E402
+
+from src.vecenv import VecCavern  # noqa: E402
+
+STEPS = 500
+
+
+def main():
+    num_envs = int(sys.argv[1]) if len(sys.argv) > 1 else 64
+    workers = int(sys.argv[2]) if len(sys.argv) > 2 else os.cpu_count()
+    actions = np.random.default_rng(0).integers(0, 128, (STEPS, num_envs), np.uint8)
+    print(f"{num_envs} envs, {workers} workers, {os.cpu_count()} CPUs")
+    for backend in ("sync", "thread", "process"):
+        with VecCavern(num_envs, backend, workers=workers) as env:
+            env.reset()
+            start = time.perf_counter()
+            for batch in actions:
+                env.step(batch)
+            elapsed = time.perf_counter() - start
+        print(f"{backend:<8} {STEPS * num_envs / elapsed:>10.0f} env-steps/s")
+
+
+if __name__ == "__main__":
+    main()
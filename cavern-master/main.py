@@ -3,14 +3,19 @@ main.py — Pygame Zero entry point.
 
 This file is kept intentionally thin.  It:
   1. Declares the window constants Pygame Zero needs (WIDTH, HEIGHT, TITLE).
-  2. Wires up the pgzero ``sounds`` object into src.game so entities can play audio.
+  2. Boots the mixer and preloads the sound bank (src/audio.py).
   3. Creates the App singleton.
   4. Provides the global ``update()`` and ``draw()`` functions that Pygame Zero calls
-     each frame — each is a single-line delegate to the App.
+     each frame.  Both go through a FixedTimestep (src/timestep.py), which runs
+     App.update at 60 ticks a second whatever the frame rate.  Each tick's input
+     is optionally recorded or taken from a replay (see src/replay.py).
 
 No game logic lives here.
 """
 
+import atexit
+import os
+import random
 import sys
 import pygame
 import pgzero
@@ -40,43 +45,120 @@ WIDTH = 800
 HEIGHT = 480
 TITLE = "Cavern"
 
+# Dirty-rect rendering for the play screen (set CAVERN_DIRTY_RECTS=1)
+DIRTY_RECTS = os.environ.get("CAVERN_DIRTY_RECTS") == "1"
+
+# Fixed seed for every play session (set CAVERN_SEED=<int>); random if unset
+SEED = int(os.environ["CAVERN_SEED"]) if os.environ.get("CAVERN_SEED") else None
+
+# Frame profiler (CAVERN_PROFILE=<path>.json or .csv, written on exit;
+# CAVERN_PROFILE_OVERLAY=1 also shows the figures on the play screen)
+PROFILE_PATH = os.environ.get("CAVERN_PROFILE")
+PROFILE_OVERLAY = os.environ.get("CAVERN_PROFILE_OVERLAY") == "1"
+
+# Level pack to play instead of the built-in levels (CAVERN_LEVELS=<path>,
+# see src/levelpack.py)
+LEVELS_PATH = os.environ.get("CAVERN_LEVELS")
+
+# Smooth rendering between ticks (CAVERN_INTERPOLATE=1) and fast-forward
+# (CAVERN_TURBO=<ticks per drawn frame>)
+INTERPOLATE = os.environ.get("CAVERN_INTERPOLATE") == "1"
+TURBO = int(os.environ.get("CAVERN_TURBO") or 0)
+
+# Input recording (CAVERN_RECORD=<path>) and replay (CAVERN_REPLAY=<path>)
+RECORD_PATH = os.environ.get("CAVERN_RECORD")
+REPLAY_PATH = os.environ.get("CAVERN_REPLAY")
+
+# Two-player co-op against another copy of the game
+# (CAVERN_NETPLAY=<player 1 or 2>:<port>:<peer host>:<peer port>, see src/netplay.py)
+NETPLAY = os.environ.get("CAVERN_NETPLAY")
+
 # ---------------------------------------------------------------------------
 # Boot the sound system
 # ---------------------------------------------------------------------------
+import src.audio as _audio
+
 try:
     pygame.mixer.quit()
     pygame.mixer.init(44100, -16, 2, 1024)
     music.play("theme")
     music.set_volume(0.3)
+    # Every sound variant is loaded now, so gameplay never touches the disk
+    _audio.bank = _audio.SoundBank(
+        os.path.join(os.path.dirname(os.path.abspath(__file__)), "sounds"))
 except Exception:
-    pass  # silently ignore audio failures
-
-# ---------------------------------------------------------------------------
-# Inject the pgzero sounds object into src.game so entities can play audio
-# ---------------------------------------------------------------------------
-import src.constants as _constants
-_constants.set_sounds(sounds)   # ``sounds`` is injected by pgzrun into this namespace
+    pass  # silently ignore audio failures; the game runs without sound
 
 # ---------------------------------------------------------------------------
 # Create application and input handler
 # ---------------------------------------------------------------------------
+import src.profiler as _profiler
 from src.app import App
-from src.input import InputHandler
-
-app = App()
+from src.input import InputHandler, InputState
+from src.levelpack import load_pack
+from src.netplay import UdpTransport
+from src.render import preload_images
+from src.replay import InputRecorder, Recording
+from src.timestep import FixedTimestep
+
+_replay_inputs = None
+_recorder = None
+if REPLAY_PATH:
+    _recording = Recording.load(REPLAY_PATH)
+    SEED = _recording.seed
+    _replay_inputs = iter(_recording)
+elif RECORD_PATH:
+    if SEED is None:
+        SEED = random.getrandbits(32)   # a recording needs a known seed
+    _recorder = InputRecorder(SEED)
+    atexit.register(lambda: _recorder.save(RECORD_PATH))
+
+_netplay = None
+if NETPLAY:
+    if RECORD_PATH or REPLAY_PATH:
+        print("CAVERN_NETPLAY can't be combined with CAVERN_RECORD or CAVERN_REPLAY")
+        sys.exit()
+    _player, _port, _peer_host, _peer_port = NETPLAY.split(":")
+    _netplay = (int(_player) - 1,
+                UdpTransport(int(_port), int(_peer_port), _peer_host, bind=""))
+    if SEED is None:
+        SEED = 0   # both peers must play the same seeds
+
+if PROFILE_PATH or PROFILE_OVERLAY:
+    _profile = _profiler.enable(overlay=PROFILE_OVERLAY)
+    if PROFILE_PATH:
+        atexit.register(lambda: _profile.dump(PROFILE_PATH))
+
+_levels = load_pack(LEVELS_PATH) if LEVELS_PATH else None
+
+app = App(dirty_rects=DIRTY_RECTS, seed=SEED, levels=_levels, netplay=_netplay)
+preload_images()   # at startup, rather than on the first visit to each screen
 _input_handler = InputHandler()
 
+
+def _read_input():
+    """The InputState for one tick."""
+    if _replay_inputs is not None:
+        # Once the recording runs out the game carries on with no input
+        return next(_replay_inputs, None) or InputState()
+    input_state = _input_handler.snapshot(keyboard)
+    if _recorder:
+        _recorder.record(input_state)
+    return input_state
+
+
+_driver = FixedTimestep(app, _read_input, interpolate=INTERPOLATE, turbo=TURBO)
+
 # ---------------------------------------------------------------------------
 # Pygame Zero callbacks — thin delegates only
 # ---------------------------------------------------------------------------
 
-def update():
-    input_state = _input_handler.snapshot(keyboard)
-    app.update(input_state)
+def update(dt):
+    _driver.update(dt)
 
 
 def draw():
-    app.draw(screen)
+    _driver.draw(screen)
 
 
 # ---------------------------------------------------------------------------
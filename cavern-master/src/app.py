@@ -3,8 +3,26 @@ app.py — App and screen management (State pattern).
 
 App owns the currently active screen and is the single point of contact for
 screen transitions.  Global update() and draw() in main.py delegate to it.
+
+The menu and game-over screens are built once and share one attract-mode
+Game that keeps running for the whole session, so switching to either is
+just an assignment.  Every session needs a new PlayScreen and Game, so the
+next one is built on the way into the menu or game over, while nothing is
+being played, and switching to "play" swaps it in.  With a netplay peer,
+every session is a co-op match against it.  ``last_transition`` records
+how long the latest switch took to reach its first drawn frame.
+
+Pygame Zero ends every frame with pygame.display.flip(), which pushes the
+whole window.  While a dirty-rect play screen is showing, App redirects
+that call to present(), which pushes only the rects of the frame just
+drawn.  The redirect is removed as soon as the play screen is left.
 """
 
+from time import perf_counter_ns
+
+import src.audio as _audio
+import src.profiler as _profiler
+from src.game import Game
 from src.screens.menu import MenuScreen
 from src.screens.play import PlayScreen
 from src.screens.game_over import GameOverScreen
@@ -13,20 +31,85 @@ from src.screens.game_over import GameOverScreen
 class App:
     """Top-level application object.  Owns the current screen."""
 
-    def __init__(self):
-        self._screen = MenuScreen()
+    def __init__(self, dirty_rects=False, seed=None, levels=None, netplay=None):
+        # Forwarded to PlayScreen; a fixed seed makes every session identical
+        self._dirty_rects = dirty_rects
+        self._seed = seed
+        self._levels = levels   # a LevelPack, or None for the built-in levels
+
+        # (local player index, transport) for co-op against a remote peer.
+        # Both sides number their matches alike and seed match n with
+        # seed + n, so they always agree.
+        if netplay is not None and seed is None:
+            raise ValueError("Netplay needs a seed shared by both peers")
+        self._netplay = netplay
+        self._matches = 0
+
+        attract = Game(levels=levels)
+        self._screens = {"menu": MenuScreen(attract), "game_over": GameOverScreen(attract)}
+        self._screen = self._screens["menu"]
+        self._next_play = self._play_screen()   # swapped in by change_screen("play")
+
+        # (screen name, ms from change_screen() to the end of its first draw)
+        self.last_transition = None
+        self._transition = None
+
+        self._rects = None   # what the latest draw() returned
+        self._flip = None    # pygame.display.flip, while redirected to present()
 
     # ------------------------------------------------------------------
     # Public API called by global update() / draw()
     # ------------------------------------------------------------------
 
+    @property
+    def game(self):
+        """The Game the active screen is running, played or in the background."""
+        return self._screen.game
+
     def update(self, input_state):
-        """Delegate per-frame logic to the active screen."""
-        self._screen.update(input_state, self)
+        """Delegate per-frame logic to the active screen, then play the
+        sounds it requested."""
+        prof = _profiler.active
+        if prof is None:
+            self._screen.update(input_state, self)
+        else:
+            start = perf_counter_ns()
+            self._screen.update(input_state, self)
+            prof.add("app.update", perf_counter_ns() - start)
+            prof.end_tick()
+        if _audio.bank is not None:
+            _audio.bank.flush()
 
     def draw(self, screen):
-        """Delegate rendering to the active screen."""
-        self._screen.draw(screen)
+        """Delegate rendering to the active screen.
+
+        Returns the list of changed rects when the screen renders in
+        dirty-rect mode, or None when the whole screen was redrawn.
+        """
+        prof = _profiler.active
+        if prof is None:
+            rects = self._screen.draw(screen)
+        else:
+            start = perf_counter_ns()
+            rects = self._screen.draw(screen)
+            prof.add("app.draw", perf_counter_ns() - start)
+            prof.end_frame()
+        if self._transition is not None:
+            name, start = self._transition
+            self.last_transition = (name, (perf_counter_ns() - start) / 1e6)
+            self._transition = None
+        self._rects = rects
+        return rects
+
+    def present(self) -> None:
+        """Push the frame just drawn to the window: only its changed rects,
+        or the whole window after a full redraw."""
+        import pygame
+
+        if self._rects is None:
+            (self._flip or pygame.display.flip)()
+        else:
+            pygame.display.update(self._rects)
 
     # ------------------------------------------------------------------
     # Screen transitions
@@ -36,13 +119,42 @@ class App:
         """Switch to the named screen.
 
         Accepted names: ``"menu"``, ``"play"``, ``"game_over"``.
-        Extra keyword arguments are forwarded to the screen constructor.
+        Extra keyword arguments are forwarded to the screen's enter().
         """
-        if name == "menu":
-            self._screen = MenuScreen()
-        elif name == "play":
-            self._screen = PlayScreen()
-        elif name == "game_over":
-            self._screen = GameOverScreen(**kwargs)
+        start = perf_counter_ns()
+        if name == "play":
+            screen = self._next_play or self._play_screen()
+            self._next_play = None
+        elif name in self._screens:
+            screen = self._screens[name]
+            if self._next_play is None:
+                self._next_play = self._play_screen()
         else:
-            raise ValueError(f"Unknown screen name: {name!r}")
\ No newline at end of file
+            raise ValueError(f"Unknown screen name: {name!r}")
+        screen.enter(**kwargs)
+        self._screen = screen
+        if self._dirty_rects:
+            self._redirect_flip(name == "play")
+        self._transition = (name, start)
+
+    def _redirect_flip(self, on: bool) -> None:
+        """Send Pygame Zero's end-of-frame pygame.display.flip() to present()
+        (*on*), or give it back."""
+        import pygame
+
+        if on and self._flip is None:
+            self._flip = pygame.display.flip
+            pygame.display.flip = self.present
+        elif not on and self._flip is not None:
+            pygame.display.flip = self._flip
+            self._flip = None
+
+    def _play_screen(self) -> PlayScreen:
+        if self._netplay is None:
+            return PlayScreen(dirty_rects=self._dirty_rects, seed=self._seed,
+                              levels=self._levels)
+        local_index, transport = self._netplay
+        match = self._matches
+        self._matches += 1
+        return PlayScreen(dirty_rects=self._dirty_rects, seed=self._seed + match,
+                          levels=self._levels, netplay=(local_index, transport, match))
@@ -0,0 +1,101 @@
+"""
+audio.py — Preloaded sound bank.
+
+Sounds are identified by the integer IDs below, so playing one is a list
+index, not a name lookup.  Game.play_sound(id) only records a request.
+App.update calls flush() once per tick, and flush() plays each requested
+sound once, however many times it was asked for that frame: eight robots
+firing together make one laser sound, not eight.
+
+Every variant on disk (laser0.ogg, laser1.ogg, ...) is loaded up front.
+Each sound owns VOICES reserved pygame.mixer channels.  A new play goes to
+a free one, or else takes over the one that started longest ago, so a
+burst of one sound can never hold more than VOICES channels or starve the
+others.
+
+``bank`` is None until main.py creates one, and it stays None in headless
+runs.  Then requests are ignored and nothing here touches pygame.
+"""
+
+import os
+import random
+
+# Sound IDs, in bank order
+SOUND_NAMES = (
+    "appear", "blow", "bonus", "die", "jump", "land", "laser", "level",
+    "life", "ouch", "over", "pop", "score", "trap", "vanish",
+)
+(
+    SOUND_APPEAR, SOUND_BLOW, SOUND_BONUS, SOUND_DIE, SOUND_JUMP, SOUND_LAND,
+    SOUND_LASER, SOUND_LEVEL, SOUND_LIFE, SOUND_OUCH, SOUND_OVER, SOUND_POP,
+    SOUND_SCORE, SOUND_TRAP, SOUND_VANISH,
+) = range(len(SOUND_NAMES))
+
+VOICES = 2          # reserved channels per sound
+FREE_CHANNELS = 8   # unreserved channels left for everything else
+
+bank = None   # the active SoundBank, or None when there is no audio
+
+
+class SoundBank:
+    """Every variant of every sound, plus a reserved channel pool."""
+
+    def __init__(self, directory: str, voices: int = VOICES):
+        import pygame
+
+        # variants[id] — the loaded Sounds name0, name1, ... (may be empty)
+        self.variants = []
+        for name in SOUND_NAMES:
+            sounds = []
+            while True:
+                path = os.path.join(directory, f"{name}{len(sounds)}.ogg")
+                if not os.path.exists(path):
+                    break
+                sounds.append(pygame.mixer.Sound(path))
+            self.variants.append(tuple(sounds))
+
+        # Channels [id * voices, (id + 1) * voices) belong to sound id and
+        # are reserved, so nothing else plays on them.  The rest stay free
+        # for sounds played outside the bank.
+        total = len(SOUND_NAMES) * voices
+        if pygame.mixer.get_num_channels() < total + FREE_CHANNELS:
+            pygame.mixer.set_num_channels(total + FREE_CHANNELS)
+        pygame.mixer.set_reserved(total)
+        self._channels = [
+            tuple(pygame.mixer.Channel(i * voices + v) for v in range(voices))
+            for i in range(len(SOUND_NAMES))
+        ]
+        self._next_voice = [0] * len(SOUND_NAMES)   # per sound, the oldest voice
+
+        self._rng = random.Random()   # picks variants; never the simulation's
+        self._pending = set()
+
+        # Statistics
+        self.requested = 0
+        self.played = 0
+
+    def request(self, sound: int) -> None:
+        """Ask for *sound* to play at the end of this frame."""
+        self.requested += 1
+        self._pending.add(sound)
+
+    def flush(self) -> None:
+        """Play each sound requested since the last flush, once."""
+        pending = self._pending
+        if not pending:
+            return
+        for sound in pending:
+            variants = self.variants[sound]
+            if not variants:
+                continue
+            voices = self._channels[sound]
+            # A free voice if there is one, else cut off the oldest
+            voice = self._next_voice[sound]
+            for i, channel in enumerate(voices):
+                if not channel.get_busy():
+                    voice = i
+                    break
+            voices[voice].play(variants[self._rng.randrange(len(variants))])
+            self._next_voice[sound] = (voice + 1) % len(voices)
+            self.played += 1
+        pending.clear()
@@ -1,13 +1,12 @@
 """
-constants.py — Shared constants, level data, helper functions, and the
-               module-level singletons (current_game, _sounds).
+constants.py — Shared constants, level data and helper functions.
 
 Every other module imports from here rather than from game.py, which
 keeps the dependency graph acyclic:
 
     constants  ←  base  ←  pop / bolt / orb / fruit / player / robot
-                                         ↑
-                                        game
+        ↑                                ↑
+      level  ←─────────────────────────  game
 """
 
 # ---------------------------------------------------------------------------
@@ -35,6 +34,10 @@ ANCHOR_CENTRE_BOTTOM = ("center", "bottom")
 ROBOT_TYPE_NORMAL = 0
 ROBOT_TYPE_AGGRESSIVE = 1
 
+# Orbs the player may have out at once.  This is Game.max_orbs's default;
+# mods and benchmarks may raise it per game.
+MAX_ORBS = 5
+
 # ---------------------------------------------------------------------------
 # Level layouts
 # ---------------------------------------------------------------------------
@@ -73,23 +76,6 @@ LEVELS = [
     ],
 ]
 
-# ---------------------------------------------------------------------------
-# Module-level singletons — set by Game.__init__ and main.py respectively
-# ---------------------------------------------------------------------------
-current_game = None   # type: "Game | None"
-_sounds = None        # pgzero sounds object injected at startup
-
-
-def set_current_game(g) -> None:
-    global current_game
-    current_game = g
-
-
-def set_sounds(sounds_obj) -> None:
-    global _sounds
-    _sounds = sounds_obj
-
-
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
@@ -98,17 +84,3 @@ def sign(x: float) -> int:
     """Return -1 for negative numbers, +1 for zero or positive."""
     return -1 if x < 0 else 1
 
-
-def block(x: int, y: int) -> bool:
-    """Return True if there is a level grid block at pixel position (x, y)."""
-    grid_x = (x - LEVEL_X_OFFSET) // GRID_BLOCK_SIZE
-    grid_y = y // GRID_BLOCK_SIZE
-    if 0 < grid_y < NUM_ROWS:
-        row = current_game.grid[grid_y]
-        return (
-            grid_x >= 0
-            and grid_x < NUM_COLUMNS
-            and len(row) > 0
-            and row[grid_x] != " "
-        )
-    return False
\ No newline at end of file
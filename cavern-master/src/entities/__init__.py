@@ -5,7 +5,7 @@ Usage:
     from src.entities import Player, Robot, Orb, Bolt, Fruit, Pop
 """
 
-from src.entities.base import CollideActor, GravityActor
+from src.entities.base import Body, CollideActor, GravityActor
 from src.entities.bolt import Bolt
 from src.entities.fruit import Fruit
 from src.entities.orb import Orb
@@ -14,6 +14,7 @@ from src.entities.pop import Pop
 from src.entities.robot import Robot
 
 __all__ = [
+    "Body",
     "CollideActor",
     "GravityActor",
     "Pop",
@@ -1,37 +1,210 @@
 """
-entities/base.py — Abstract base actor classes.
+entities/base.py — Base entity classes.
 
-CollideActor  — Actor with block/wall collision.
+Body          — Plain position/rect object with pgzero Actor geometry.
+CollideActor  — Body with block/wall collision.
 GravityActor  — CollideActor that falls under gravity.
-"""
 
-from pgzero.actor import Actor
+None of these classes touch pygame or pgzero: the simulation only needs
+positions and frame sizes.  Drawing goes through src/render.py, which maps
+a Body onto the screen when one is present.
+"""
 
 from src.constants import (
     ANCHOR_CENTRE,
     ANCHOR_CENTRE_BOTTOM,
     GRID_BLOCK_SIZE,
     HEIGHT,
-    block,
     sign,
 )
+from src.level import COLUMN_INDEX, ROW_INDEX
+from src.sprites import frame
+
+# Horizontal limits of the playable area (pixels an actor's x may occupy)
+LEVEL_MIN_X = 70
+LEVEL_MAX_X = 730
+
+# Anchor names → fraction of the frame size (same table as pgzero.actor)
+_ANCHOR_FRACTIONS = {
+    "left": 0.0, "top": 0.0,
+    "center": 0.5, "middle": 0.5,
+    "right": 1.0, "bottom": 1.0,
+}
+
 
+class Body:
+    """A positioned rectangle that behaves like a pgzero Actor for gameplay.
 
-class CollideActor(Actor):
-    """An Actor that can move with block and level-edge collision detection."""
+    ``x``/``y`` is the anchor point.  Assigning ``frame`` (a sprites.Frame)
+    resizes the rect from the frame's dimensions, keeping the anchor point
+    fixed — exactly what Actor does, minus the surface load.  ``image`` is
+    the frame's name, settable for convenience off the hot path.
+    """
+
+    BLANK = frame("blank")
+
+    def __init__(self, pos, anchor=ANCHOR_CENTRE):
+        self._anchor_fx = _ANCHOR_FRACTIONS[anchor[0]]
+        self._anchor_fy = _ANCHOR_FRACTIONS[anchor[1]]
+        self.x, self.y = pos
+        self.frame = Body.BLANK
+
+    @property
+    def frame(self):
+        return self._frame
+
+    @frame.setter
+    def frame(self, f) -> None:
+        self._frame = f
+        self.width = f.width
+        self.height = f.height
+        self._anchor_x = f.width * self._anchor_fx
+        self._anchor_y = f.height * self._anchor_fy
+
+    @property
+    def image(self) -> str:
+        return self._frame.name
+
+    @image.setter
+    def image(self, name: str) -> None:
+        self.frame = frame(name)
+
+    @property
+    def pos(self) -> tuple:
+        return self.x, self.y
+
+    @pos.setter
+    def pos(self, pos) -> None:
+        self.x, self.y = pos
+
+    @property
+    def left(self) -> float:
+        return self.x - self._anchor_x
+
+    @property
+    def top(self) -> float:
+        return self.y - self._anchor_y
+
+    @property
+    def right(self) -> float:
+        return self.x - self._anchor_x + self.width
+
+    @property
+    def bottom(self) -> float:
+        return self.y - self._anchor_y + self.height
+
+    @property
+    def topleft(self) -> tuple:
+        return self.x - self._anchor_x, self.y - self._anchor_y
+
+    @property
+    def center(self) -> tuple:
+        return (
+            self.x - self._anchor_x + self.width / 2,
+            self.y - self._anchor_y + self.height / 2,
+        )
+
+    def collidepoint(self, point) -> bool:
+        """Return True if *point* lies inside the rect (right/bottom exclusive)."""
+        px, py = point
+        left = self.x - self._anchor_x
+        top = self.y - self._anchor_y
+        return left <= px < left + self.width and top <= py < top + self.height
+
+
+class CollideActor(Body):
+    """A Body that can move with block and level-edge collision detection."""
 
     def __init__(self, pos, anchor=ANCHOR_CENTRE):
-        super().__init__("blank", pos, anchor)
+        super().__init__(pos, anchor)
 
-    def move(self, dx: int, dy: int, speed: int) -> bool:
-        """Move the actor *speed* pixels in direction (dx, dy), one pixel at a
-        time.  Returns True if movement was stopped by a block or level edge."""
+    def move(self, game, dx: int, dy: int, speed: int) -> bool:
+        """Move the actor up to *speed* pixels in direction (dx, dy),
+        colliding with *game*'s level.  Returns True if movement was stopped
+        by a block or level edge.
+
+        The move is swept rather than stepped: only grid boundaries along
+        the path can stop the actor, so the level's collision map is read
+        once per grid cell crossed.  Stopping positions match
+        _move_stepwise() exactly.
+        """
+        if dx != 0 and dy != 0 or dx == dy:
+            return self._move_stepwise(game, dx, dy, speed)
+        if speed <= 0:
+            return False
+
+        x, y = int(self.x), int(self.y)
+        if not LEVEL_MIN_X <= x + dx <= LEVEL_MAX_X:
+            return True  # the very first step leaves the level
+
+        cells = game.level_map.cells
+        stop = None  # first coordinate along the axis the actor may not enter
+
+        if dy == 0:
+            row = ROW_INDEX[y]
+            target = x + dx * speed
+            if dx > 0:
+                # Blocks are entered on pixels where x % GRID_BLOCK_SIZE == 0
+                end = target if target < LEVEL_MAX_X else LEVEL_MAX_X
+                bx = -(-(x + 1) // GRID_BLOCK_SIZE) * GRID_BLOCK_SIZE
+                while bx <= end:
+                    if cells[row + COLUMN_INDEX[bx]]:
+                        stop = bx
+                        break
+                    bx += GRID_BLOCK_SIZE
+                if stop is None and target > LEVEL_MAX_X:
+                    stop = LEVEL_MAX_X + 1
+            else:
+                # ...and from the right on pixels where x % size == size - 1
+                end = target if target > LEVEL_MIN_X else LEVEL_MIN_X
+                bx = x - 1 - x % GRID_BLOCK_SIZE
+                while bx >= end:
+                    if cells[row + COLUMN_INDEX[bx]]:
+                        stop = bx
+                        break
+                    bx -= GRID_BLOCK_SIZE
+                if stop is None and target < LEVEL_MIN_X:
+                    stop = LEVEL_MIN_X - 1
+            # Coordinates are assigned directly: going through the pos
+            # setter costs as much as a short sweep
+            if stop is None:
+                self.x = target
+                self.y = y
+                return False
+            if stop != x + dx:
+                self.x = stop - dx
+                self.y = y
+            return True
+
+        target = y + dy * speed
+        if dy > 0:
+            column = COLUMN_INDEX[x]
+            # Only downward movement collides: blocks are landed on at
+            # pixels where y % GRID_BLOCK_SIZE == 0
+            by = -(-(y + 1) // GRID_BLOCK_SIZE) * GRID_BLOCK_SIZE
+            while by <= target:
+                if cells[ROW_INDEX[by] + column]:
+                    stop = by
+                    break
+                by += GRID_BLOCK_SIZE
+        if stop is None:
+            self.x = x
+            self.y = target
+            return False
+        if stop != y + dy:
+            self.x = x
+            self.y = stop - dy
+        return True
+
+    def _move_stepwise(self, game, dx: int, dy: int, speed: int) -> bool:
+        """Reference implementation of move(): one pixel per step."""
+        level_map = game.level_map
         new_x, new_y = int(self.x), int(self.y)
 
         for _ in range(speed):
             new_x, new_y = new_x + dx, new_y + dy
 
-            if new_x < 70 or new_x > 730:
+            if new_x < LEVEL_MIN_X or new_x > LEVEL_MAX_X:
                 return True  # hit level edge
 
             if (
@@ -40,7 +213,7 @@ class CollideActor(Actor):
                     or dx > 0 and new_x % GRID_BLOCK_SIZE == 0
                     or dx < 0 and new_x % GRID_BLOCK_SIZE == GRID_BLOCK_SIZE - 1
                 )
-                and block(new_x, new_y)
+                and level_map.block(new_x, new_y)
             ):
                 return True  # hit a block
 
@@ -59,7 +232,7 @@ class GravityActor(CollideActor):
         self.vel_y = 0
         self.landed = False
 
-    def update(self, detect: bool = True) -> None:
+    def update(self, game, detect: bool = True) -> None:
         """Apply gravity and optional collision detection.
 
         Pass ``detect=False`` when the actor should fall through the level
@@ -68,7 +241,7 @@ class GravityActor(CollideActor):
         self.vel_y = min(self.vel_y + 1, GravityActor.MAX_FALL_SPEED)
 
         if detect:
-            if self.move(0, sign(self.vel_y), abs(self.vel_y)):
+            if self.move(game, 0, sign(self.vel_y), abs(self.vel_y)):
                 self.vel_y = 0
                 self.landed = True
 
@@ -76,4 +249,4 @@ class GravityActor(CollideActor):
                 # Wrap around to the top of the screen
                 self.y = 1
         else:
-            self.y += self.vel_y
\ No newline at end of file
+            self.y += self.vel_y
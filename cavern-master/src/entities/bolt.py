@@ -5,8 +5,8 @@ Bolts are fired horizontally by Robots and destroy themselves on
 hitting a block, an Orb, or the Player.
 """
 
-import src.constants as _c
 from src.entities.base import CollideActor
+from src.sprites import frame
 
 
 class Bolt(CollideActor):
@@ -14,23 +14,28 @@ class Bolt(CollideActor):
 
     SPEED = 7
 
+    # FRAMES[facing right][animation frame]
+    FRAMES = [[frame("bolt%d%d" % (d, a)) for a in range(2)] for d in range(2)]
+
     def __init__(self, pos, dir_x: int):
         super().__init__(pos)
         self.direction_x = dir_x
         self.active = True
 
-    def update(self) -> None:
-        g = _c.current_game
-        if self.move(self.direction_x, 0, Bolt.SPEED):
+    def update(self, game) -> None:
+        if self.move(game, self.direction_x, 0, Bolt.SPEED):
             # Hit a block or level edge
             self.active = False
         else:
-            # Check collision with orbs and the player
-            for obj in g.orbs + [g.player]:
-                if obj and obj.hit_test(self):
-                    self.active = False
-                    break
-
-        direction_idx = "1" if self.direction_x > 0 else "0"
-        anim_frame = str((g.timer // 4) % 2)
-        self.image = "bolt" + direction_idx + anim_frame
\ No newline at end of file
+            # Check collision with orbs and the players
+            orb = game.entities.orb_at(self.pos)
+            if orb:
+                orb.hit_test(self, game)
+                self.active = False
+            else:
+                for player in game.live_players:
+                    if player.hit_test(self, game):
+                        self.active = False
+                        break
+
+        self.frame = Bolt.FRAMES[self.direction_x > 0][(game.timer // 4) % 2]
\ No newline at end of file
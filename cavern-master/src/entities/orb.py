@@ -6,11 +6,9 @@ travel, and can trap Robots.  They pop when their timer expires or
 when they are hit by a Bolt.
 """
 
-from random import randint
-
-import src.constants as _c
+from src.audio import SOUND_POP
 from src.entities.base import CollideActor
-from src.entities.pop import Pop
+from src.sprites import frame
 
 
 class Orb(CollideActor):
@@ -18,6 +16,11 @@ class Orb(CollideActor):
 
     MAX_TIMER = 250
 
+    GROW_FRAMES = [frame("orb%d" % i) for i in range(3)]       # timer // 3
+    FLOAT_FRAMES = [frame("orb%d" % i) for i in range(3, 7)]   # (timer - 9) // 8 % 4
+    # TRAP_FRAMES[trapped enemy type][timer // 4 % 8]
+    TRAP_FRAMES = [[frame("trap%d%d" % (t, i)) for i in range(8)] for t in range(2)]
+
     def __init__(self, pos, dir_x: int):
         super().__init__(pos)
         self.direction_x = dir_x
@@ -26,46 +29,35 @@ class Orb(CollideActor):
         self.timer = -1
         self.blown_frames = 6  # frames of horizontal travel before floating
 
-    def hit_test(self, bolt) -> bool:
+    def hit_test(self, bolt, game) -> bool:
         """Called by Bolt.update — sets the orb close to expiry on hit."""
         collided = self.collidepoint(bolt.pos)
         if collided:
             self.timer = Orb.MAX_TIMER - 1
         return collided
 
-    def update(self) -> None:
-        # Import here to avoid a module-level circular reference
-        # (Orb → Fruit → [nothing that imports Orb], but keeping the import
-        # lazy makes the dependency obvious).
-        from src.entities.fruit import Fruit
-
-        g = _c.current_game
+    def update(self, game) -> None:
         self.timer += 1
 
         if self.floating:
-            self.move(0, -1, randint(1, 2))
+            self.move(game, 0, -1, game.rng.randint(1, 2))
         else:
-            if self.move(self.direction_x, 0, 4):
+            if self.move(game, self.direction_x, 0, 4):
                 self.floating = True
 
         if self.timer == self.blown_frames:
             self.floating = True
         elif self.timer >= Orb.MAX_TIMER or self.y <= -40:
             # Pop and optionally release a Fruit
-            g.pops.append(Pop(self.pos, 1))
+            game.entities.spawn_pop(self.pos, 1)
             if self.trapped_enemy_type is not None:
-                g.fruits.append(Fruit(self.pos, self.trapped_enemy_type))
-            g.play_sound("pop", 4)
+                game.entities.spawn_fruit(self.pos, self.trapped_enemy_type)
+            game.play_sound(SOUND_POP)
 
         # Sprite selection
         if self.timer < 9:
-            self.image = "orb" + str(self.timer // 3)
+            self.frame = Orb.GROW_FRAMES[self.timer // 3]
+        elif self.trapped_enemy_type is not None:
+            self.frame = Orb.TRAP_FRAMES[self.trapped_enemy_type][(self.timer // 4) % 8]
         else:
-            if self.trapped_enemy_type is not None:
-                self.image = (
-                    "trap"
-                    + str(self.trapped_enemy_type)
-                    + str((self.timer // 4) % 8)
-                )
-            else:
-                self.image = "orb" + str(3 + (((self.timer - 9) // 8) % 4))
\ No newline at end of file
+            self.frame = Orb.FLOAT_FRAMES[((self.timer - 9) // 8) % 4]
\ No newline at end of file
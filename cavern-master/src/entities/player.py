@@ -5,23 +5,31 @@ The Player is controlled via an InputState snapshot so it has no
 direct dependency on the keyboard object.
 """
 
-import src.constants as _c
+from src.audio import SOUND_BLOW, SOUND_DIE, SOUND_JUMP, SOUND_OUCH
 from src.constants import HEIGHT, WIDTH
 from src.entities.base import GravityActor
-from src.entities.orb import Orb
+from src.sprites import frame
 
 
 class Player(GravityActor):
     """The player-controlled character."""
 
-    def __init__(self):
+    # Frame tables indexed by facing right (0/1) and/or animation frame
+    STILL_FRAME = frame("still")
+    RECOIL_FRAMES = [frame("recoil%d" % d) for d in range(2)]
+    BLOW_FRAMES = [frame("blow%d" % d) for d in range(2)]
+    FALL_FRAMES = [frame("fall%d" % a) for a in range(2)]
+    RUN_FRAMES = [[frame("run%d%d" % (d, a)) for a in range(4)] for d in range(2)]
+
+    def __init__(self, start_x: float = WIDTH / 2):
         super().__init__((0, 0))
+        self.start_x = start_x   # where each life and level starts
         self.lives = 2
         self.score = 0
 
     def reset(self) -> None:
         """Place the player at the starting position for a new life/level."""
-        self.pos = (WIDTH / 2, 100)
+        self.pos = (self.start_x, 100)
         self.vel_y = 0
         self.direction_x = 1
         self.fire_timer = 0
@@ -29,7 +37,7 @@ class Player(GravityActor):
         self.health = 3
         self.blowing_orb = None
 
-    def hit_test(self, other) -> bool:
+    def hit_test(self, other, game) -> bool:
         """Called by Bolt.update — returns True and applies damage if hit."""
         if self.collidepoint(other.pos) and self.hurt_timer < 0:
             self.hurt_timer = 200
@@ -38,21 +46,20 @@ class Player(GravityActor):
             self.landed = False
             self.direction_x = other.direction_x
             if self.health > 0:
-                _c.current_game.play_sound("ouch", 4)
+                game.play_sound(SOUND_OUCH)
             else:
-                _c.current_game.play_sound("die")
+                game.play_sound(SOUND_DIE)
             return True
         return False
 
-    def update(self, input_state) -> None:
+    def update(self, game, input_state) -> None:
         """Update player state from a pre-built InputState snapshot.
 
         No keyboard access happens here — all edge/level detection is done
         centrally in InputHandler before this method is called.
         """
-        g = _c.current_game
         # Collision detection is disabled when falling after death
-        super().update(self.health > 0)
+        super().update(game, self.health > 0)
 
         self.fire_timer -= 1
         self.hurt_timer -= 1
@@ -66,7 +73,7 @@ class Player(GravityActor):
         if self.hurt_timer > 100:
             # Recently hurt — recoil sideways or fall out of the level
             if self.health > 0:
-                self.move(self.direction_x, 0, 4)
+                self.move(game, self.direction_x, 0, 4)
             else:
                 if self.top >= HEIGHT * 1.5:
                     self.lives -= 1
@@ -81,22 +88,25 @@ class Player(GravityActor):
             if dx != 0:
                 self.direction_x = dx
                 if self.fire_timer < 10:
-                    self.move(dx, 0, 4)
+                    self.move(game, dx, 0, 4)
 
             # Fire orb on SPACE edge
-            if input_state.fire_pressed and self.fire_timer <= 0 and len(g.orbs) < 5:
+            if (
+                input_state.fire_pressed
+                and self.fire_timer <= 0
+                and len(game.orbs) < game.max_orbs
+            ):
                 x = min(730, max(70, self.x + self.direction_x * 38))
                 y = self.y - 35
-                self.blowing_orb = Orb((x, y), self.direction_x)
-                g.orbs.append(self.blowing_orb)
-                g.play_sound("blow", 4)
+                self.blowing_orb = game.entities.spawn_orb((x, y), self.direction_x)
+                game.play_sound(SOUND_BLOW)
                 self.fire_timer = 20
 
             # Jump on UP edge
             if input_state.jump_pressed and self.vel_y == 0 and self.landed:
                 self.vel_y = -16
                 self.landed = False
-                g.play_sound("jump")
+                game.play_sound(SOUND_JUMP)
 
         # Blow current orb further while SPACE is held
         if input_state.fire_held:
@@ -108,17 +118,18 @@ class Player(GravityActor):
             self.blowing_orb = None
 
         # --- Sprite selection ---
-        self.image = "blank"
         if self.hurt_timer <= 0 or self.hurt_timer % 2 == 1:
-            dir_index = "1" if self.direction_x > 0 else "0"
+            facing_right = self.direction_x > 0
             if self.hurt_timer > 100:
                 if self.health > 0:
-                    self.image = "recoil" + dir_index
+                    self.frame = Player.RECOIL_FRAMES[facing_right]
                 else:
-                    self.image = "fall" + str((g.timer // 4) % 2)
+                    self.frame = Player.FALL_FRAMES[(game.timer // 4) % 2]
             elif self.fire_timer > 0:
-                self.image = "blow" + dir_index
+                self.frame = Player.BLOW_FRAMES[facing_right]
             elif dx == 0:
-                self.image = "still"
+                self.frame = Player.STILL_FRAME
             else:
-                self.image = "run" + dir_index + str((g.timer // 8) % 4)
\ No newline at end of file
+                self.frame = Player.RUN_FRAMES[facing_right][(game.timer // 8) % 4]
+        else:
+            self.frame = Player.BLANK   # flicker while invulnerable
\ No newline at end of file
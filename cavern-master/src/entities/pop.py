@@ -4,17 +4,21 @@ entities/pop.py — Pop (burst animation sprite).
 Plays a short pop animation when an orb or fruit disappears.
 """
 
-from pgzero.actor import Actor
+from src.entities.base import Body
+from src.sprites import frame
 
 
-class Pop(Actor):
+class Pop(Body):
     """A short animated sprite shown when an orb or fruit pops."""
 
+    # FRAMES[type][timer // 2] — a pop lives for 12 frames
+    FRAMES = [[frame("pop%d%d" % (t, i)) for i in range(7)] for t in range(2)]
+
     def __init__(self, pos, type_: int):
-        super().__init__("blank", pos)
+        super().__init__(pos)
         self.type = type_
         self.timer = -1
 
-    def update(self) -> None:
+    def update(self, game) -> None:
         self.timer += 1
-        self.image = "pop" + str(self.type) + str(self.timer // 2)
\ No newline at end of file
+        self.frame = Pop.FRAMES[self.type][self.timer // 2]
\ No newline at end of file
@@ -3,18 +3,22 @@ entities/robot.py — Robot (enemy).
 
 Robots patrol the level, fire Bolts at the Player, and can be trapped
 in Orbs.  Two types exist: TYPE_NORMAL and TYPE_AGGRESSIVE.
-"""
 
-from random import choice, randint, random
+When a robot picks a direction it leans towards the way the level's
+navigation graph (src/navigation.py) leads to a player, which may be away
+from the player when the route runs through a drop.  It picks again every
+time it lands on a different platform.
+"""
 
-import src.constants as _c
+from src.audio import SOUND_LASER, SOUND_TRAP
 from src.constants import (
     ROBOT_TYPE_AGGRESSIVE,
     ROBOT_TYPE_NORMAL,
     sign,
 )
 from src.entities.base import GravityActor
-from src.entities.bolt import Bolt
+from src.navigation import NO_SPAN
+from src.sprites import frame
 
 
 class Robot(GravityActor):
@@ -24,75 +28,87 @@ class Robot(GravityActor):
     TYPE_NORMAL = ROBOT_TYPE_NORMAL
     TYPE_AGGRESSIVE = ROBOT_TYPE_AGGRESSIVE
 
-    def __init__(self, pos, type_: int):
+    # FRAMES[type][facing right][n] — n is 1-4 when walking, 5-7 when firing
+    FRAMES = [
+        [[frame("robot%d%d%d" % (t, d, n)) for n in range(8)] for d in range(2)]
+        for t in range(2)
+    ]
+
+    def __init__(self, pos, type_: int, rng):
         super().__init__(pos)
         self.type = type_
-        self.speed = randint(1, 3)
+        self.speed = rng.randint(1, 3)
         self.direction_x = 1
         self.alive = True
         self.change_dir_timer = 0
         self.fire_timer = 100
+        self.span = NO_SPAN   # navigation span last stood on
 
-    def update(self) -> None:
-        g = _c.current_game
-        super().update()
+    def update(self, game) -> None:
+        super().update(game)
 
         self.change_dir_timer -= 1
         self.fire_timer += 1
 
         # Move horizontally; reverse on wall collision
-        if self.move(self.direction_x, 0, self.speed):
+        if self.move(game, self.direction_x, 0, self.speed):
             self.change_dir_timer = 0
 
-        # Periodically choose a new direction (biased toward the player)
+        # Re-plan on reaching a different platform
+        nav = game.level_map.nav
+        if self.vel_y == 0:
+            span = nav.span_at(self.x, self.y)
+            if span != self.span:
+                self.span = span
+                self.change_dir_timer = 0
+
+        # Periodically choose a new direction (biased along the route to
+        # each player; straight at a player who can't be reached)
         if self.change_dir_timer <= 0:
             directions = [-1, 1]
-            if g.player:
-                directions.append(sign(g.player.x - self.x))
-            self.direction_x = choice(directions)
-            self.change_dir_timer = randint(100, 250)
+            for player in game.live_players:
+                directions.append(
+                    nav.direction(self.x, self.y, player.x, player.y)
+                    or sign(player.x - self.x)
+                )
+            self.direction_x = game.rng.choice(directions)
+            self.change_dir_timer = game.rng.randint(100, 250)
 
         # Aggressive robots deliberately aim at nearby orbs
         if self.type == Robot.TYPE_AGGRESSIVE and self.fire_timer >= 24:
-            for orb in g.orbs:
-                if (
-                    orb.y >= self.top
-                    and orb.y < self.bottom
-                    and abs(orb.x - self.x) < 200
-                ):
-                    self.direction_x = sign(orb.x - self.x)
-                    self.fire_timer = 0
-                    break
+            orb = game.entities.orb_in_band(self.top, self.bottom, self.x, 200)
+            if orb:
+                self.direction_x = sign(orb.x - self.x)
+                self.fire_timer = 0
 
-        # Fire at the player — more likely when at the same height
+        # Fire at the players — more likely when level with one
         if self.fire_timer >= 12:
-            fire_probability = g.fire_probability()
-            if g.player and self.top < g.player.bottom and self.bottom > g.player.top:
-                fire_probability *= 10
-            if random() < fire_probability:
+            fire_probability = game.fire_probability()
+            for player in game.live_players:
+                if self.top < player.bottom and self.bottom > player.top:
+                    fire_probability *= 10
+                    break
+            if game.rng.random() < fire_probability:
                 self.fire_timer = 0
-                g.play_sound("laser", 4)
+                game.play_sound(SOUND_LASER)
 
         elif self.fire_timer == 8:
             # Frame 8 of the fire animation is when the bolt is actually launched
-            g.bolts.append(
-                Bolt((self.x + self.direction_x * 20, self.y - 38), self.direction_x)
+            game.entities.spawn_bolt(
+                (self.x + self.direction_x * 20, self.y - 38), self.direction_x
             )
 
         # Check for capture by an orb
-        for orb in g.orbs:
-            if orb.trapped_enemy_type is None and self.collidepoint(orb.center):
-                self.alive = False
-                orb.floating = True
-                orb.trapped_enemy_type = self.type
-                g.play_sound("trap", 4)
-                break
+        orb = game.entities.free_orb_centred_in(self)
+        if orb:
+            self.alive = False
+            orb.floating = True
+            orb.trapped_enemy_type = self.type
+            game.play_sound(SOUND_TRAP)
 
         # --- Sprite selection ---
-        direction_idx = "1" if self.direction_x > 0 else "0"
-        image = "robot" + str(self.type) + direction_idx
+        frames = Robot.FRAMES[self.type][self.direction_x > 0]
         if self.fire_timer < 12:
-            image += str(5 + (self.fire_timer // 4))
+            self.frame = frames[5 + (self.fire_timer // 4)]
         else:
-            image += str(1 + ((g.timer // 4) % 4))
-        self.image = image
\ No newline at end of file
+            self.frame = frames[1 + ((game.timer // 4) % 4)]
\ No newline at end of file
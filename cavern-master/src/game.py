@@ -1,40 +1,70 @@
 """
 game.py — The Game class.
 
-Orchestrates a single play session: owns all entity lists, drives per-frame
-updates, manages level transitions, renders the scene, and plays sounds.
+Orchestrates a single play session: owns the entity registry, drives
+per-frame updates, manages level transitions, renders the scene, and plays
+sounds.
+
+Every random decision in a session is drawn from the Game's own seeded
+stream, so the same seed and inputs reproduce a run exactly.
 
 All entity classes live in src/entities/.
 All shared constants live in src/constants.py.
 """
 
-from random import randint, shuffle
-
-import src.constants as _c
-from src.constants import (
-    GRID_BLOCK_SIZE,
-    LEVEL_X_OFFSET,
-    LEVELS,
-    NUM_COLUMNS,
-    NUM_ROWS,
-    WIDTH,
-    set_current_game,
-)
-from src.entities.bolt import Bolt
-from src.entities.fruit import Fruit
-from src.entities.orb import Orb
-from src.entities.pop import Pop
+import random
+
+import src.audio as _audio
+import src.profiler as _profiler
+import src.snapshot as _snapshot
+from src.constants import MAX_ORBS, NUM_COLUMNS
 from src.entities.robot import Robot
+from src.levelpack import builtin_pack
+from src.registry import EntityRegistry, orb_alive
+from src.render import draw_entity, level_layer
 
+# Profiler sections for each registry bucket's draw pass, in bucket order
+_DRAW_SECTIONS = ("draw.fruits", "draw.bolts", "draw.enemies", "draw.pops", "draw.orbs")
 
-class Game:
-    """Manages a single play session (one player, N levels)."""
 
-    def __init__(self, player=None):
+class Game:
+    """Manages a single play session (one or two players, N levels).
+
+    ``player`` is player one (None for a playerless demo game); ``player2``
+    adds a co-op partner.  ``players`` lists both and ``live_players`` those
+    who still have lives, which is who the entities interact with.
+    ``levels`` is a sequence of CompiledLevels, such as a LevelPack (see
+    src/levelpack.py), played in order and then repeated; it defaults to
+    the built-in layouts.  A game built ``muted`` makes no sound, not even
+    its first level's, until ``muted`` is cleared.
+    """
+
+    def __init__(self, player=None, seed=None, player2=None, levels=None, muted=False):
         self.player = player
+        self.players = [p for p in (player, player2) if p is not None]
+        self.live_players = list(self.players)
+        self.muted = muted   # set while resimulating: no sounds are played
+        self.max_orbs = MAX_ORBS   # orbs out at once before firing is refused
         self.level_colour = -1
         self.level = -1
-        set_current_game(self)
+        self.levels = builtin_pack() if levels is None else levels
+
+        # Simulation randomness comes only from ``rng``.  Sound variants are
+        # picked by the sound bank, so whether audio is playing can't change
+        # a run.
+        if seed is None:
+            seed = random.getrandbits(32)
+        self.seed = seed
+        self.rng = random.Random(seed)
+
+        # The registry's buckets are exposed directly for entity code
+        self.entities = EntityRegistry(self.rng)
+        self.fruits = self.entities.fruits
+        self.bolts = self.entities.bolts
+        self.enemies = self.entities.enemies
+        self.pops = self.entities.pops
+        self.orbs = self.entities.orbs
+
         self.next_level()
 
     # ------------------------------------------------------------------
@@ -58,20 +88,18 @@ class Game:
         self.level_colour = (self.level_colour + 1) % 4
         self.level += 1
 
-        self.grid = LEVELS[self.level % len(LEVELS)]
-        # The last row mirrors the first row (used for wrap-around detection)
-        self.grid = self.grid + [self.grid[0]]
+        # Compiled ahead of time: collision map, spawn columns and the grid
+        # rows (the last row mirrors the first, for wrap-around)
+        self.level_map = self.levels[self.level % len(self.levels)]
+        self.grid = self.level_map.grid
 
         self.timer = -1
 
-        if self.player:
-            self.player.reset()
+        for player in self.players:
+            player.reset()
 
-        self.fruits: list[Fruit] = []
-        self.bolts: list[Bolt] = []
-        self.enemies: list[Robot] = []
-        self.pops: list[Pop] = []
-        self.orbs: list[Orb] = []
+        # Anything left over from the previous level goes back to the pools
+        self.entities.clear()
 
         num_enemies = 10 + self.level
         num_strong = 1 + int(self.level / 1.5)
@@ -80,65 +108,104 @@ class Game:
         self.pending_enemies: list[int] = (
             num_strong * [Robot.TYPE_AGGRESSIVE] + num_weak * [Robot.TYPE_NORMAL]
         )
-        shuffle(self.pending_enemies)
+        self.rng.shuffle(self.pending_enemies)
 
-        self.play_sound("level", 1)
+        self.play_sound(_audio.SOUND_LEVEL)
 
     def get_robot_spawn_x(self) -> float:
         """Find a free column at the top of the grid for a robot to spawn."""
-        r = randint(0, NUM_COLUMNS - 1)
-        for i in range(NUM_COLUMNS):
-            grid_x = (r + i) % NUM_COLUMNS
-            if self.grid[0][grid_x] == " ":
-                return GRID_BLOCK_SIZE * grid_x + LEVEL_X_OFFSET + 12
-        return WIDTH / 2
+        return self.level_map.spawn_x[self.rng.randint(0, NUM_COLUMNS - 1)]
+
+    @property
+    def game_over(self) -> bool:
+        """True once every player has lost their last life (never for a
+        playerless demo game)."""
+        return bool(self.players) and all(p.lives < 0 for p in self.players)
 
     # ------------------------------------------------------------------
     # Per-frame update
     # ------------------------------------------------------------------
 
-    def update(self, input_state=None) -> None:
+    def update(self, input_state=None, input_state2=None) -> None:
         """Advance the game by one frame.
 
-        ``input_state`` is an InputState forwarded to the Player.  Pass
-        None in menu / demo mode (player is not updated).
+        ``input_state`` is an InputState forwarded to player one and
+        ``input_state2`` to player two.  Pass None in menu / demo mode
+        (players are not updated).
         """
-        set_current_game(self)  # keep module-level reference current
+        prof = _profiler.active
+        if prof:
+            prof.begin()
         self.timer += 1
 
-        # Update all entities
-        for obj in self.fruits + self.bolts + self.enemies + self.pops + self.orbs:
-            if obj:
-                obj.update()
-
-        if self.player and input_state is not None:
-            self.player.update(input_state)
+        # Players who lost their last life last frame leave play
+        if any(player.lives < 0 for player in self.live_players):
+            self.live_players = [p for p in self.live_players if p.lives >= 0]
 
-        # Prune expired / inactive entities
-        self.fruits = [f for f in self.fruits if f.time_to_live > 0]
-        self.bolts = [b for b in self.bolts if b.active]
-        self.enemies = [e for e in self.enemies if e.alive]
-        self.pops = [p for p in self.pops if p.timer < 12]
-        self.orbs = [o for o in self.orbs if o.timer < 250 and o.y > -40]
+        # Update all entities
+        self.entities.update_all(self)
+
+        for player, state in zip(self.players, (input_state, input_state2)):
+            if state is not None and player.lives >= 0:
+                player.update(self, state)
+        if prof:
+            prof.mark("update.player")
+
+        # Prune expired / inactive entities in place, recycling them
+        for player in self.players:
+            if player.blowing_orb and not orb_alive(player.blowing_orb):
+                player.blowing_orb = None   # the orb is about to be recycled
+        self.entities.prune()
+        if prof:
+            prof.mark("update.prune")
 
         # Randomly spawn a fruit every 100 frames while enemies remain
-        if self.timer % 100 == 0 and len(self.pending_enemies + self.enemies) > 0:
-            self.fruits.append(Fruit((randint(70, 730), randint(75, 400))))
+        if self.timer % 100 == 0 and (self.pending_enemies or self.enemies):
+            rng = self.rng
+            self.entities.spawn_fruit((rng.randint(70, 730), rng.randint(75, 400)))
 
         # Spawn a queued robot every 81 frames if under the enemy cap
         if (
             self.timer % 81 == 0
-            and len(self.pending_enemies) > 0
+            and self.pending_enemies
             and len(self.enemies) < self.max_enemies()
         ):
             robot_type = self.pending_enemies.pop()
             pos = (self.get_robot_spawn_x(), -30)
-            self.enemies.append(Robot(pos, robot_type))
+            self.entities.add_enemy(Robot(pos, robot_type, self.rng))
 
         # Advance to next level when all enemies and collectibles are gone
-        if len(self.pending_enemies + self.fruits + self.enemies + self.pops) == 0:
-            if not any(o.trapped_enemy_type is not None for o in self.orbs):
+        if not (self.pending_enemies or self.fruits or self.enemies or self.pops):
+            for orb in self.orbs:
+                if orb.trapped_enemy_type is not None:
+                    break
+            else:
                 self.next_level()
+        if prof:
+            prof.mark("update.spawn")
+
+    # ------------------------------------------------------------------
+    # Save states
+    # ------------------------------------------------------------------
+
+    def snapshot(self) -> bytes:
+        """Capture the full simulation state as a bytes blob (see
+        src/snapshot.py)."""
+        return _snapshot.snapshot(self)
+
+    def restore(self, blob: bytes) -> None:
+        """Return to the state captured by snapshot()."""
+        _snapshot.restore(self, blob)
+
+    def resimulate(self, inputs) -> None:
+        """Step through *inputs*, a sequence of (input_state, input_state2)
+        pairs, without playing sounds.  Used to catch up after restore()."""
+        self.muted = True
+        try:
+            for input_state, input_state2 in inputs:
+                self.update(input_state, input_state2)
+        finally:
+            self.muted = False
 
     # ------------------------------------------------------------------
     # Rendering
@@ -146,34 +213,38 @@ class Game:
 
     def draw(self, screen) -> None:
         """Draw the background, level blocks, and all entities."""
-        screen.blit("bg%d" % self.level_colour, (0, 0))
-
-        block_sprite = "block" + str(self.level % 4)
-
-        for row_y in range(NUM_ROWS):
-            row = self.grid[row_y]
-            if len(row) > 0:
-                x = LEVEL_X_OFFSET
-                for blk in row:
-                    if blk != " ":
-                        screen.blit(block_sprite, (x, row_y * GRID_BLOCK_SIZE))
-                    x += GRID_BLOCK_SIZE
-
-        all_objs = self.fruits + self.bolts + self.enemies + self.pops + self.orbs
-        all_objs.append(self.player)
-        for obj in all_objs:
-            if obj:
-                obj.draw()
+        # Background and blocks are pre-composited per (layout, colour);
+        # block and background colours both follow level_colour
+        prof = _profiler.active
+        if prof:
+            prof.begin()
+        screen.blit(level_layer(self.level_map, self.level_colour), (0, 0))
+        if prof:
+            prof.mark("draw.level")
+
+        # Entities in drawables() order, timed per entity type when profiled
+        for bucket, section in zip(self.entities._lists, _DRAW_SECTIONS):
+            for obj in bucket:
+                draw_entity(screen, obj)
+            if prof:
+                prof.mark(section)
+        for player in self.live_players:
+            draw_entity(screen, player)
+        if prof:
+            prof.mark("draw.player")
+
+    def drawables(self):
+        """Iterate over all entities in draw order, back to front."""
+        yield from self.entities
+        yield from self.live_players
 
     # ------------------------------------------------------------------
     # Audio
     # ------------------------------------------------------------------
 
-    def play_sound(self, name: str, count: int = 1) -> None:
-        """Play a named sound (with optional random variant) if audio is available."""
-        if self.player and _c._sounds:
-            try:
-                sound = getattr(_c._sounds, name + str(randint(0, count - 1)))
-                sound.play()
-            except Exception as e:
-                print(e)
\ No newline at end of file
+    def play_sound(self, sound: int) -> None:
+        """Request a sound (an ID from src/audio.py) for this frame, if audio
+        is available.  Playerless demo games stay silent."""
+        bank = _audio.bank
+        if bank is not None and self.players and not self.muted:
+            bank.request(sound)
\ No newline at end of file
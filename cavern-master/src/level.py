@@ -0,0 +1,120 @@
+"""
+level.py — Level layouts compiled to flat collision maps.
+
+A layout in LEVELS is a list of strings, one per grid row, where empty
+strings are empty rows.  CompiledLevel turns it, once, into a bytearray
+with one byte per grid cell plus pixel → cell lookup tables, so a collision
+test is a single indexed load instead of integer division and string
+indexing.  Game.next_level installs the compiled level as ``level_map``.
+
+Each CompiledLevel also carries the level's navigation graph (``nav``, see
+src/navigation.py), built with it unless it was compiled ahead of time.
+
+Level packs (src/levelpack.py) store the same compiled data, navigation
+tables included, on disk and rebuild CompiledLevels from it with
+from_compiled(), without recompiling.
+"""
+
+import hashlib
+
+from src.constants import (
+    GRID_BLOCK_SIZE,
+    HEIGHT,
+    LEVEL_X_OFFSET,
+    NUM_COLUMNS,
+    NUM_ROWS,
+    WIDTH,
+)
+
+# Each row of the collision map has one extra, always-empty column.  Pixels
+# left or right of the grid look up that column; pixels above/below the
+# grid (and the top row, which never blocks) look up row 0, which is kept
+# empty.  So every lookup hits a real byte and no bounds checks are needed.
+STRIDE = NUM_COLUMNS + 1
+
+
+def _row_index(y: int) -> int:
+    grid_y = y // GRID_BLOCK_SIZE
+    return grid_y * STRIDE if 0 < grid_y < NUM_ROWS else 0
+
+
+def _column_index(x: int) -> int:
+    grid_x = (x - LEVEL_X_OFFSET) // GRID_BLOCK_SIZE
+    return grid_x if 0 <= grid_x < NUM_COLUMNS else NUM_COLUMNS
+
+
+# Pixel → offset tables.  Each covers twice the screen extent: indices past
+# the screen map to the empty row/column, and negative pixel coordinates
+# (actors above the top or left of the screen) wrap around onto those same
+# entries via Python's negative indexing.
+ROW_INDEX = [_row_index(y) if y < HEIGHT else 0 for y in range(2 * HEIGHT)]
+COLUMN_INDEX = [
+    _column_index(x) if x < WIDTH else NUM_COLUMNS for x in range(2 * WIDTH)
+]
+
+
+# Spawn column meaning "the screen centre" (the top row is solid)
+CENTRE_SPAWN = 255
+
+
+def layout_key(layout) -> bytes:
+    """16-byte content hash of a layout.  Rows are hashed padded to the
+    grid width, so layouts that draw identically share a key."""
+    rows = "\n".join(row.ljust(NUM_COLUMNS) for row in layout)
+    return hashlib.blake2b(rows.encode(), digest_size=16).digest()
+
+
+def spawn_columns(top_row: str) -> bytes:
+    """For each column r, the first free column at or after r in *top_row*
+    (wrapping), or CENTRE_SPAWN if there is none."""
+    top = top_row.ljust(NUM_COLUMNS)
+    free = [grid_x for grid_x in range(NUM_COLUMNS) if top[grid_x] == " "]
+    if not free:
+        return bytes([CENTRE_SPAWN] * NUM_COLUMNS)
+    return bytes(min(free, key=lambda c: (c - r) % NUM_COLUMNS) for r in range(NUM_COLUMNS))
+
+
+class CompiledLevel:
+    """Collision map, spawn columns and navigation graph for one level layout."""
+
+    def __init__(self, layout):
+        layout = tuple(layout)
+        # The last row mirrors the first row (used for wrap-around detection)
+        grid = list(layout) + [layout[0]]
+
+        cells = bytearray(NUM_ROWS * STRIDE)
+        for grid_y in range(1, NUM_ROWS):
+            for grid_x, char in enumerate(grid[grid_y][:NUM_COLUMNS]):
+                if char != " ":
+                    cells[grid_y * STRIDE + grid_x] = 1
+        self._install(layout, cells, spawn_columns(layout[0]), layout_key(layout), None)
+
+    @classmethod
+    def from_compiled(cls, layout, cells, spawn_columns: bytes, key: bytes, nav=None):
+        """Build a CompiledLevel from data compiled earlier (e.g. read from a
+        level pack cache), trusting it as-is."""
+        level = cls.__new__(cls)
+        level._install(tuple(layout), cells, spawn_columns, key, nav)
+        return level
+
+    def _install(self, layout, cells, spawn_columns, key, nav) -> None:
+        self.layout = layout
+        self.grid = list(layout) + [layout[0]]
+        self.cells = cells
+        self.key = key   # content hash; keys the cached level layer
+        self.spawn_columns = spawn_columns
+        # spawn_x[r] — pixel x of the column robots spawn in for column r
+        self.spawn_x = [
+            WIDTH / 2 if c == CENTRE_SPAWN else GRID_BLOCK_SIZE * c + LEVEL_X_OFFSET + 12
+            for c in spawn_columns
+        ]
+        if nav is None:
+            # src.navigation imports this module, so import it late
+            from src.navigation import build_navigation
+            nav = build_navigation(cells)
+        self.nav = nav
+
+    def block(self, x: int, y: int) -> bool:
+        """Return True if there is a block at pixel position (x, y)."""
+        return self.cells[ROW_INDEX[y] + COLUMN_INDEX[x]]
+
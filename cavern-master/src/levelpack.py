@@ -0,0 +1,231 @@
+"""
+levelpack.py — Level packs: text layouts compiled once to a binary cache.
+
+A pack is a text file holding any number of levels.  Each level starts with
+a line beginning with ``=`` (the rest of the line is a free-form title),
+followed by exactly LEVEL_ROWS rows.  In a row, ``X`` is a block and ``.``
+or a space is empty.  Short rows are padded with empty cells.  Between
+levels, blank lines and lines starting with ``#`` are ignored:
+
+    # My pack
+    = Level one
+    XXXXX     XXXXXXXX     XXXXX
+    .
+    ...
+
+load_pack() validates the text and compiles every level: the collision
+map, the spawn columns, the navigation tables robots path with (see
+src/navigation.py) and the content hash that keys the level's cached
+layer.  The result is written to a cache file named after a hash of the
+pack's text, so editing a pack invalidates its cache automatically.  Later
+loads memory-map that file.  Each level is built from its fixed-size
+record the first time it is played, and that takes only slicing: nothing
+is parsed, validated or compiled.
+
+LevelPack is a sequence of CompiledLevels and is what Game expects as its
+``levels``.  builtin_pack() holds the layouts in src/constants.py.
+"""
+
+import hashlib
+import mmap
+import os
+import struct
+
+from src.constants import LEVELS, NUM_COLUMNS, NUM_ROWS
+from src.level import STRIDE, CompiledLevel
+from src.navigation import NavGraph
+
+MAGIC = b"CAVL"
+VERSION = 2
+
+# Rows in a layout; the grid's last row is a copy of the first
+LEVEL_ROWS = NUM_ROWS - 1
+
+# magic, version, grid rows, grid columns, number of levels
+_HEADER = struct.Struct("<4sBBBI")
+
+# Per level: content hash, the layout's rows (space-padded), the collision
+# map, the spawn columns, the navigation land table, and where the level's
+# spans and next-hop table are.  Those two grow with the number of spans,
+# so they follow the fixed-size records, in level order.
+_KEY_SIZE = 16
+_ROWS_SIZE = LEVEL_ROWS * NUM_COLUMNS
+_CELLS_SIZE = NUM_ROWS * STRIDE
+_NAV = struct.Struct("<IB")   # offset of the spans in the pack, span count
+_RECORD_SIZE = _KEY_SIZE + _ROWS_SIZE + 2 * _CELLS_SIZE + NUM_COLUMNS + _NAV.size
+
+_EMPTY = " ."
+_BLOCK = "X"
+
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "cavern")
+
+
+class LevelPackError(ValueError):
+    """A level pack's text is malformed.  The message names the line."""
+
+
+def parse_pack(text: str, source: str = "<pack>") -> list:
+    """Validate pack *text* and return its layouts as tuples of rows, with
+    empty cells as spaces."""
+    layouts = []
+    rows = None
+    start = 0   # line number of the open level's '=' line
+    for number, line in enumerate(text.splitlines(), 1):
+        line = line.rstrip("\r\n")
+        if rows is not None and len(rows) < LEVEL_ROWS:
+            if line.startswith("="):
+                raise LevelPackError(
+                    f"{source}:{start}: level has {len(rows)} rows, expected {LEVEL_ROWS}")
+            if len(line.rstrip()) > NUM_COLUMNS:
+                raise LevelPackError(
+                    f"{source}:{number}: row is wider than {NUM_COLUMNS} columns")
+            bad = set(line) - set(_EMPTY + _BLOCK)
+            if bad:
+                raise LevelPackError(
+                    f"{source}:{number}: unexpected {''.join(sorted(bad))!r} "
+                    f"(use {_BLOCK!r} for blocks and '.' or ' ' for empty cells)")
+            rows.append(line.replace(".", " ").ljust(NUM_COLUMNS)[:NUM_COLUMNS])
+        elif line.startswith("="):
+            rows = []
+            start = number
+            layouts.append(rows)
+        elif line.strip() and not line.startswith("#"):
+            raise LevelPackError(f"{source}:{number}: expected '=' to start a level")
+    if not layouts:
+        raise LevelPackError(f"{source}: no levels")
+    if len(layouts[-1]) < LEVEL_ROWS:
+        raise LevelPackError(
+            f"{source}:{start}: level has {len(layouts[-1])} rows, expected {LEVEL_ROWS}")
+    return [tuple(rows) for rows in layouts]
+
+
+def compile_pack(layouts) -> bytes:
+    """Compile *layouts* to the binary form LevelPack reads."""
+    parts = [_HEADER.pack(MAGIC, VERSION, NUM_ROWS, NUM_COLUMNS, len(layouts))]
+    tables = []
+    offset = _HEADER.size + len(layouts) * _RECORD_SIZE
+    for layout in layouts:
+        rows = tuple(row.ljust(NUM_COLUMNS) for row in layout)
+        if len(rows) != LEVEL_ROWS:
+            raise LevelPackError(f"layout has {len(rows)} rows, expected {LEVEL_ROWS}")
+        level = CompiledLevel(rows)
+        nav = level.nav
+        parts += (level.key, "".join(rows).encode("ascii"),
+                  bytes(level.cells), level.spawn_columns, nav.land,
+                  _NAV.pack(offset, nav.count))
+        tables += (nav.spans, nav.next_hop)
+        offset += len(nav.spans) + len(nav.next_hop)
+    return b"".join(parts + tables)
+
+
+class LevelPack:
+    """Compiled levels read in place from a bytes-like *buffer* (usually a
+    memory-mapped cache file)."""
+
+    def __init__(self, buffer):
+        if len(buffer) < _HEADER.size:
+            raise ValueError("Truncated level pack")
+        magic, version, rows, columns, count = _HEADER.unpack_from(buffer)
+        if magic != MAGIC:
+            raise ValueError("Not a Cavern level pack")
+        if version != VERSION or (rows, columns) != (NUM_ROWS, NUM_COLUMNS):
+            raise ValueError(f"Unsupported level pack version: {version}")
+        size = _HEADER.size + count * _RECORD_SIZE
+        if count and len(buffer) >= size:
+            # The last level's tables end the pack
+            offset, spans = _NAV.unpack_from(buffer, size - _NAV.size)
+            size = offset + 3 * spans + spans * spans
+        if len(buffer) != size:
+            raise ValueError("Truncated level pack")
+        self._buffer = buffer
+        self._levels = [None] * count
+
+    def __len__(self) -> int:
+        return len(self._levels)
+
+    def __getitem__(self, index: int) -> CompiledLevel:
+        """Level *index*, wrapping past the end like LEVELS[n % len]."""
+        if not self._levels:
+            raise IndexError("empty level pack")
+        index %= len(self._levels)
+        level = self._levels[index]
+        if level is None:
+            level = self._levels[index] = self._level_at(index)
+        return level
+
+    def __iter__(self):
+        # Indexing wraps, so iteration needs its own end
+        return (self[index] for index in range(len(self._levels)))
+
+    def _level_at(self, index: int) -> CompiledLevel:
+        buffer = self._buffer
+        pos = _HEADER.size + index * _RECORD_SIZE
+        key = bytes(buffer[pos:pos + _KEY_SIZE])
+        pos += _KEY_SIZE
+        text = bytes(buffer[pos:pos + _ROWS_SIZE]).decode("ascii")
+        layout = [text[i:i + NUM_COLUMNS] for i in range(0, _ROWS_SIZE, NUM_COLUMNS)]
+        pos += _ROWS_SIZE
+        # Copied out of the mapping: indexing bytes is faster than indexing
+        # an mmap, and collision tests do it constantly
+        cells = bytes(buffer[pos:pos + _CELLS_SIZE])
+        pos += _CELLS_SIZE
+        spawn = bytes(buffer[pos:pos + NUM_COLUMNS])
+        pos += NUM_COLUMNS
+        land = bytes(buffer[pos:pos + _CELLS_SIZE])
+        offset, count = _NAV.unpack_from(buffer, pos + _CELLS_SIZE)
+        spans = bytes(buffer[offset:offset + 3 * count])
+        next_hop = bytes(buffer[offset + 3 * count:offset + 3 * count + count * count])
+        nav = NavGraph(spans, land, next_hop)
+        return CompiledLevel.from_compiled(layout, cells, spawn, key, nav)
+
+
+def load_pack(path: str, cache_dir: str = None) -> LevelPack:
+    """Load the pack at *path*, compiling it only if its cache is missing.
+
+    The cache lives in *cache_dir* (default ~/.cache/cavern).  If it can't
+    be written, the pack is compiled in memory instead.
+    """
+    with open(path, "rb") as f:
+        data = f.read()
+    digest = hashlib.blake2b(data + bytes([VERSION]), digest_size=16).hexdigest()
+    cache_path = os.path.join(cache_dir or DEFAULT_CACHE_DIR, digest + ".cvl")
+
+    pack = _map(cache_path)
+    if pack is not None:
+        return pack
+
+    compiled = compile_pack(parse_pack(data.decode("utf-8"), path))
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        partial = f"{cache_path}.{os.getpid()}.tmp"
+        with open(partial, "wb") as f:
+            f.write(compiled)
+        os.replace(partial, cache_path)   # readers never see a partial file
+    except OSError:
+        return LevelPack(compiled)
+    return _map(cache_path) or LevelPack(compiled)
+
+
+def _map(cache_path: str):
+    """The LevelPack in *cache_path*, or None if it is missing or invalid."""
+    try:
+        with open(cache_path, "rb") as f:
+            mapping = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):   # ValueError: empty file
+        return None
+    try:
+        return LevelPack(mapping)
+    except (ValueError, struct.error):
+        mapping.close()
+        return None
+
+
+_builtin = None
+
+
+def builtin_pack() -> LevelPack:
+    """The game's own layouts (LEVELS), compiled in memory on first use."""
+    global _builtin
+    if _builtin is None:
+        _builtin = LevelPack(compile_pack(LEVELS))
+    return _builtin
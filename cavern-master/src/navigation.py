@@ -0,0 +1,147 @@
+"""
+navigation.py — Platform graphs and next-hop tables for robots.
+
+Robots cannot jump: they walk along platforms and drop off the ends.  A
+level's walkable ground is therefore a small directed graph, built once
+per layout from its collision map:
+
+    span    a maximal run of cells in one row that a robot can stand in
+            (empty, with a block underneath) and walk along
+    drop    walking off either end of a span falls straight down the next
+            column, onto whichever span first catches it.  A drop through
+            a gap in the bottom row (the mirrored top row) wraps round to
+            the top of the screen and keeps falling
+
+For every pair of spans the graph stores which way a robot on the first
+should walk to reach the second along the shortest route, counting one
+unit per cell walked or fallen and measuring from the middle of each
+source span.  ``land`` maps every cell to the span a body there stands on
+or will land on, so a query is two table lookups and an index:
+
+    nav.direction(robot.x, robot.y, player.x, player.y)   # -1, 1 or 0
+
+CompiledLevel.nav holds a level's NavGraph.  Level packs store the tables
+with the rest of the compiled level, so loading a cached pack builds
+nothing.
+"""
+
+import heapq
+
+from src.constants import NUM_COLUMNS, NUM_ROWS, sign
+from src.level import COLUMN_INDEX, ROW_INDEX, STRIDE
+
+NO_SPAN = 255   # land entry for cells that never reach a span
+
+# next_hop entries, and the direction_x each stands for
+STAY, LEFT, RIGHT = 0, 1, 2
+_STEP = (0, -1, 1)
+
+
+class NavGraph:
+    """Spans and next-hop tables for one collision map.
+
+    *spans* holds three bytes per span (row, first column, last column),
+    *land* one span id per collision-map cell, and *next_hop* one step
+    (STAY, LEFT or RIGHT) per (source, target) pair, source-major.
+    """
+
+    def __init__(self, spans: bytes, land: bytes, next_hop: bytes):
+        self.spans = spans
+        self.land = land
+        self.next_hop = next_hop
+        self.count = len(spans) // 3
+
+    def span_at(self, x: int, y: int) -> int:
+        """The span a body anchored at (x, y) stands on or will land on,
+        or NO_SPAN."""
+        return self.land[ROW_INDEX[int(y)] + COLUMN_INDEX[int(x)]]
+
+    def direction(self, x: int, y: int, target_x: int, target_y: int) -> int:
+        """The direction_x that leads from (x, y) towards (target_x,
+        target_y): -1 or 1, or 0 if there is no route."""
+        land = self.land
+        here = land[ROW_INDEX[int(y)] + COLUMN_INDEX[int(x)]]
+        there = land[ROW_INDEX[int(target_y)] + COLUMN_INDEX[int(target_x)]]
+        if here == NO_SPAN or there == NO_SPAN:
+            return 0
+        if here == there:
+            return sign(target_x - x)
+        return _STEP[self.next_hop[here * self.count + there]]
+
+
+def build_navigation(cells) -> NavGraph:
+    """Build the NavGraph for the collision map *cells* (see src/level.py)."""
+    # Spans, row by row.  Row 0 of the map is always empty and the last row
+    # is only ever stood on, never in.
+    spans = []
+    span_at = {}   # (row, column) → span id
+    for row in range(NUM_ROWS - 1):
+        below = (row + 1) * STRIDE
+        column = 0
+        while column < NUM_COLUMNS:
+            first = column
+            while column < NUM_COLUMNS and not cells[row * STRIDE + column] \
+                    and cells[below + column]:
+                span_at[row, column] = len(spans)
+                column += 1
+            if column > first:
+                spans.append((row, first, column - 1))
+            else:
+                column += 1
+
+    land = bytearray([NO_SPAN]) * len(cells)
+    for row in range(NUM_ROWS):
+        for column in range(NUM_COLUMNS):
+            if not cells[row * STRIDE + column]:
+                landing = _fall(span_at, row, column)
+                if landing is not None:
+                    land[row * STRIDE + column] = landing[0]
+
+    # exits[span] — (step, exit column, landing span, rows fallen) per end
+    # a robot can walk off
+    exits = []
+    for row, first, last in spans:
+        ends = []
+        for step, column in ((LEFT, first - 1), (RIGHT, last + 1)):
+            if 0 <= column < NUM_COLUMNS and not cells[row * STRIDE + column]:
+                landing = _fall(span_at, row, column)
+                if landing is not None:
+                    ends.append((step, column) + landing)
+        exits.append(ends)
+
+    count = len(spans)
+    next_hop = bytearray(count * count)
+    for source, (row, first, last) in enumerate(spans):
+        # Dijkstra over (span, column) arrivals, remembering the first step
+        first_step = [None] * count
+        seen = set()
+        heap = [(0, source, (first + last) // 2, STAY)]
+        while heap:
+            cost, span, column, step = heapq.heappop(heap)
+            if (span, column) in seen:
+                continue
+            seen.add((span, column))
+            if first_step[span] is None:
+                first_step[span] = step
+            for exit_step, exit_column, landing, fallen in exits[span]:
+                heapq.heappush(heap, (
+                    cost + abs(column - exit_column) + fallen,
+                    landing, exit_column, step or exit_step,
+                ))
+        for target, step in enumerate(first_step):
+            if step is not None:
+                next_hop[source * count + target] = step
+
+    return NavGraph(
+        bytes(value for span in spans for value in span), bytes(land), bytes(next_hop)
+    )
+
+
+def _fall(span_at: dict, row: int, column: int):
+    """(span, rows fallen) for a body dropping from (row, column), wrapping
+    from the bottom of the screen to the top; None if it falls forever."""
+    for fallen in range(NUM_ROWS):
+        span = span_at.get(((row + fallen) % NUM_ROWS, column))
+        if span is not None:
+            return span, fallen
+    return None
@@ -0,0 +1,336 @@
+"""
+netplay.py — Two-player co-op over UDP with rollback.
+
+Both machines run the same Game (same seed, two Players) and exchange only
+inputs.  Each frame a peer sends its packed InputState (see src/replay.py)
+and simulates immediately.  For the remote player it uses the last input it
+received, with the edge-triggered presses cleared, because a press repeated
+by prediction would be a second press.  When the real input arrives and
+differs from the prediction, the session restores the snapshot taken
+before that frame and resimulates up to the present with
+Game.resimulate(), which plays no sounds.  Nothing is drawn until the
+catch-up is done.
+
+Every packet repeats all local inputs the peer has not acknowledged yet, so
+lost or reordered datagrams only delay an input and never lose it.  A peer
+that gets more than ``max_rollback`` frames ahead of the inputs it has
+confirmed waits for the other side instead of predicting further.  This
+keeps the worst-case resimulation bounded, and at about 0.15 ms per frame
+eight frames fit easily inside one 16 ms tick.  Presses made while it
+waits are carried into the next frame it simulates, so none is lost.
+
+PlayScreen runs a co-op game through a RollbackSession when main.py is
+started with CAVERN_NETPLAY (see readme.md).  Each game over and rematch
+over the same socket is a new match, numbered in every packet, so inputs
+still in flight from the last match are ignored.
+
+LatencyShim wraps a transport to add delay, jitter and loss for testing.
+Two processes on loopback:
+
+    python -m src.netplay --player 0 --port 7000 --peer-port 7001 --latency 40
+    python -m src.netplay --player 1 --port 7001 --peer-port 7000 --latency 40
+
+Each prints a checksum of its final game state.  The two must match.
+bench/bench_netplay.py runs both and compares them.
+"""
+
+import argparse
+import heapq
+import random
+import socket
+import struct
+import time
+import zlib
+
+from src.constants import WIDTH
+from src.input import InputState
+from src.replay import pack_input, unpack_input
+
+MAGIC = b"CVNP"
+
+# magic, match number, first frame carried, ack (next frame expected from
+# the peer), count
+_PACKET = struct.Struct("<4sBIIB")
+MAX_INPUTS_PER_PACKET = 255
+
+# Input bits that only last one frame, never repeated by prediction
+_EDGE_BITS = pack_input(InputState(jump_pressed=True, fire_pressed=True, pause_pressed=True))
+_PAUSE_BIT = pack_input(InputState(pause_pressed=True))   # no pausing a shared game
+
+# Where each player starts each life
+START_X = (WIDTH / 2, WIDTH / 2 + 60)
+
+
+class UdpTransport:
+    """A non-blocking UDP socket talking to one peer.  It listens on *bind*
+    (default: the peer's host, which suits loopback; "" for every
+    interface)."""
+
+    def __init__(self, port: int, peer_port: int, host: str = "127.0.0.1",
+                 bind: str = None):
+        self._peer = (host, peer_port)
+        self._sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self._sock.bind((host if bind is None else bind, port))
+        self._sock.setblocking(False)
+
+    def send(self, data: bytes) -> None:
+        try:
+            self._sock.sendto(data, self._peer)
+        except OSError:
+            pass   # peer not listening yet; the data will be resent
+
+    def receive(self) -> list:
+        """Return every datagram waiting on the socket."""
+        datagrams = []
+        while True:
+            try:
+                data, _ = self._sock.recvfrom(2048)
+            except BlockingIOError:
+                return datagrams
+            except OSError:
+                continue   # e.g. ICMP port unreachable reported on Windows
+            datagrams.append(data)
+
+    def close(self) -> None:
+        self._sock.close()
+
+
+class LatencyShim:
+    """Wraps a transport, delaying each outgoing datagram by *latency* ±
+    *jitter* seconds and dropping a fraction *loss* of them."""
+
+    def __init__(self, transport, latency: float = 0.0, jitter: float = 0.0,
+                 loss: float = 0.0, seed: int = 0):
+        self._transport = transport
+        self._latency = latency
+        self._jitter = jitter
+        self._loss = loss
+        self._rng = random.Random(seed)
+        self._queue = []   # heap of (due time, sequence, datagram)
+        self._sequence = 0
+
+    def send(self, data: bytes) -> None:
+        if self._rng.random() >= self._loss:
+            delay = max(0.0, self._latency + self._rng.uniform(-self._jitter, self._jitter))
+            heapq.heappush(self._queue, (time.perf_counter() + delay, self._sequence, data))
+            self._sequence += 1
+        self._flush()
+
+    def receive(self) -> list:
+        self._flush()
+        return self._transport.receive()
+
+    def close(self) -> None:
+        self._transport.close()
+
+    def _flush(self) -> None:
+        now = time.perf_counter()
+        queue = self._queue
+        while queue and queue[0][0] <= now:
+            self._transport.send(heapq.heappop(queue)[2])
+
+
+class RollbackSession:
+    """Runs one side of a two-player game.  Call advance() once per tick.
+
+    Both sides must use the same *match* number (0-255), and a new one for
+    each game played over the same transport.
+    """
+
+    def __init__(self, game, local_index: int, transport,
+                 input_delay: int = 2, max_rollback: int = 8, match: int = 0):
+        self.game = game
+        self.local_index = local_index
+        self.transport = transport
+        self.max_rollback = max_rollback
+        self.match = match & 0xFF
+        self.frame = 0   # next frame to simulate
+
+        # Packed inputs by frame.  The first input_delay frames are idle,
+        # so local input is applied input_delay frames after it is read.
+        self._local = [0] * input_delay
+        self._remote = []      # confirmed remote inputs, frames 0..n-1
+        self._predicted = {}   # frame → remote input used before confirmation
+        self._snapshots = {}   # frame → game state before that frame
+        self._remote_ack = 0   # local frames the peer has confirmed
+        self._rollback_from = None
+        self._stalled_presses = 0   # edge bits read while stalled, not yet sent
+
+        # Statistics
+        self.stalls = 0
+        self.rollbacks = 0
+        self.resimulated_frames = 0
+        self.max_rollback_frames = 0
+        self.max_rollback_ms = 0.0
+
+    @property
+    def confirmed_frame(self) -> int:
+        """Frames for which both players' inputs are known."""
+        return min(len(self._remote), len(self._local))
+
+    def advance(self, input_state) -> bool:
+        """Send this tick's local input and simulate one frame.
+
+        Returns False, without simulating, while waiting for the peer to
+        catch up.  Any press in *input_state* is then kept and sent with
+        the input of the next frame that is simulated.
+        """
+        bits = pack_input(input_state) & ~_PAUSE_BIT
+        if self.frame - len(self._remote) >= self.max_rollback:
+            self.poll()
+            if self.frame - len(self._remote) >= self.max_rollback:
+                self.stalls += 1
+                self._stalled_presses |= bits & _EDGE_BITS
+                return False
+
+        self._local.append(bits | self._stalled_presses)
+        self._stalled_presses = 0
+        self.poll()
+        self._step(self.frame)
+        self.frame += 1
+        return True
+
+    def poll(self) -> None:
+        """Exchange inputs and roll back if a prediction was wrong."""
+        self._send()
+        self._receive()
+        if self._rollback_from is not None:
+            self._rollback()
+        # States before the last confirmed frame are never rolled back to
+        for frame in [f for f in self._snapshots if f < len(self._remote)]:
+            del self._snapshots[frame]
+
+    def synchronize(self, timeout: float = 5.0, linger: float = 0.2) -> bool:
+        """Keep exchanging until every simulated frame is confirmed on both
+        sides.  Then keep answering for *linger* seconds so the peer hears
+        the final acknowledgement.  Returns False on timeout."""
+        deadline = time.perf_counter() + timeout
+        while time.perf_counter() < deadline:
+            self.poll()
+            if len(self._remote) >= self.frame and self._remote_ack >= self.frame:
+                end = time.perf_counter() + linger
+                while time.perf_counter() < end:
+                    self.poll()
+                    time.sleep(0.005)
+                return True
+            time.sleep(0.001)
+        return False
+
+    def checksum(self) -> int:
+        """CRC-32 of the current game state, for desync checks."""
+        return zlib.crc32(self.game.snapshot())
+
+    # ------------------------------------------------------------------
+
+    def _inputs(self, frame: int):
+        """The (player one, player two) InputStates for *frame*."""
+        local = self._local[frame]
+        if frame < len(self._remote):
+            remote = self._remote[frame]
+        else:
+            remote = self._remote[-1] & ~_EDGE_BITS if self._remote else 0
+            self._predicted[frame] = remote
+        pair = [None, None]
+        pair[self.local_index] = unpack_input(local)
+        pair[1 - self.local_index] = unpack_input(remote)
+        return pair
+
+    def _step(self, frame: int) -> None:
+        self._snapshots[frame] = self.game.snapshot()
+        self.game.update(*self._inputs(frame))
+
+    def _replayed_inputs(self, start: int):
+        """Inputs for frames *start* up to the present, snapshotting the
+        state before each one as it is replayed."""
+        for frame in range(start, self.frame):
+            self._snapshots[frame] = self.game.snapshot()
+            yield self._inputs(frame)
+
+    def _rollback(self) -> None:
+        start_time = time.perf_counter()
+        start = self._rollback_from
+        self._rollback_from = None
+        self.game.restore(self._snapshots[start])
+        self.game.resimulate(self._replayed_inputs(start))
+
+        frames = self.frame - start
+        elapsed = (time.perf_counter() - start_time) * 1000
+        self.rollbacks += 1
+        self.resimulated_frames += frames
+        self.max_rollback_frames = max(self.max_rollback_frames, frames)
+        self.max_rollback_ms = max(self.max_rollback_ms, elapsed)
+
+    def _send(self) -> None:
+        first = self._remote_ack
+        inputs = self._local[first:first + MAX_INPUTS_PER_PACKET]
+        header = _PACKET.pack(MAGIC, self.match, first, len(self._remote), len(inputs))
+        self.transport.send(header + bytes(inputs))
+
+    def _receive(self) -> None:
+        remote = self._remote
+        for data in self.transport.receive():
+            if len(data) < _PACKET.size:
+                continue
+            magic, match, first, ack, count = _PACKET.unpack_from(data)
+            if magic != MAGIC or match != self.match or len(data) != _PACKET.size + count:
+                continue
+            self._remote_ack = max(self._remote_ack, ack)
+            # Only the next expected frames are taken; anything after a gap
+            # is resent until acknowledged
+            for frame in range(len(remote), first + count):
+                if frame < first:
+                    break
+                bits = data[_PACKET.size + frame - first]
+                remote.append(bits)
+                predicted = self._predicted.pop(frame, None)
+                if predicted is not None and predicted != bits:
+                    if self._rollback_from is None or frame < self._rollback_from:
+                        self._rollback_from = frame
+
+
+def main(argv=None) -> None:
+    from src.entities.player import Player
+    from src.game import Game
+    from src.scripted import scripted_inputs
+
+    parser = argparse.ArgumentParser(description="Headless two-player rollback test")
+    parser.add_argument("--player", type=int, choices=(0, 1), required=True)
+    parser.add_argument("--port", type=int, required=True)
+    parser.add_argument("--peer-port", type=int, required=True)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--frames", type=int, default=1200)
+    parser.add_argument("--latency", type=float, default=0.0, help="one-way, ms")
+    parser.add_argument("--jitter", type=float, default=0.0, help="ms")
+    parser.add_argument("--loss", type=float, default=0.0, help="fraction dropped")
+    args = parser.parse_args(argv)
+
+    transport = UdpTransport(args.port, args.peer_port)
+    if args.latency or args.jitter or args.loss:
+        transport = LatencyShim(transport, args.latency / 1000, args.jitter / 1000,
+                                args.loss, seed=args.player)
+    game = Game(Player(START_X[0]), args.seed, Player(START_X[1]))
+    session = RollbackSession(game, args.player, transport)
+
+    inputs = scripted_inputs(args.seed * 2 + args.player)
+    interval = 1 / 60
+    deadline = time.perf_counter()
+    while session.frame < args.frames:
+        session.advance(next(inputs))
+        deadline += interval
+        delay = deadline - time.perf_counter()
+        if delay > 0:
+            time.sleep(delay)
+
+    synced = session.synchronize()
+    transport.close()
+    print(
+        f"player {args.player}: frames {session.frame} "
+        f"checksum {session.checksum():08x} synced {synced} "
+        f"stalls {session.stalls} rollbacks {session.rollbacks} "
+        f"resimulated {session.resimulated_frames} "
+        f"max {session.max_rollback_frames} frames / {session.max_rollback_ms:.2f} ms"
+    )
+
+
+if __name__ == "__main__":
+    main()
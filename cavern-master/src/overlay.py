@@ -0,0 +1,54 @@
+"""
+overlay.py — Cached translucent overlays and frozen scenes.
+
+translucent() returns a solid-colour surface with per-pixel alpha for
+dimming the screen.  Each (size, colour) is built once and reused, instead
+of allocating and filling a screen-sized surface on every frame.
+
+FrozenScene holds a copy of a finished frame.  A screen whose contents
+stop changing, such as a paused game, captures itself once and afterwards
+restores only the regions it still draws over.  No entity or HUD is redrawn
+until it thaws.
+"""
+
+_translucent = {}   # (size, rgba) → pygame.Surface
+
+
+def translucent(size: tuple, rgba: tuple):
+    """A *size* surface filled with the colour *rgba*, alpha included."""
+    key = (size, rgba)
+    surface = _translucent.get(key)
+    if surface is None:
+        import pygame
+        surface = pygame.Surface(size, pygame.SRCALPHA)
+        surface.fill(rgba)
+        surface = _translucent[key] = surface.convert_alpha()
+    return surface
+
+
+class FrozenScene:
+    """A snapshot of the screen, restored in part or in whole."""
+
+    def __init__(self):
+        self._image = None
+        self._target = None   # the display surface the snapshot was taken of
+
+    def frozen_for(self, screen) -> bool:
+        """True if a snapshot of *screen*'s current surface is held.  A new
+        display surface (e.g. after a mode change) needs a new snapshot."""
+        return self._image is not None and self._target is screen.surface
+
+    def freeze(self, screen) -> None:
+        self._target = screen.surface
+        self._image = self._target.copy()
+
+    def thaw(self) -> None:
+        self._image = None
+        self._target = None
+
+    def restore(self, screen, rect=None) -> None:
+        """Copy the snapshot back over *rect* (x, y, w, h), or the whole screen."""
+        if rect is None:
+            screen.surface.blit(self._image, (0, 0))
+        else:
+            screen.surface.blit(self._image, rect[:2], rect)
@@ -0,0 +1,68 @@
+"""
+pool.py — Entity pooling and in-place list compaction.
+
+Bolts, pops, orbs and fruit are short-lived: dozens are created and dropped
+every second in a busy level.  A Pool keeps expired objects on a free list
+and hands them out again instead of allocating new ones, and compact()
+prunes an entity list in place, releasing what it removes to the pool, so
+the per-frame path builds no new lists.
+"""
+
+
+class Pool:
+    """A free list of recycled entities of one class.
+
+    acquire() re-initialises a recycled object in place by calling its
+    ``__init__`` again, so a pooled object is always indistinguishable from a
+    freshly constructed one and pooled classes need no separate reset code.
+
+    ``reissued`` collects the recycled objects handed out since the owner
+    last cleared it.  It holds only objects from this pool, so it never
+    grows past the pool's population.
+    """
+
+    def __init__(self, cls):
+        self.cls = cls
+        self._free = []
+        self.reissued = set()
+
+    def acquire(self, *args):
+        """Return a ready-to-use instance of the pooled class."""
+        if self._free:
+            obj = self._free.pop()
+            obj.__init__(*args)
+            self.reissued.add(obj)
+            return obj
+        return self.cls(*args)
+
+    def take(self):
+        """Return a recycled object as it is, or a new uninitialised one.
+
+        For callers that set every attribute themselves, such as restoring a
+        snapshot, where re-running ``__init__`` would be wasted work.
+        """
+        if self._free:
+            obj = self._free.pop()
+            self.reissued.add(obj)
+            return obj
+        return self.cls.__new__(self.cls)
+
+    def release(self, obj) -> None:
+        """Return an expired object to the pool.  It must not be used again."""
+        self._free.append(obj)
+
+    def __len__(self) -> int:
+        return len(self._free)
+
+
+def compact(items: list, keep, pool=None) -> None:
+    """Remove from *items*, in place and preserving order, every object for
+    which ``keep(obj)`` is false, releasing each one to *pool* if given."""
+    j = 0
+    for obj in items:
+        if keep(obj):
+            items[j] = obj
+            j += 1
+        elif pool is not None:
+            pool.release(obj)
+    del items[j:]
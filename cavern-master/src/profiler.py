@@ -0,0 +1,182 @@
+"""
+profiler.py — Per-section frame timing.
+
+Hot paths time themselves only when a Profiler is active:
+
+    prof = profiler.active
+    if prof:
+        prof.begin()
+    ...work...
+    if prof:
+        prof.mark("update.player")   # time since begin() or the last mark
+
+When profiling is off, ``active`` is None and the cost is one global lookup
+and a branch per section.  Nested timings (App.update around Game.update)
+use add() with an explicit perf_counter_ns() start.
+
+Each section accumulates nanoseconds, in one of two series.  Update
+sections are filed per tick: end_tick(), called by App.update after each
+tick, moves their totals into a ring buffer of the last ``history`` ticks.
+Draw sections are filed per drawn frame by end_frame(), called by App.draw.
+The fixed timestep runs anywhere from zero to several ticks per frame, so
+neither series can be charged to the other's slots.  From the rings,
+summary() gives p50/p99 per section, draw_overlay() draws them on screen,
+and dump() writes them to CSV or JSON.
+"""
+
+import json
+from array import array
+from time import perf_counter_ns
+
+active = None   # the running Profiler, or None when profiling is off
+
+# Sections in display order: filed per tick, then per drawn frame
+TICK_SECTIONS = (
+    "app.update",
+    "update.index", "update.fruits", "update.bolts", "update.enemies", "update.pops",
+    "update.orbs", "update.player", "update.prune", "update.spawn",
+)
+FRAME_SECTIONS = (
+    "app.draw",
+    "draw.level", "draw.fruits", "draw.bolts", "draw.enemies", "draw.pops",
+    "draw.orbs", "draw.player", "draw.hud",
+)
+SECTIONS = TICK_SECTIONS + FRAME_SECTIONS
+
+OVERLAY_REFRESH = 30   # frames between overlay text updates
+
+
+def enable(history: int = 600, overlay: bool = False) -> "Profiler":
+    """Start profiling (if not already) and return the active Profiler.
+    With *overlay*, PlayScreen draws the live figures over the game."""
+    global active
+    if active is None:
+        active = Profiler(history)
+    active.overlay = overlay
+    return active
+
+
+def disable() -> None:
+    global active
+    active = None
+
+
+def _percentile(values: list, fraction: float) -> int:
+    return values[min(len(values) - 1, int(len(values) * fraction))]
+
+
+class Profiler:
+    """Per-section nanosecond accumulators with rings of tick and frame
+    histories."""
+
+    def __init__(self, history: int = 600):
+        self.history = history
+        self.overlay = False
+        self.ticks = 0                    # ticks filed
+        self.frames = 0                   # drawn frames filed
+        self._current = dict.fromkeys(SECTIONS, 0)
+        self._rings = {name: array("q", bytes(8 * history)) for name in SECTIONS}
+        self._last = 0
+        self._overlay_text = ""
+
+    # ------------------------------------------------------------------
+    # Recording
+    # ------------------------------------------------------------------
+
+    def begin(self) -> None:
+        self._last = perf_counter_ns()
+
+    def mark(self, section: str) -> None:
+        """Charge the time since begin() or the previous mark to *section*."""
+        now = perf_counter_ns()
+        self._current[section] += now - self._last
+        self._last = now
+
+    def add(self, section: str, ns: int) -> None:
+        self._current[section] += ns
+
+    def end_tick(self) -> None:
+        """File this tick's update totals into the history."""
+        self._file(TICK_SECTIONS, self.ticks)
+        self.ticks += 1
+
+    def end_frame(self) -> None:
+        """File this drawn frame's totals into the history."""
+        self._file(FRAME_SECTIONS, self.frames)
+        self.frames += 1
+
+    def _file(self, sections: tuple, index: int) -> None:
+        slot = index % self.history
+        current = self._current
+        rings = self._rings
+        for name in sections:
+            rings[name][slot] = current[name]
+            current[name] = 0
+
+    def _filed(self, name: str) -> int:
+        """How many ticks or frames *name*'s series has filed."""
+        return self.ticks if name in TICK_SECTIONS else self.frames
+
+    def _history(self, name: str) -> list:
+        """*name*'s recorded values, oldest first."""
+        filed = self._filed(name)
+        count = min(filed, self.history)
+        ring = self._rings[name]
+        return [ring[(filed - count + i) % self.history] for i in range(count)]
+
+    # ------------------------------------------------------------------
+    # Reporting
+    # ------------------------------------------------------------------
+
+    def summary(self) -> dict:
+        """section → {"p50_ms", "p99_ms", "mean_ms"} over the recorded ticks
+        (update sections) or drawn frames (draw sections)."""
+        result = {}
+        for name, ring in self._rings.items():
+            values = sorted(ring[:min(self._filed(name), self.history)]) or [0]
+            result[name] = {
+                "p50_ms": _percentile(values, 0.5) / 1e6,
+                "p99_ms": _percentile(values, 0.99) / 1e6,
+                "mean_ms": sum(values) / len(values) / 1e6,
+            }
+        return result
+
+    def dump(self, path: str) -> None:
+        """Write the summary and the per-tick and per-frame histories to
+        *path*.
+
+        A ``.csv`` path gets one row per recorded tick, then one per drawn
+        frame (oldest first), each led by "tick" or "frame" and its number.
+        There is one column per section, in nanoseconds, left empty in the
+        other series' rows.  Any other path gets JSON holding the summary
+        and the same histories.
+        """
+        history = {name: self._history(name) for name in SECTIONS}
+        if path.endswith(".csv"):
+            with open(path, "w") as f:
+                f.write("series,index," + ",".join(SECTIONS) + "\n")
+                for series, filed, sections in (("tick", self.ticks, TICK_SECTIONS),
+                                                ("frame", self.frames, FRAME_SECTIONS)):
+                    rows = len(history[sections[0]])
+                    for row in range(rows):
+                        values = (str(history[name][row]) if name in sections else ""
+                                  for name in SECTIONS)
+                        f.write(f"{series},{filed - rows + row}," + ",".join(values) + "\n")
+        else:
+            with open(path, "w") as f:
+                json.dump({"ticks": self.ticks, "frames": self.frames,
+                           "summary": self.summary(), "history_ns": history}, f, indent=1)
+
+    def draw_overlay(self, screen) -> None:
+        """Draw p50/p99 per section in the top-left corner of *screen*."""
+        # Percentiles are recomputed every OVERLAY_REFRESH frames; pgzero
+        # caches the rendered text in between
+        if self.frames % OVERLAY_REFRESH == 0 or not self._overlay_text:
+            lines = [f"{'ms':<15}{'p50':>7}{'p99':>7}"]
+            lines += (
+                f"{name:<15}{s['p50_ms']:7.3f}{s['p99_ms']:7.3f}"
+                for name, s in self.summary().items() if s["p99_ms"] > 0
+            )
+            self._overlay_text = "\n".join(lines)
+        screen.draw.text(self._overlay_text, (4, 4), sysfontname="monospace",
+                         fontsize=14, color="white", background="black")
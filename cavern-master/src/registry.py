@@ -0,0 +1,254 @@
+"""
+registry.py — EntityRegistry: the live entities of one Game.
+
+Entities live in typed buckets (plain lists) that keep a fixed order —
+fruits, bolts, enemies, pops, orbs — which is both the update order and the
+draw order.  The per-frame path walks the buckets directly, so no temporary
+concatenated lists are built.  Short-lived entity types are pooled (see
+src/pool.py) and created only through the spawn_* methods.
+
+Entities spawned while the update pass is running (a pop from an expiring
+fruit, a bolt from a robot) are staged and appended to their buckets when
+the pass ends, so they are first updated on the next frame and each bucket
+can be iterated directly.
+
+Orbs are also indexed (src/spatial.py) at the start of every update pass:
+their rects in a spatial hash for bolt hits, and their centres in a band
+index, sorted by x, for robot targeting and capture.  With no more than
+SCAN_ORBS orbs out (the player's normal cap), scanning them is faster than
+refreshing and querying either index, so the queries scan and the indexes
+are left as they were.  Orbs only move during their own updates, which come
+last in the pass, so the indexes stay exact for every entity that queries
+them.
+Each query returns the first matching orb in bucket order — the same orb
+the original linear scans found.
+"""
+
+from itertools import chain
+
+from src.entities.bolt import Bolt
+from src.entities.fruit import Fruit
+from src.entities.orb import Orb
+from src.entities.pop import Pop
+from src import profiler
+from src.pool import Pool, compact
+from src.spatial import BandIndex, SpatialHash, rect_extent
+
+
+# Pruning predicates — an entity is kept while its predicate holds
+def _fruit_alive(f) -> bool:
+    return f.time_to_live > 0
+
+
+def _bolt_alive(b) -> bool:
+    return b.active
+
+
+def _enemy_alive(e) -> bool:
+    return e.alive
+
+
+def _pop_alive(p) -> bool:
+    return p.timer < 12
+
+
+def orb_alive(o) -> bool:
+    return o.timer < Orb.MAX_TIMER and o.y > -40
+
+
+def _never(_) -> bool:
+    return False
+
+
+# Orb counts up to this are scanned rather than indexed
+SCAN_ORBS = 5
+
+# Profiler sections for each bucket's update pass, in bucket order
+_UPDATE_SECTIONS = (
+    "update.fruits", "update.bolts", "update.enemies", "update.pops", "update.orbs",
+)
+
+
+class EntityRegistry:
+    """Typed entity buckets in a stable update/draw order."""
+
+    def __init__(self, rng):
+        self.rng = rng   # the owning Game's simulation stream
+        self.fruits: list[Fruit] = []
+        self.bolts: list[Bolt] = []
+        self.enemies: list = []
+        self.pops: list[Pop] = []
+        self.orbs: list[Orb] = []
+
+        # Short-lived entities are recycled rather than reallocated
+        self.fruit_pool = Pool(Fruit)
+        self.bolt_pool = Pool(Bolt)
+        self.pop_pool = Pool(Pop)
+        self.orb_pool = Pool(Orb)
+
+        # (bucket, keep predicate, pool) in update/draw order
+        self._buckets = (
+            (self.fruits, _fruit_alive, self.fruit_pool),
+            (self.bolts, _bolt_alive, self.bolt_pool),
+            (self.enemies, _enemy_alive, None),
+            (self.pops, _pop_alive, self.pop_pool),
+            (self.orbs, orb_alive, self.orb_pool),
+        )
+        self._lists = tuple(bucket for bucket, _, _ in self._buckets)
+        self._pools = tuple(pool for _, _, pool in self._buckets if pool is not None)
+
+        # Orb indexes: by centre point and by rect.  ``serial`` records each
+        # orb's spawn order, which is also its order in the orbs bucket.
+        self.orb_bands = BandIndex()
+        self.orb_rects = SpatialHash(rect_extent)
+        self._next_orb_serial = 0
+
+        # Spawns made during update_all(), appended when the pass ends
+        self._updating = False
+        self._staged = {id(bucket): [] for bucket in self._lists}
+
+    def __len__(self) -> int:
+        return (
+            len(self.fruits) + len(self.bolts) + len(self.enemies)
+            + len(self.pops) + len(self.orbs)
+        )
+
+    def __iter__(self):
+        """Iterate over every live entity in update/draw order."""
+        return chain(self.fruits, self.bolts, self.enemies, self.pops, self.orbs)
+
+    # ------------------------------------------------------------------
+    # Spawning
+    # ------------------------------------------------------------------
+
+    def spawn_fruit(self, pos, trapped_enemy_type: int = 0) -> Fruit:
+        fruit = self.fruit_pool.acquire(pos, trapped_enemy_type, self.rng)
+        return self._add(self.fruits, fruit)
+
+    def spawn_bolt(self, pos, dir_x: int) -> Bolt:
+        return self._add(self.bolts, self.bolt_pool.acquire(pos, dir_x))
+
+    def spawn_pop(self, pos, type_: int) -> Pop:
+        return self._add(self.pops, self.pop_pool.acquire(pos, type_))
+
+    def spawn_orb(self, pos, dir_x: int) -> Orb:
+        orb = self.orb_pool.acquire(pos, dir_x)
+        orb.serial = self._next_orb_serial
+        self._next_orb_serial += 1
+        return self._add(self.orbs, orb)
+
+    def take_reissued(self) -> set:
+        """The pooled entities recycled for new ones since the last call.
+        Their positions before that are another entity's."""
+        reissued = set()
+        for pool in self._pools:
+            reissued |= pool.reissued
+            pool.reissued.clear()
+        return reissued
+
+    def add_enemy(self, robot):
+        return self._add(self.enemies, robot)
+
+    def _add(self, bucket: list, obj):
+        if self._updating:
+            self._staged[id(bucket)].append(obj)
+        else:
+            bucket.append(obj)
+        return obj
+
+    # ------------------------------------------------------------------
+    # Per-frame passes
+    # ------------------------------------------------------------------
+
+    def update_all(self, game) -> None:
+        """Update every entity that was alive when the pass started."""
+        prof = profiler.active
+        self.refresh_indexes()
+        if prof:
+            prof.mark("update.index")
+
+        self._updating = True
+        for bucket, section in zip(self._lists, _UPDATE_SECTIONS):
+            for obj in bucket:
+                obj.update(game)
+            if prof:
+                prof.mark(section)
+        self._updating = False
+
+        for bucket in self._lists:
+            staged = self._staged[id(bucket)]
+            if staged:
+                bucket.extend(staged)
+                staged.clear()
+
+    def refresh_indexes(self) -> None:
+        """File the orbs' current positions for this pass's queries."""
+        orbs = self.orbs
+        if len(orbs) > SCAN_ORBS:
+            self.orb_bands.refresh(orbs)
+            self.orb_rects.refresh(orbs)
+
+    def prune(self) -> None:
+        """Drop expired entities in place, recycling pooled ones."""
+        for bucket, keep, pool in self._buckets:
+            compact(bucket, keep, pool)
+
+    def clear(self) -> None:
+        """Remove every entity, recycling pooled ones."""
+        for bucket, _, pool in self._buckets:
+            compact(bucket, _never, pool)
+
+    # ------------------------------------------------------------------
+    # Orb queries (valid during update_all)
+    # ------------------------------------------------------------------
+
+    def orb_at(self, point):
+        """The first orb whose rect contains *point*, or None."""
+        if len(self.orbs) <= SCAN_ORBS:
+            for orb in self.orbs:
+                if orb.collidepoint(point):
+                    return orb
+            return None
+        found = None
+        for orb in self.orb_rects.at(*point):
+            if orb.collidepoint(point) and (found is None or orb.serial < found.serial):
+                found = orb
+        return found
+
+    def free_orb_centred_in(self, body):
+        """The first orb with no trapped enemy whose centre lies inside
+        *body*'s rect, or None."""
+        if len(self.orbs) <= SCAN_ORBS:
+            for orb in self.orbs:
+                if orb.trapped_enemy_type is None and body.collidepoint(orb.center):
+                    return orb
+            return None
+        found = None
+        for orbs in self.orb_bands.within(body.left, body.top, body.right, body.bottom):
+            for orb in orbs:
+                if (
+                    orb.trapped_enemy_type is None
+                    and body.collidepoint(orb.center)
+                    and (found is None or orb.serial < found.serial)
+                ):
+                    found = orb
+        return found
+
+    def orb_in_band(self, top: float, bottom: float, x: float, reach: float):
+        """The first orb with top <= y < bottom and |orb.x - x| < reach, or
+        None."""
+        if len(self.orbs) <= SCAN_ORBS:
+            for orb in self.orbs:
+                if top <= orb.y < bottom and abs(orb.x - x) < reach:
+                    return orb
+            return None
+        found = None
+        for orbs in self.orb_bands.within(x - reach, top, x + reach, bottom):
+            for orb in orbs:
+                if (
+                    top <= orb.y < bottom
+                    and abs(orb.x - x) < reach
+                    and (found is None or orb.serial < found.serial)
+                ):
+                    found = orb
+        return found
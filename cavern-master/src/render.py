@@ -0,0 +1,177 @@
+"""
+render.py — Render adapter between the simulation and a pgzero screen.
+
+Entities are plain Body objects (see src/entities/base.py) and know nothing
+about surfaces.  When a screen is present, this module draws them exactly
+as a pgzero Actor would: the current frame blitted at the rect's top-left.
+Each sprites.Frame resolves its surface through pgzero's image loader the
+first time it is drawn and keeps it, so drawing does no name lookups.
+
+The static part of a level — background plus blocks — never changes while
+the level is being played, so it is composited once into a screen-sized
+surface and drawn with a single blit.
+
+DirtyRectRenderer is an optional play-screen renderer that repaints only
+the regions that changed since the previous frame.
+"""
+
+from collections import Counter
+
+from src.constants import GRID_BLOCK_SIZE, HEIGHT, LEVEL_X_OFFSET, NUM_ROWS, WIDTH
+
+_level_layers = {}   # (level key, colour) → pygame.Surface, oldest first
+MAX_LEVEL_LAYERS = 8
+
+
+def frame_surface(frame):
+    """Return the pygame surface for a sprites.Frame, loading it once."""
+    surface = frame.surface
+    if surface is None:
+        from pgzero.loaders import images
+        surface = frame.surface = images.load(frame.name)
+    return surface
+
+
+def draw_entity(screen, body) -> None:
+    """Blit *body*'s current frame at its top-left corner."""
+    screen.blit(frame_surface(body.frame), body.topleft)
+
+
+def preload_images() -> None:
+    """Load every image up front (pgzero's loader keeps them), so the first
+    frame of a screen never waits on the disk."""
+    from pgzero.loaders import images
+    from src.sprites import IMAGE_NAMES
+
+    for name in IMAGE_NAMES:
+        images.load(name)
+
+
+def level_layer(level_map, colour: int):
+    """Return the background-plus-blocks surface for a level, building it on
+    first use.  Layers are keyed by (level content hash, colour).  Level
+    packs can hold hundreds of layouts, so only the MAX_LEVEL_LAYERS most
+    recently used layers are kept.
+    """
+    key = (level_map.key, colour)
+    layer = _level_layers.pop(key, None)
+    if layer is None:
+        layer = _build_level_layer(level_map, colour)
+        if len(_level_layers) >= MAX_LEVEL_LAYERS:
+            del _level_layers[next(iter(_level_layers))]
+    _level_layers[key] = layer
+    return layer
+
+
+def _build_level_layer(level_map, colour: int):
+    import pygame
+    from pgzero.loaders import images
+
+    layer = pygame.Surface((WIDTH, HEIGHT)).convert()
+    layer.blit(images.load("bg%d" % colour), (0, 0))
+
+    block_sprite = images.load("block%d" % colour)
+    for row_y in range(NUM_ROWS):
+        x = LEVEL_X_OFFSET
+        for blk in level_map.grid[row_y]:
+            if blk != " ":
+                layer.blit(block_sprite, (x, row_y * GRID_BLOCK_SIZE))
+            x += GRID_BLOCK_SIZE
+    return layer
+
+
+class DirtyRectRenderer:
+    """Redraws only the regions of the play screen that changed.
+
+    Each frame the scene is reduced to draw commands — (frame, left, top,
+    width, height) per entity — plus a HUD key.  Commands that appeared or
+    disappeared since the previous frame mark their bounds dirty, as do
+    the HUD strips (*hud_rects*) when the key changes.  Each dirty region is restored from
+    the cached level layer, then every entity overlapping it and the HUD are
+    drawn clipped to it, so the result is pixel-identical to a full redraw.
+
+    draw() returns the list of rects that changed, ready for
+    ``pygame.display.update(rects)``.
+    """
+
+    def __init__(self, hud_rects):
+        self._hud_rects = hud_rects
+        self._layer = None
+        self._commands = []
+        self._hud_key = None
+
+    def invalidate(self) -> None:
+        """Force a full redraw on the next frame (e.g. after an overlay)."""
+        self._layer = None
+
+    def draw(self, screen, game, hud_key, draw_hud) -> list:
+        """Bring *screen* up to date with *game* and return the dirty rects.
+
+        *draw_hud* is called with the screen to draw the HUD; *hud_key* is any
+        value that changes whenever the HUD's appearance does.
+        """
+        import pygame
+
+        layer = level_layer(game.level_map, game.level_colour)
+        commands = [
+            (body.frame, body.left, body.top, body.width, body.height)
+            for body in game.drawables()
+        ]
+
+        if layer is not self._layer:
+            # New level (or invalidated) — repaint everything
+            screen.blit(layer, (0, 0))
+            for f, left, top, _, _ in commands:
+                screen.blit(frame_surface(f), (left, top))
+            draw_hud(screen)
+            dirty = [pygame.Rect(0, 0, WIDTH, HEIGHT)]
+        else:
+            dirty = self._changed_rects(commands, hud_key)
+            surface = screen.surface
+            for rect in dirty:
+                surface.set_clip(rect)
+                surface.blit(layer, rect, rect)
+                for command in commands:
+                    if rect.colliderect(_bounds(command)):
+                        screen.blit(frame_surface(command[0]), (command[1], command[2]))
+                if rect.collidelist(self._hud_rects) != -1:
+                    draw_hud(screen)
+            surface.set_clip(None)
+
+        self._layer = layer
+        self._commands = commands
+        self._hud_key = hud_key
+        return dirty
+
+    def _changed_rects(self, commands, hud_key) -> list:
+        import pygame
+
+        rects = []
+        if commands != self._commands:
+            previous, current = Counter(self._commands), Counter(commands)
+            changed = (previous - current) + (current - previous)
+            rects = [_bounds(command) for command in changed.elements()]
+        if hud_key != self._hud_key:
+            rects += map(pygame.Rect, self._hud_rects)
+
+        # Merge overlapping rects so no region is repainted twice
+        screen_rect = pygame.Rect(0, 0, WIDTH, HEIGHT)
+        merged = []
+        for rect in rects:
+            rect = rect.clip(screen_rect)
+            if not rect.width or not rect.height:
+                continue
+            i = rect.collidelist(merged)
+            while i != -1:
+                rect = rect.union(merged.pop(i))
+                i = rect.collidelist(merged)
+            merged.append(rect)
+        return merged
+
+
+def _bounds(command):
+    """Pixel rect covering a draw command, padded for sub-pixel positions."""
+    import pygame
+
+    _, left, top, width, height = command
+    return pygame.Rect(int(left) - 1, int(top) - 1, width + 2, height + 2)
@@ -0,0 +1,196 @@
+"""
+replay.py — Compact input recordings and a replay driver.
+
+A session is fully determined by its seed and the InputState fed to
+App.update each frame, so a recording is just those two things.  Each
+InputState packs into seven bits; consecutive identical frames are stored
+as one run.  The file format is:
+
+    b"CAVR"  version:u8  seed:u64  frames:u32     (little-endian header)
+    run*
+
+where each run is a byte holding the input bits.  If its high bit is set
+the run is one frame long (the common case for edge-triggered presses);
+otherwise a LEB128 varint with the run length follows.  Idle stretches and
+held keys cost two or three bytes however long they last.
+
+Replays run headless through App.update, either as fast as possible or
+paced to the game's 60 frames per second:
+
+    python -m src.replay session.cavrec [--realtime]
+"""
+
+import struct
+import sys
+import time
+from dataclasses import fields
+
+from src.input import InputState
+
+MAGIC = b"CAVR"
+# A recording only replays correctly against the gameplay it was made
+# with, so this changes whenever the simulation does (2: robot pathing)
+VERSION = 2
+FPS = 60
+
+_HEADER = struct.Struct("<4sBQI")
+_SINGLE = 0x80   # run-byte flag: run length is 1, no varint follows
+
+# InputState fields in bit order (bit 0 first)
+_FIELDS = tuple(f.name for f in fields(InputState))
+
+
+def pack_input(state: InputState) -> int:
+    """Pack an InputState into a 7-bit integer."""
+    bits = 0
+    for i, name in enumerate(_FIELDS):
+        if getattr(state, name):
+            bits |= 1 << i
+    return bits
+
+
+def unpack_input(bits: int) -> InputState:
+    """Inverse of pack_input()."""
+    return InputState(**{name: bool(bits >> i & 1) for i, name in enumerate(_FIELDS)})
+
+
+class InputRecorder:
+    """Accumulates one InputState per frame as run-length encoded bits."""
+
+    def __init__(self, seed: int):
+        if not 0 <= seed < 1 << 64:
+            raise ValueError(f"Recording seeds must fit in 64 bits: {seed!r}")
+        self.seed = seed
+        self.frames = 0
+        self._runs = []       # [bits, length] pairs
+        self._bits = None     # bits of the run in progress
+
+    def record(self, state: InputState) -> None:
+        bits = pack_input(state)
+        if bits == self._bits:
+            self._runs[-1][1] += 1
+        else:
+            self._runs.append([bits, 1])
+            self._bits = bits
+        self.frames += 1
+
+    def to_bytes(self) -> bytes:
+        out = bytearray(_HEADER.pack(MAGIC, VERSION, self.seed, self.frames))
+        for bits, length in self._runs:
+            if length == 1:
+                out.append(bits | _SINGLE)
+                continue
+            out.append(bits)
+            while length >= 0x80:
+                out.append(length & 0x7F | 0x80)
+                length >>= 7
+            out.append(length)
+        return bytes(out)
+
+    def save(self, path: str) -> None:
+        with open(path, "wb") as f:
+            f.write(self.to_bytes())
+
+
+class Recording:
+    """A decoded recording: the seed and a list of (bits, run length) runs."""
+
+    def __init__(self, seed: int, runs: list):
+        self.seed = seed
+        self.runs = runs
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "Recording":
+        if len(data) < _HEADER.size:
+            raise ValueError("Truncated recording header")
+        magic, version, seed, frames = _HEADER.unpack_from(data)
+        if magic != MAGIC:
+            raise ValueError("Not a Cavern input recording")
+        if version != VERSION:
+            raise ValueError(f"Unsupported recording version: {version}")
+
+        runs = []
+        total = 0
+        pos = _HEADER.size
+        end = len(data)
+        try:
+            while pos < end:
+                byte = data[pos]
+                pos += 1
+                if byte & _SINGLE:
+                    length = 1
+                else:
+                    length = shift = 0
+                    while True:
+                        part = data[pos]
+                        pos += 1
+                        length |= (part & 0x7F) << shift
+                        shift += 7
+                        if not part & 0x80:
+                            break
+                runs.append((byte & 0x7F, length))
+                total += length
+        except IndexError:
+            raise ValueError("Truncated recording data") from None
+        if total != frames:
+            raise ValueError(f"Recording holds {total} frames, header says {frames}")
+        return cls(seed, runs)
+
+    @classmethod
+    def load(cls, path: str) -> "Recording":
+        with open(path, "rb") as f:
+            return cls.from_bytes(f.read())
+
+    def __len__(self) -> int:
+        return sum(length for _, length in self.runs)
+
+    def __iter__(self):
+        """Yield one InputState per recorded frame."""
+        for bits, length in self.runs:
+            state = unpack_input(bits)
+            for _ in range(length):
+                yield state
+
+
+def replay(recording: Recording, app=None, realtime: bool = False):
+    """Feed every recorded frame to ``app.update`` and return the app.
+
+    A new App seeded from the recording is created when *app* is None.
+    With *realtime* the frames are paced at FPS; otherwise they run as
+    fast as the simulation allows.  Nothing is drawn.
+    """
+    if app is None:
+        from src.app import App
+        app = App(seed=recording.seed)
+
+    interval = 1 / FPS
+    deadline = time.perf_counter()
+    for state in recording:
+        app.update(state)
+        if realtime:
+            deadline += interval
+            delay = deadline - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+    return app
+
+
+def main(argv=None) -> None:
+    args = sys.argv[1:] if argv is None else argv
+    realtime = "--realtime" in args
+    paths = [a for a in args if a != "--realtime"]
+    if len(paths) != 1:
+        print("usage: python -m src.replay RECORDING [--realtime]")
+        sys.exit(2)
+
+    recording = Recording.load(paths[0])
+    start = time.perf_counter()
+    replay(recording, realtime=realtime)
+    elapsed = time.perf_counter() - start
+    frames = len(recording)
+    print(f"{frames} frames (seed {recording.seed}) in {elapsed:.2f}s "
+          f"— {frames / max(elapsed, 1e-9):.0f} frames/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -4,35 +4,28 @@ screens/game_over.py — GameOverScreen
 Shows the "Game Over" overlay.  Pressing SPACE returns to the menu.
 """
 
-from src.game import Game
-
-CHAR_WIDTH = [27, 26, 25, 26, 25, 25, 26, 25, 12, 26, 26, 25, 33, 25, 26,
-              25, 27, 26, 26, 25, 26, 26, 38, 25, 25, 25]
+from src.text import CHAR_WIDTH, draw_text
 
 WIDTH = 800
-IMAGE_WIDTH = {"life": 44, "plus": 40, "health": 40}
-
-
-def char_width(char):
-    index = max(0, ord(char) - 65)
-    return CHAR_WIDTH[index]
 
 
-def draw_text(screen, text, y, x=None):
-    if x is None:
-        x = (WIDTH - sum(char_width(c) for c in text)) // 2
-    for char in text:
-        screen.blit("font0" + str(ord(char)), (x, y))
-        x += char_width(char)
+class GameOverScreen:
+    """Displayed after the player loses all lives.  Built once by App and
+    reused."""
 
+    def __init__(self, bg_game):
+        # The attract game shared with MenuScreen keeps running behind
+        self._bg_game = bg_game
+        self.enter()
 
-class GameOverScreen:
-    """Displayed after the player loses all lives."""
+    def enter(self, score=0):
+        """Called each time App switches to this screen."""
+        self._score = str(score)
+        self._score_x = WIDTH - 2 - CHAR_WIDTH[0] * len(self._score)
 
-    def __init__(self, score=0):
-        # Keep a frozen game in the background
-        self._bg_game = Game()
-        self._score = score
+    @property
+    def game(self):
+        return self._bg_game
 
     def update(self, input_state, app):
         self._bg_game.update()   # background animation keeps ticking
@@ -46,7 +39,5 @@ class GameOverScreen:
         screen.blit("over", (0, 0))
 
     def _draw_score(self, screen):
-        number_width = CHAR_WIDTH[0]
-        s = str(self._score)
-        draw_text(screen, s, 451, WIDTH - 2 - (number_width * len(s)))
+        draw_text(screen, self._score, 451, self._score_x)
         draw_text(screen, "LEVEL 1", 451)
\ No newline at end of file
@@ -5,15 +5,21 @@ Displays the title overlay while a playerless demo Game runs in the background.
 Transitions to PlayScreen when SPACE is pressed.
 """
 
-from src.game import Game
-
 
 class MenuScreen:
-    """Title / attract screen."""
+    """Title / attract screen.  Built once by App and reused."""
+
+    def __init__(self, bg_game):
+        # A playerless game runs in the background for the animated level;
+        # App shares it with GameOverScreen
+        self._bg_game = bg_game
+
+    def enter(self):
+        """Called each time App switches to this screen."""
 
-    def __init__(self):
-        # A playerless game runs in the background for the animated level
-        self._bg_game = Game()
+    @property
+    def game(self):
+        return self._bg_game
 
     def update(self, input_state, app):
         # Animate the background demo
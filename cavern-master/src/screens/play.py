@@ -2,109 +2,187 @@
 screens/play.py — PlayScreen
 
 Active gameplay screen.  Handles pause (P key) and detects game-over.
+The screen is built ahead of time (see src/app.py) with its Game muted;
+enter() starts it, level sound included.
+Optionally renders with a DirtyRectRenderer, repainting only what changed.
+While paused, the dimmed scene is captured once and only the banner is
+redrawn.
+
+Given a netplay peer, the screen plays two-player co-op instead: the Game
+has both players and is stepped by a RollbackSession (src/netplay.py).
+Player two's score, lives and health get their own strip along the top of
+the screen.  A shared game can't be paused.
 """
 
+from time import perf_counter_ns
+
+import src.profiler as _profiler
+from src.audio import SOUND_LEVEL, SOUND_OVER
 from src.game import Game
 from src.entities.player import Player
-
-# Character widths and drawing helpers live here too (originally in cavern.py)
-CHAR_WIDTH = [27, 26, 25, 26, 25, 25, 26, 25, 12, 26, 26, 25, 33, 25, 26,
-              25, 27, 26, 26, 25, 26, 26, 38, 25, 25, 25]
+from src.netplay import START_X, RollbackSession
+from src.overlay import FrozenScene, translucent
+from src.render import DirtyRectRenderer
+from src.text import CHAR_WIDTH, draw_images, draw_text, text_rect
 
 WIDTH = 800
 HEIGHT = 480
 
 IMAGE_WIDTH = {"life": 44, "plus": 40, "health": 40}
 
+# Strip along the bottom of the screen covered by score, level and lives
+HUD_RECT = (0, 450, WIDTH, HEIGHT - 450)
+# Player two's score, lives and health, along the top in co-op
+HUD2_RECT = (0, 0, WIDTH, HEIGHT - 450)
 
-def char_width(char):
-    index = max(0, ord(char) - 65)
-    return CHAR_WIDTH[index]
-
-
-def draw_text(screen, text, y, x=None):
-    if x is None:
-        x = (WIDTH - sum(char_width(c) for c in text)) // 2
-    for char in text:
-        screen.blit("font0" + str(ord(char)), (x, y))
-        x += char_width(char)
+# Seconds a finished co-op game waits for the peer to confirm the last frames
+GAME_OVER_SYNC = 1.0
 
+PAUSE_TINT = (0, 0, 0, 140)   # dims the frozen game
+PAUSE_Y = HEIGHT // 2 - 20    # top of the "PAUSED" banner
 
-def draw_status(screen, player):
-    number_width = CHAR_WIDTH[0]
-    s = str(player.score)
-    draw_text(screen, s, 451, WIDTH - 2 - (number_width * len(s)))
 
-    draw_text(screen, "LEVEL " + str(player._level_ref + 1), 451)
-
-    lives_health = ["life"] * min(2, player.lives)
-    if player.lives > 2:
-        lives_health.append("plus")
-    if player.lives >= 0:
-        lives_health += ["health"] * player.health
-
-    x = 0
-    for image in lives_health:
-        screen.blit(image, (x, 450))
-        x += IMAGE_WIDTH[image]
+def hud_layout(score: int, level: int, lives: int, health: int) -> tuple:
+    """(score text, its x, level text, life/health icon names) for the HUD."""
+    s = str(score)
+    icons = ["life"] * min(2, lives)
+    if lives > 2:
+        icons.append("plus")
+    if lives >= 0:
+        icons += ["health"] * health
+    return s, WIDTH - 2 - CHAR_WIDTH[0] * len(s), "LEVEL " + str(level + 1), tuple(icons)
 
 
 class PlayScreen:
-    """Active gameplay with optional pause."""
-
-    def __init__(self):
-        player = Player()
-        self.game = Game(player)
+    """Active gameplay with optional pause.
+
+    *netplay* is None for a single-player game, or (local player index,
+    transport, match number) to play co-op against a remote peer.
+    """
+
+    def __init__(self, dirty_rects=False, seed=None, levels=None, netplay=None):
+        if netplay is None:
+            self.game = Game(Player(), seed, levels=levels, muted=True)
+            self._session = None
+            hud_rects = (HUD_RECT,)
+        else:
+            local_index, transport, match = netplay
+            self.game = Game(Player(START_X[0]), seed, Player(START_X[1]), levels=levels,
+                             muted=True)
+            self._session = RollbackSession(self.game, local_index, transport, match=match)
+            hud_rects = (HUD_RECT, HUD2_RECT)
         self._paused = False
+        self._dirty = DirtyRectRenderer(hud_rects) if dirty_rects else None
+        self._hud_key = None   # (score, level, lives, health) per player, of _hud
+        self._hud = None
+        self._frozen = FrozenScene()   # the dimmed scene while paused
+
+    def enter(self):
+        """Called when App switches to this screen: the game starts."""
+        self.game.muted = False
+        self.game.play_sound(SOUND_LEVEL)
 
     def update(self, input_state, app):
         # Toggle pause (P edge)
-        if input_state.pause_pressed:
+        if input_state.pause_pressed and self._session is None:
             self._paused = not self._paused
+            self._frozen.thaw()
+            if self._dirty:
+                self._dirty.invalidate()   # overlay covers the whole screen
 
         if self._paused:
             return  # simulation frozen
 
-        # Check for game over before updating
-        if self.game.player.lives < 0:
-            self.game.play_sound("over")
-            app.change_screen("game_over", score=self.game.player.score)
+        # Check for game over before updating.  In co-op a predicted
+        # game over may still be rolled back, so only a confirmed one counts.
+        session = self._session
+        if self.game.game_over and (
+                session is None or session.confirmed_frame >= session.frame):
+            if session:
+                session.synchronize(GAME_OVER_SYNC)
+            self.game.play_sound(SOUND_OVER)
+            score = sum(player.score for player in self.game.players)
+            app.change_screen("game_over", score=score)
             return
 
-        self.game.update(input_state)
+        if session:
+            session.advance(input_state)
+        else:
+            self.game.update(input_state)
 
     def draw(self, screen):
+        """Draw the frame.  Returns the changed rects in dirty-rect mode,
+        otherwise None (the whole screen changed)."""
+        if self._paused:
+            return self._draw_paused(screen)
+
+        if self._dirty:
+            rects = self._draw_dirty(screen)
+            if self._draw_profile(screen):
+                self._dirty.invalidate()   # repaint under the overlay next frame
+                return None
+            return rects
+
         self.game.draw(screen)
         self._draw_status(screen)
-
-        if self._paused:
-            # Semi-transparent pause banner
-            self._draw_pause_overlay(screen)
+        self._draw_profile(screen)
+
+    def _draw_paused(self, screen):
+        """The game can't change while paused.  The first paused frame is
+        drawn in full, dimmed and captured; after that only the banner is
+        restored and drawn again (plus the profiler overlay, if shown)."""
+        frozen = self._frozen
+        prof = _profiler.active
+        if not frozen.frozen_for(screen):
+            self.game.draw(screen)
+            self._draw_status(screen)
+            screen.surface.blit(translucent((WIDTH, HEIGHT), PAUSE_TINT), (0, 0))
+            frozen.freeze(screen)
+        elif prof and prof.overlay:
+            frozen.restore(screen)
+        else:
+            banner = text_rect("PAUSED", PAUSE_Y)
+            frozen.restore(screen, banner)
+            draw_text(screen, "PAUSED", PAUSE_Y)
+            return [banner] if self._dirty else None
+
+        draw_text(screen, "PAUSED", PAUSE_Y)
+        self._draw_profile(screen)
+        return None
+
+    def _draw_profile(self, screen) -> bool:
+        """Draw the profiler overlay if it is enabled; True if drawn."""
+        prof = _profiler.active
+        if prof and prof.overlay:
+            prof.draw_overlay(screen)
+            return True
+        return False
+
+    def _draw_dirty(self, screen):
+        return self._dirty.draw(screen, self.game, self._status_key(), self._draw_status)
 
     # ------------------------------------------------------------------
+    def _status_key(self) -> tuple:
+        level = self.game.level
+        return tuple((p.score, level, p.lives, p.health) for p in self.game.players)
+
     def _draw_status(self, screen):
-        player = self.game.player
-        number_width = CHAR_WIDTH[0]
-        s = str(player.score)
-        draw_text(screen, s, 451, WIDTH - 2 - (number_width * len(s)))
-
-        draw_text(screen, "LEVEL " + str(self.game.level + 1), 451)
-
-        lives_health = ["life"] * min(2, player.lives)
-        if player.lives > 2:
-            lives_health.append("plus")
-        if player.lives >= 0:
-            lives_health += ["health"] * player.health
-
-        x = 0
-        for image in lives_health:
-            screen.blit(image, (x, 450))
-            x += IMAGE_WIDTH[image]
-
-    def _draw_pause_overlay(self, screen):
-        # Dark semi-transparent rectangle across the centre
-        import pygame
-        overlay = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 140))
-        screen.surface.blit(overlay, (0, 0))
-        draw_text(screen, "PAUSED", HEIGHT // 2 - 20)
\ No newline at end of file
+        prof = _profiler.active
+        start = perf_counter_ns() if prof else 0
+        # Laid out again only when a value changes; each part is one cached
+        # run (src/text.py), so the HUD is three blits per player
+        key = self._status_key()
+        if key != self._hud_key:
+            self._hud_key = key
+            self._hud = [hud_layout(*player_key) for player_key in key]
+        score, score_x, level, icons = self._hud[0]
+        draw_text(screen, score, 451, score_x)
+        draw_text(screen, level, 451)
+        draw_images(screen, icons, IMAGE_WIDTH, (0, 450))
+        if len(self._hud) > 1:
+            score, score_x, _, icons = self._hud[1]
+            draw_text(screen, score, 1, score_x)
+            draw_images(screen, icons, IMAGE_WIDTH, (0, 0))
+
+        if prof:
+            prof.add("draw.hud", perf_counter_ns() - start)
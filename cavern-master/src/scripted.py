@@ -0,0 +1,36 @@
+"""
+scripted.py — Stand-ins for a player and a Game, for headless runs.
+
+The benches, the tests and the netplay soak test drive the game without
+the Pygame Zero runtime or anyone at the keyboard.  scripted_inputs()
+plays for them: it holds random keys for random stretches, and the same
+seed always gives the same stream, so every run it drives is repeatable.
+LevelOnly is just enough of a Game for moving bodies through a level with
+the game's own collision code.
+"""
+
+import random
+
+from src.input import InputState
+
+
+def scripted_inputs(seed: int):
+    """Endless scripted input: random keys held for random stretches."""
+    rng = random.Random(seed)
+    held = previous = [False] * 4
+    while True:
+        if rng.random() < 0.1:
+            held = [rng.random() < 0.5 for _ in range(4)]
+        yield InputState(
+            left=held[0], right=held[1] and not held[0], up=held[2],
+            jump_pressed=held[2] and not previous[2],
+            fire_pressed=held[3] and not previous[3], fire_held=held[3],
+        )
+        previous = held
+
+
+class LevelOnly:
+    """Just enough of a Game for CollideActor.move: a level_map."""
+
+    def __init__(self, level_map):
+        self.level_map = level_map
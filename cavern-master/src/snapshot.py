@@ -0,0 +1,205 @@
+"""
+snapshot.py — Game state as a flat bytes blob.
+
+snapshot(game) packs everything the simulation depends on into one bytes
+object.  That covers the level and timers, the queued enemies, the players,
+every entity in the registry and the state of the simulation's random
+stream.
+
+restore(game, blob) puts a game back into exactly that state, so stepping
+it again with the same inputs reproduces the original future.  The blob is
+immutable and cheap to keep: rollback can hold one per frame, and a search
+can branch many futures from one.
+
+Each entity is a fixed-size struct record.  Its frame is stored by image
+index (sprites.Frame.index), and references between entities (the orb a
+player is blowing) are stored as list positions.  Blobs are portable
+between processes running the same version of the game with the same
+level pack.  The per-class field lists below must cover every attribute an
+entity's update reads; add new state to them when adding it to an entity.
+
+Snapshots are taken and restored between frames, never during
+Game.update.
+"""
+
+import struct
+from operator import attrgetter
+
+from src.constants import ANCHOR_CENTRE, ANCHOR_CENTRE_BOTTOM
+from src.entities.base import _ANCHOR_FRACTIONS
+from src.entities.bolt import Bolt
+from src.entities.fruit import Fruit
+from src.entities.orb import Orb
+from src.entities.player import Player
+from src.entities.pop import Pop
+from src.entities.robot import Robot
+from src.sprites import frame_at
+
+MAGIC = b"CAVS"
+VERSION = 3
+
+# magic, version, level, level colour, timer, next orb serial, number of
+# players, then the number of fruits, bolts, enemies, pops, orbs and pending
+# enemies
+_HEADER = struct.Struct("<4sBiiiIB6H")
+
+# Mersenne Twister state: 625 words, whether gauss_next is set, its value
+_RNG = struct.Struct("<625I?d")
+
+
+class _Record:
+    """Packing of one entity class: position, frame index, then *fields*."""
+
+    def __init__(self, cls, anchor, fmt: str, fields: tuple, optional: str = None):
+        self.cls = cls
+        self.anchor = (_ANCHOR_FRACTIONS[anchor[0]], _ANCHOR_FRACTIONS[anchor[1]])
+        self.struct = struct.Struct("<ddH" + fmt)
+        self.fields = fields
+        self._get = attrgetter("x", "y", "_frame.index", *fields)
+        # Index in the packed values of a field that may be None (stored as -1)
+        self._optional = None if optional is None else 3 + fields.index(optional)
+
+    def pack(self, obj) -> bytes:
+        values = self._get(obj)
+        i = self._optional
+        if i is not None and values[i] is None:
+            values = values[:i] + (-1,) + values[i + 1:]
+        return self.struct.pack(*values)
+
+    def unpack_into(self, obj, values) -> None:
+        i = self._optional
+        if i is not None and values[i] == -1:
+            values = values[:i] + (None,) + values[i + 1:]
+        obj._anchor_fx, obj._anchor_fy = self.anchor
+        obj.x = values[0]
+        obj.y = values[1]
+        obj.frame = frame_at(values[2])
+        obj.__dict__.update(zip(self.fields, values[3:]))
+
+
+_PLAYER = _Record(
+    Player, ANCHOR_CENTRE_BOTTOM, "dh?biiiiq",
+    ("start_x", "vel_y", "landed", "direction_x", "fire_timer", "hurt_timer",
+     "health", "lives", "score"),
+)
+_BLOWING = struct.Struct("<i")   # index of player.blowing_orb in orbs, or -1
+
+# In registry bucket order: fruits, bolts, enemies, pops, orbs
+_RECORDS = (
+    _Record(Fruit, ANCHOR_CENTRE_BOTTOM, "h?bi",
+            ("vel_y", "landed", "type", "time_to_live")),
+    _Record(Bolt, ANCHOR_CENTRE, "b?", ("direction_x", "active")),
+    _Record(Robot, ANCHOR_CENTRE_BOTTOM, "h?bbb?iiB",
+            ("vel_y", "landed", "type", "speed", "direction_x", "alive",
+             "change_dir_timer", "fire_timer", "span")),
+    _Record(Pop, ANCHOR_CENTRE, "bi", ("type", "timer")),
+    _Record(Orb, ANCHOR_CENTRE, "b?biiI",
+            ("direction_x", "floating", "trapped_enemy_type", "timer",
+             "blown_frames", "serial"),
+            optional="trapped_enemy_type"),
+)
+
+
+def _pack_rng(rng) -> bytes:
+    _, words, gauss = rng.getstate()
+    return _RNG.pack(*words, gauss is not None, gauss or 0.0)
+
+
+def _unpack_rng(rng, blob, pos: int) -> None:
+    *words, has_gauss, gauss = _RNG.unpack_from(blob, pos)
+    rng.setstate((3, tuple(words), gauss if has_gauss else None))
+
+
+def snapshot(game) -> bytes:
+    """Return the complete simulation state of *game* as bytes."""
+    entities = game.entities
+    buckets = entities._lists
+    parts = [_HEADER.pack(
+        MAGIC, VERSION, game.level, game.level_colour, game.timer,
+        entities._next_orb_serial, len(game.players),
+        *map(len, buckets), len(game.pending_enemies),
+    )]
+
+    for player in game.players:
+        parts.append(_PLAYER.pack(player))
+        blowing = player.blowing_orb
+        parts.append(_BLOWING.pack(-1 if blowing is None else game.orbs.index(blowing)))
+
+    for record, bucket in zip(_RECORDS, buckets):
+        pack = record.pack
+        parts.extend(pack(obj) for obj in bucket)
+
+    parts.append(bytes(game.pending_enemies))
+    parts.append(_pack_rng(game.rng))
+    return b"".join(parts)
+
+
+def restore(game, blob: bytes) -> None:
+    """Put *game* into the state captured by snapshot().
+
+    Raises ValueError, leaving *game* untouched, if *blob* is not a
+    snapshot from this version or its length doesn't match its header.
+    """
+    if len(blob) < _HEADER.size:
+        raise ValueError("Truncated snapshot header")
+    (magic, version, level, level_colour, timer, next_orb_serial, num_players,
+     *counts) = _HEADER.unpack_from(blob)
+    if magic != MAGIC:
+        raise ValueError("Not a Cavern game snapshot")
+    if version != VERSION:
+        raise ValueError(f"Unsupported snapshot version: {version}")
+    size = (
+        _HEADER.size
+        + num_players * (_PLAYER.struct.size + _BLOWING.size)
+        + sum(record.struct.size * count for record, count in zip(_RECORDS, counts))
+        + counts[-1]
+        + _RNG.size
+    )
+    if len(blob) != size:
+        raise ValueError(f"Snapshot is {len(blob)} bytes, its header says {size}")
+    pos = _HEADER.size
+
+    game.level = level
+    game.level_colour = level_colour
+    game.timer = timer
+    game.level_map = game.levels[level % len(game.levels)]
+    game.grid = game.level_map.grid
+
+    # Existing Player objects are reused in order
+    players = game.players[:num_players]
+    while len(players) < num_players:
+        players.append(Player())
+    blowing = []
+    for player in players:
+        _PLAYER.unpack_into(player, _PLAYER.struct.unpack_from(blob, pos))
+        pos += _PLAYER.struct.size
+        blowing += _BLOWING.unpack_from(blob, pos)
+        pos += _BLOWING.size
+    game.players = players
+    game.player = players[0] if players else None
+    game.live_players = [p for p in players if p.lives >= 0]
+
+    # Current entities go back to the pools and are reused for the restored
+    # ones (robots are not pooled and are simply replaced)
+    entities = game.entities
+    entities.clear()
+    entities._next_orb_serial = next_orb_serial
+    for record, (bucket, _, pool), count in zip(_RECORDS, entities._buckets, counts):
+        size = record.struct.size
+        end = pos + count * size
+        take = pool.take if pool else record.cls.__new__
+        args = () if pool else (record.cls,)
+        for values in record.struct.iter_unpack(blob[pos:end]):
+            obj = take(*args)
+            record.unpack_into(obj, values)
+            bucket.append(obj)
+        pos = end
+
+    pending = counts[-1]
+    game.pending_enemies = list(blob[pos:pos + pending])
+    pos += pending
+
+    for player, index in zip(players, blowing):
+        player.blowing_orb = None if index < 0 else game.orbs[index]
+
+    _unpack_rng(game.rng, blob, pos)
@@ -0,0 +1,160 @@
+"""
+spatial.py — Spatial indexes for per-tick proximity queries.
+
+SpatialHash files items under every GRID_BLOCK_SIZE cell their extent
+touches, so a query only looks at the items in nearby cells instead of
+scanning them all.  refresh() is called once per tick with the current
+items and is incremental: only items that changed cells are re-filed, and
+items that have gone are dropped.
+
+BandIndex files points (an item's x, y) into horizontal bands, sorted by x
+within each band.  A box query is a bisection per band it spans, however
+wide the box is, where a hash looks up every cell in it.  It is rebuilt by
+refresh() once per tick.
+"""
+
+from bisect import bisect_left, bisect_right
+from operator import attrgetter
+
+from src.constants import GRID_BLOCK_SIZE
+
+_ROW_STRIDE = 1024   # cell key = row * _ROW_STRIDE + column
+_EMPTY = ()
+
+
+def point_extent(body) -> tuple:
+    """Extent of a body's anchor point (left, top, right, bottom)."""
+    return body.x, body.y, body.x, body.y
+
+
+def rect_extent(body) -> tuple:
+    """Extent of a body's rect (left, top, right, bottom)."""
+    left, top = body.left, body.top
+    return left, top, left + body.width, top + body.height
+
+
+class SpatialHash:
+    """Maps grid cells to the items whose extent overlaps them."""
+
+    def __init__(self, extent=point_extent, cell_size: int = GRID_BLOCK_SIZE):
+        self._extent = extent
+        self._size = cell_size
+        self._cells = {}    # cell key → list of items
+        self._placed = {}   # item → [col0, row0, col1, row1, stamp]
+        self._stamp = 0
+
+    def refresh(self, items) -> None:
+        """Re-file every item in *items* and forget any others."""
+        size = self._size
+        placed = self._placed
+        stamp = self._stamp = self._stamp + 1
+        seen = 0
+        for item in items:
+            seen += 1
+            left, top, right, bottom = self._extent(item)
+            c0, r0 = int(left // size), int(top // size)
+            c1, r1 = int(right // size), int(bottom // size)
+            cells = placed.get(item)
+            if cells is None:
+                placed[item] = [c0, r0, c1, r1, stamp]
+                self._file(item, c0, r0, c1, r1)
+            else:
+                if cells[0] != c0 or cells[1] != r0 or cells[2] != c1 or cells[3] != r1:
+                    self._unfile(item, *cells[:4])
+                    self._file(item, c0, r0, c1, r1)
+                    cells[:4] = c0, r0, c1, r1
+                cells[4] = stamp
+
+        if seen != len(placed):
+            for item, cells in list(placed.items()):
+                if cells[4] != stamp:
+                    self._unfile(item, *cells[:4])
+                    del placed[item]
+
+    def clear(self) -> None:
+        self._cells.clear()
+        self._placed.clear()
+
+    def at(self, x: float, y: float):
+        """Items filed under the cell containing pixel (x, y)."""
+        size = self._size
+        return self._cells.get(int(y // size) * _ROW_STRIDE + int(x // size), _EMPTY)
+
+    def within(self, left: float, top: float, right: float, bottom: float):
+        """Yield the item lists of every non-empty cell overlapping the box."""
+        size = self._size
+        cells = self._cells
+        c0, c1 = int(left // size), int(right // size)
+        for row in range(int(top // size), int(bottom // size) + 1):
+            base = row * _ROW_STRIDE
+            for col in range(c0, c1 + 1):
+                items = cells.get(base + col)
+                if items:
+                    yield items
+
+    def _file(self, item, c0, r0, c1, r1) -> None:
+        cells = self._cells
+        for row in range(r0, r1 + 1):
+            for col in range(c0, c1 + 1):
+                key = row * _ROW_STRIDE + col
+                items = cells.get(key)
+                if items is None:
+                    cells[key] = [item]
+                else:
+                    items.append(item)
+
+    def _unfile(self, item, c0, r0, c1, r1) -> None:
+        cells = self._cells
+        for row in range(r0, r1 + 1):
+            for col in range(c0, c1 + 1):
+                key = row * _ROW_STRIDE + col
+                items = cells[key]
+                items.remove(item)
+                if not items:
+                    del cells[key]
+
+
+_by_x = attrgetter("x")
+
+
+class BandIndex:
+    """Items' anchor points in horizontal bands, each sorted by x."""
+
+    def __init__(self, band_height: int = GRID_BLOCK_SIZE):
+        self._height = band_height
+        self._bands = {}   # band → (sorted xs, items in the same order)
+
+    def refresh(self, items) -> None:
+        """Rebuild the index from *items*.  Items with equal x keep their
+        order in *items*."""
+        height = self._height
+        grouped = {}
+        for item in items:
+            band = int(item.y // height)
+            members = grouped.get(band)
+            if members is None:
+                grouped[band] = [item]
+            else:
+                members.append(item)
+        bands = self._bands = {}
+        for band, members in grouped.items():
+            if len(members) > 1:
+                members.sort(key=_by_x)
+            bands[band] = ([item.x for item in members], members)
+
+    def clear(self) -> None:
+        self._bands = {}
+
+    def within(self, left: float, top: float, right: float, bottom: float):
+        """Yield, per band overlapping the box, the items with left <= x <=
+        right.  Their y is only known to lie in the band."""
+        height = self._height
+        bands = self._bands
+        for band in range(int(top // height), int(bottom // height) + 1):
+            entry = bands.get(band)
+            if entry:
+                xs, items = entry
+                start = bisect_left(xs, left)
+                end = bisect_right(xs, right, start)
+                if start < end:
+                    yield items[start:end]
@@ -0,0 +1,80 @@
+"""
+sprites.py — Sprite dimensions without pygame.
+
+Entity hitboxes follow the size of the current animation frame, exactly as
+pgzero's Actor does.  Rather than loading surfaces, this module reads each
+image's width and height straight from its PNG header, so the simulation
+core can compute identical geometry in a process that never imports pygame.
+
+Entities pick their animation frame from tables of Frame objects built when
+each entity module is imported, so choosing a sprite each tick is an index
+lookup with no string building.  A Frame's surface is resolved by
+src/render.py the first time it is drawn.
+
+Every image also has a stable integer index (its position in the sorted
+list of images), so serialised state can refer to a frame by number.
+"""
+
+import os
+import struct
+
+IMAGES_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "images"
+)
+
+_PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+
+_sizes = {}   # image name → (width, height)
+_frames = {}  # image name → Frame
+
+# Image names in index order, and the reverse mapping
+IMAGE_NAMES = tuple(sorted(
+    name[:-4] for name in os.listdir(IMAGES_DIR) if name.endswith(".png")
+))
+_indices = {name: i for i, name in enumerate(IMAGE_NAMES)}
+_by_index = [None] * len(IMAGE_NAMES)   # index → Frame, once created
+
+
+def _read_png_size(path: str) -> tuple:
+    with open(path, "rb") as f:
+        header = f.read(24)
+    if header[:8] != _PNG_SIGNATURE or header[12:16] != b"IHDR":
+        raise ValueError(f"Not a PNG image: {path}")
+    return struct.unpack(">II", header[16:24])
+
+
+def image_size(name: str) -> tuple:
+    """Return the (width, height) of the image called *name*."""
+    try:
+        return _sizes[name]
+    except KeyError:
+        size = _read_png_size(os.path.join(IMAGES_DIR, name + ".png"))
+        _sizes[name] = size
+        return size
+
+
+class Frame:
+    """One animation frame: its image name, index, size and (once drawn)
+    surface."""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.index = _indices[name]
+        self.width, self.height = image_size(name)
+        self.surface = None   # filled in by src/render.py
+
+    def __repr__(self):
+        return f"Frame({self.name!r})"
+
+
+def frame(name: str) -> Frame:
+    """Return the shared Frame for the image called *name*."""
+    f = _frames.get(name)
+    if f is None:
+        f = _frames[name] = _by_index[_indices[name]] = Frame(name)
+    return f
+
+
+def frame_at(index: int) -> Frame:
+    """Return the shared Frame for the image with index *index*."""
+    return _by_index[index] or frame(IMAGE_NAMES[index])
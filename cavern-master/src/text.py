@@ -0,0 +1,101 @@
+"""
+text.py — Bitmap-font text and HUD icons drawn as cached runs.
+
+The game's font is one image per character (font0<ord>.png) with its own
+advance width.  Drawing a string glyph by glyph is one image lookup and
+blit per character, every frame, for text that almost never changes.
+Instead, each distinct run (a string, or a row of HUD icons) is composited
+once into a transparent surface and drawn with a single blit.  Runs are
+kept in a small LRU cache, so a score that changes only builds a new
+surface on the frames where it changes.
+
+Glyphs overlap their neighbours by a pixel or so.  The overlapping columns
+are transparent, which keeps a cached run pixel-identical to blitting its
+images one by one.
+"""
+
+WIDTH = 800
+
+# Advance widths of the font's letters, A-Z; anything before "A" (digits,
+# space) uses the first entry
+CHAR_WIDTH = [27, 26, 25, 26, 25, 25, 26, 25, 12, 26, 26, 25, 33, 25, 26,
+              25, 27, 26, 26, 25, 26, 26, 38, 25, 25, 25]
+
+MAX_RUNS = 32   # cached run surfaces
+
+_runs = {}   # key → (surface, advance width), least recently used first
+
+
+def char_width(char: str) -> int:
+    index = max(0, ord(char) - 65)
+    return CHAR_WIDTH[index]
+
+
+def text_width(text: str) -> int:
+    return sum(char_width(c) for c in text)
+
+
+def draw_text(screen, text: str, y: int, x: int = None) -> None:
+    """Draw *text* with its top-left at (x, y), or centred when x is None."""
+    surface, width = _run(text, _text_pieces)
+    if x is None:
+        x = (WIDTH - width) // 2
+    screen.blit(surface, (x, y))
+
+
+def text_rect(text: str, y: int, x: int = None) -> tuple:
+    """The (x, y, width, height) that draw_text(screen, text, y, x) covers."""
+    surface, width = _run(text, _text_pieces)
+    if x is None:
+        x = (WIDTH - width) // 2
+    return (x, y, surface.get_width(), surface.get_height())
+
+
+def draw_images(screen, names: tuple, advances: dict, pos) -> None:
+    """Draw the images *names* left to right from *pos*, each advancing by
+    its entry in *advances*."""
+    surface, _ = _run(names, lambda names: _image_pieces(names, advances))
+    screen.blit(surface, pos)
+
+
+def _text_pieces(text: str) -> tuple:
+    pieces = []
+    x = 0
+    for char in text:
+        pieces.append(("font0" + str(ord(char)), x))
+        x += char_width(char)
+    return pieces, x
+
+
+def _image_pieces(names: tuple, advances: dict) -> tuple:
+    pieces = []
+    x = 0
+    for name in names:
+        pieces.append((name, x))
+        x += advances[name]
+    return pieces, x
+
+
+def _run(key, layout):
+    """The cached (surface, advance width) for *key*, built from the
+    (image name, x) pieces that *layout(key)* returns on a miss."""
+    run = _runs.pop(key, None)
+    if run is None:
+        run = _build(*layout(key))
+        if len(_runs) >= MAX_RUNS:
+            del _runs[next(iter(_runs))]
+    _runs[key] = run
+    return run
+
+
+def _build(pieces: list, advance: int):
+    import pygame
+    from pgzero.loaders import images
+
+    surfaces = [(images.load(name), x) for name, x in pieces]
+    width = max((x + s.get_width() for s, x in surfaces), default=0)
+    height = max((s.get_height() for s, _ in surfaces), default=0)
+    surface = pygame.Surface((max(width, 1), max(height, 1)), pygame.SRCALPHA)
+    for s, x in surfaces:
+        surface.blit(s, (x, 0))
+    return surface.convert_alpha(), advance
@@ -0,0 +1,121 @@
+"""
+timestep.py — Fixed-timestep driver for App.
+
+Pygame Zero calls update(dt) and draw() once per display frame.  Calling
+App.update from there directly ties the simulation to the frame rate, so a
+slow draw slows the game down.  FixedTimestep instead adds up the real time
+that has passed and runs as many fixed-length ticks as fit in it, from
+zero to ``max_ticks`` per rendered frame.  Time beyond the cap is dropped
+(and counted in ``dropped``), so a long stall such as a window drag does
+not turn into a burst of catch-up ticks.
+
+Input is read once per tick, not once per frame.  A recording therefore
+stores exactly the ticks that ran, and replays tick-exact.
+
+With ``interpolate``, draw() renders every entity between its position
+before the latest tick and its position after it, in proportion to the
+leftover time.  That removes the judder of 0-or-2-tick frames, at the cost
+of displaying positions up to one tick late.  Jumps longer than
+MAX_INTERPOLATE (wrap-around, respawns) are drawn where they land, as are
+pooled entities recycled for a new entity during the tick, and every
+entity after the app switches to another Game.  The simulation state is
+put back before draw() returns.
+
+``turbo`` runs that many ticks per draw, ignoring the clock.  It is for
+fast-forwarding attract mode and for soak tests.
+"""
+
+TICK = 1 / 60          # seconds of game time per App.update
+MAX_TICKS = 5          # catch-up ticks allowed per rendered frame
+MAX_INTERPOLATE = 30   # pixels; longer moves are not interpolated
+
+
+class FixedTimestep:
+    """Drives *app* at a fixed tick rate; *read_input* supplies each tick's
+    InputState."""
+
+    def __init__(self, app, read_input, tick: float = TICK, max_ticks: int = MAX_TICKS,
+                 interpolate: bool = False, turbo: int = 0):
+        self.app = app
+        self.read_input = read_input
+        self.tick = tick
+        self.max_ticks = max_ticks
+        self.interpolate = interpolate
+        self.turbo = turbo      # ticks per draw, ignoring the clock; 0 for real time
+        self.ticks = 0          # ticks run so far
+        self.dropped = 0.0      # seconds of game time skipped at the cap
+        self._accumulator = 0.0
+        self._previous = []     # (body, x, y) before the latest tick
+        self._game = None       # the Game _previous was captured from
+
+    @property
+    def alpha(self) -> float:
+        """How far real time has moved past the latest tick, in ticks (0..1)."""
+        return min(1.0, self._accumulator / self.tick)
+
+    def update(self, dt: float) -> int:
+        """Account for *dt* seconds of real time; returns the ticks run."""
+        if self.turbo:
+            count = self.turbo
+            self._accumulator = 0.0
+        else:
+            self._accumulator += dt
+            count = int(self._accumulator / self.tick)
+            if count > self.max_ticks:
+                self.dropped += (count - self.max_ticks) * self.tick
+                count = self.max_ticks
+                self._accumulator = count * self.tick
+            self._accumulator = max(0.0, self._accumulator - count * self.tick)
+
+        app = self.app
+        read_input = self.read_input
+        for i in range(count):
+            if i == count - 1 and self.interpolate:
+                self._capture()
+            app.update(read_input())
+        if count and self.interpolate:
+            self._forget_reissued()
+        self.ticks += count
+        return count
+
+    def draw(self, screen):
+        """Draw the current frame.  Returns whatever App.draw returns."""
+        if not self.interpolate or self.turbo or not self._previous:
+            return self.app.draw(screen)
+
+        alpha = self.alpha
+        moved = []
+        for body, x, y in self._previous:
+            dx = body.x - x
+            dy = body.y - y
+            if (dx or dy) and -MAX_INTERPOLATE <= dx <= MAX_INTERPOLATE \
+                    and -MAX_INTERPOLATE <= dy <= MAX_INTERPOLATE:
+                moved.append((body, body.x, body.y))
+                body.x = x + dx * alpha
+                body.y = y + dy * alpha
+        try:
+            return self.app.draw(screen)
+        finally:
+            for body, x, y in moved:
+                body.x = x
+                body.y = y
+
+    def _capture(self) -> None:
+        game = self._game = self.app.game
+        if game is None:
+            self._previous = []
+        else:
+            game.entities.take_reissued()
+            self._previous = [(b, b.x, b.y) for b in game.drawables()]
+
+    def _forget_reissued(self) -> None:
+        """Drop captured positions that no longer belong to the same
+        entity: bodies recycled during the tick, or all of them if the app
+        moved on to another Game."""
+        game = self.app.game
+        if game is not self._game:
+            self._previous = []
+            return
+        reissued = game.entities.take_reissued()
+        if reissued:
+            self._previous = [entry for entry in self._previous if entry[0] not in reissued]
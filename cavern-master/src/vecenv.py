@@ -0,0 +1,295 @@
+"""
+vecenv.py — Batched headless Games for agent training.
+
+VecCavern steps N independent single-player Games at once.  Actions are
+one byte per env, holding the InputState bits defined by src/replay.py
+(pack_input).  Each step returns:
+
+    observations  float32 (N, OBS_SIZE)   see observe()
+    rewards       float32 (N,)            score gained this step
+    dones         bool    (N,)            the player lost their last life
+
+A finished env is reset straight away with a fresh seed, so the
+observation returned alongside done=True is the first one of the next
+episode.  ``max_frames`` optionally ends (and resets) episodes after a
+fixed number of steps.
+
+All results live in preallocated arrays that every step overwrites in
+place, so copy them if they need to outlive the next step (or close()).
+Backends:
+
+    "sync"     every env stepped in the calling thread
+    "thread"   envs split across a thread pool.  The simulation is pure
+               Python, so this only helps where the GIL is released.
+    "process"  envs split across worker processes.  Actions, observations,
+               rewards and dones live in one shared-memory block that the
+               workers read and write directly.  Only a short command
+               string crosses each pipe per step, and nothing is pickled
+               per env.
+
+Requires NumPy, which the game itself does not.
+"""
+
+import multiprocessing
+from concurrent.futures import ThreadPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from src.constants import MAX_ORBS
+from src.entities.player import Player
+from src.game import Game
+from src.replay import unpack_input
+
+MAX_ROBOTS = 8
+MAX_BOLTS = 8
+MAX_FRUITS = 8
+
+# Observation layout: globals, player, then fixed slots per entity type.
+# Each slot starts with a presence flag; missing entities are all zeros.
+_GLOBALS = 3   # level, timer, enemies still to spawn
+_PLAYER = 9    # x, y, vel_y, direction_x, landed, health, lives, fire_timer, hurt_timer
+_ROBOT = 5     # present, x, y, type, direction_x
+_ORB = 5       # present, x, y, trapped enemy type (-1 for none), timer
+_BOLT = 4      # present, x, y, direction_x
+_FRUIT = 4     # present, x, y, type
+
+OBS_SIZE = (
+    _GLOBALS + _PLAYER + MAX_ROBOTS * _ROBOT + MAX_ORBS * _ORB
+    + MAX_BOLTS * _BOLT + MAX_FRUITS * _FRUIT
+)
+
+# Shared-memory blocks closed while result arrays were still referenced
+_lingering = []
+
+# One shared InputState per action byte; Game never mutates them
+_INPUTS = tuple(unpack_input(bits) for bits in range(128))
+
+
+def observe(game, out) -> None:
+    """Write *game*'s observation vector into the float32 array *out*."""
+    player = game.player
+    values = [
+        game.level, game.timer, len(game.pending_enemies),
+        player.x, player.y, player.vel_y, player.direction_x, player.landed,
+        player.health, player.lives, player.fire_timer, player.hurt_timer,
+    ]
+    for robot in game.enemies[:MAX_ROBOTS]:
+        values += (1, robot.x, robot.y, robot.type, robot.direction_x)
+    values += (0,) * (_ROBOT * (MAX_ROBOTS - min(len(game.enemies), MAX_ROBOTS)))
+    for orb in game.orbs[:MAX_ORBS]:
+        trapped = orb.trapped_enemy_type
+        values += (1, orb.x, orb.y, -1 if trapped is None else trapped, orb.timer)
+    values += (0,) * (_ORB * (MAX_ORBS - min(len(game.orbs), MAX_ORBS)))
+    for bolt in game.bolts[:MAX_BOLTS]:
+        values += (1, bolt.x, bolt.y, bolt.direction_x)
+    values += (0,) * (_BOLT * (MAX_BOLTS - min(len(game.bolts), MAX_BOLTS)))
+    for fruit in game.fruits[:MAX_FRUITS]:
+        values += (1, fruit.x, fruit.y, fruit.type)
+    values += (0,) * (_FRUIT * (MAX_FRUITS - min(len(game.fruits), MAX_FRUITS)))
+    out[:] = values
+
+
+_DTYPES = (np.float32, np.float32, np.bool_, np.uint8)   # obs, rewards, dones, actions
+
+
+def _buffer_sizes(num_envs: int) -> tuple:
+    return (num_envs * OBS_SIZE * 4, num_envs * 4, num_envs, num_envs)
+
+
+class _Buffers:
+    """Numpy views of the per-step arrays, laid out in one byte buffer."""
+
+    def __init__(self, num_envs: int, buffer=None):
+        sizes = _buffer_sizes(num_envs)
+        if buffer is None:
+            buffer = bytearray(sum(sizes))
+        offset = 0
+        views = []
+        for size, dtype in zip(sizes, _DTYPES):
+            views.append(np.frombuffer(buffer, dtype, size // np.dtype(dtype).itemsize, offset))
+            offset += size
+        observations, self.rewards, self.dones, self.actions = views
+        self.observations = observations.reshape(num_envs, OBS_SIZE)
+
+
+class _EnvChunk:
+    """The envs [start, stop) of a batch, stepped in sequence."""
+
+    def __init__(self, buffers: _Buffers, start: int, stop: int, seed: int,
+                 num_envs: int, max_frames=None):
+        self.buffers = buffers
+        self.start = start
+        self.stop = stop
+        self.max_frames = max_frames
+        self._num_envs = num_envs
+        self._seed = seed
+        self._episodes = [0] * (stop - start)
+        self._games = [None] * (stop - start)
+        self._scores = [0] * (stop - start)
+        self._steps = [0] * (stop - start)   # steps into each env's episode
+
+    def reset(self) -> None:
+        for i in range(self.stop - self.start):
+            self._new_game(i)
+
+    def step(self) -> None:
+        buffers = self.buffers
+        observations = buffers.observations
+        rewards = buffers.rewards
+        dones = buffers.dones
+        actions = buffers.actions.tolist()
+        max_frames = self.max_frames
+        steps = self._steps
+        for i, game in enumerate(self._games):
+            env = self.start + i
+            game.update(_INPUTS[actions[env] & 0x7F])
+            steps[i] += 1
+            player = game.player
+            rewards[env] = player.score - self._scores[i]
+            self._scores[i] = player.score
+            # Counted here, not from game.timer, which each new level resets
+            done = player.lives < 0 or max_frames is not None and steps[i] >= max_frames
+            dones[env] = done
+            if done:
+                self._new_game(i)
+            else:
+                observe(game, observations[env])
+
+    def _new_game(self, i: int) -> None:
+        # Env e's k-th episode uses seed + e + k * num_envs: unique per batch
+        env = self.start + i
+        seed = self._seed + env + self._episodes[i] * self._num_envs
+        self._episodes[i] += 1
+        game = self._games[i] = Game(Player(), seed)
+        self._scores[i] = 0
+        self._steps[i] = 0
+        observe(game, self.buffers.observations[env])
+
+
+def _worker(conn, shm_name: str, num_envs: int, start: int, stop: int,
+            seed: int, max_frames) -> None:
+    """Process-backend worker: steps its chunk on command."""
+    shm = shared_memory.SharedMemory(name=shm_name)
+    buffers = _Buffers(num_envs, shm.buf)
+    chunk = _EnvChunk(buffers, start, stop, seed, num_envs, max_frames)
+    while True:
+        command = conn.recv()
+        if command == "step":
+            chunk.step()
+        elif command == "reset":
+            chunk.reset()
+        else:
+            break
+        conn.send(None)
+    conn.close()
+    del chunk, buffers   # views into the block must go before it is closed
+    shm.close()
+
+
+def _split(num_envs: int, parts: int) -> list:
+    """[start, stop) ranges splitting num_envs into *parts* near-equal runs."""
+    bounds = [num_envs * k // parts for k in range(parts + 1)]
+    return [(a, b) for a, b in zip(bounds, bounds[1:]) if a < b]
+
+
+class VecCavern:
+    """N independent Cavern games stepped together."""
+
+    def __init__(self, num_envs: int, backend: str = "sync", seed: int = 0,
+                 workers: int = None, max_frames: int = None):
+        if backend not in ("sync", "thread", "process"):
+            raise ValueError(f"Unknown backend: {backend!r}")
+        self.num_envs = num_envs
+        self.backend = backend
+        self._started = False   # no games exist until reset()
+        self._shm = None
+        self._pipes = []
+        self._processes = []
+        self._executor = None
+        workers = workers or min(num_envs, multiprocessing.cpu_count())
+        ranges = _split(num_envs, 1 if backend == "sync" else workers)
+
+        if backend == "process":
+            nbytes = sum(_buffer_sizes(num_envs))
+            self._shm = shared_memory.SharedMemory(create=True, size=nbytes)
+            self._buffers = _Buffers(num_envs, self._shm.buf)
+            for start, stop in ranges:
+                parent, child = multiprocessing.Pipe()
+                process = multiprocessing.Process(
+                    target=_worker, daemon=True,
+                    args=(child, self._shm.name, num_envs, start, stop, seed, max_frames),
+                )
+                process.start()
+                child.close()
+                self._pipes.append(parent)
+                self._processes.append(process)
+        else:
+            self._buffers = _Buffers(num_envs)
+            self._chunks = [
+                _EnvChunk(self._buffers, start, stop, seed, num_envs, max_frames)
+                for start, stop in ranges
+            ]
+            if backend == "thread":
+                self._executor = ThreadPoolExecutor(len(self._chunks))
+
+    @property
+    def observations(self):
+        return self._buffers.observations
+
+    def reset(self):
+        """Start a new episode in every env.  Returns the observations."""
+        self._run("reset")
+        self._started = True
+        return self._buffers.observations
+
+    def step(self, actions):
+        """Apply one action byte per env; returns (observations, rewards,
+        dones), overwritten by the next call.  reset() must come first."""
+        if not self._started:
+            raise RuntimeError("VecCavern.step() called before reset()")
+        self._buffers.actions[:] = actions
+        self._run("step")
+        buffers = self._buffers
+        return buffers.observations, buffers.rewards, buffers.dones
+
+    def close(self) -> None:
+        if self._executor:
+            self._executor.shutdown()
+            self._executor = None
+        for pipe in self._pipes:
+            pipe.send("close")
+            pipe.close()
+        for process in self._processes:
+            process.join()
+        self._pipes = []
+        self._processes = []
+        if self._shm is not None:
+            del self._buffers
+            self._shm.unlink()
+            try:
+                self._shm.close()
+            except BufferError:
+                # The caller still holds result arrays; keep the mapping
+                # open for as long as the process runs
+                _lingering.append(self._shm)
+            self._shm = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _run(self, command: str) -> None:
+        if self.backend == "process":
+            for pipe in self._pipes:
+                pipe.send(command)
+            for pipe in self._pipes:
+                pipe.recv()
+        elif self.backend == "thread":
+            for future in [self._executor.submit(getattr(chunk, command))
+                           for chunk in self._chunks]:
+                future.result()
+        else:
+            getattr(self._chunks[0], command)()
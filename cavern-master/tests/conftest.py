@@ -0,0 +1,6 @@
+"""Make the project root importable, as the bench scripts do."""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,86 @@
+"""App screen transitions, the prebuilt play screen and the dirty-rect
+present hook."""
+
+import pygame
+
+import src.audio as _audio
+from src.app import App
+from src.audio import SOUND_LEVEL
+from src.screens.play import PlayScreen
+
+
+def test_flip_is_redirected_only_while_playing(monkeypatch):
+    flips, updates = [], []
+    monkeypatch.setattr(pygame.display, "flip", lambda: flips.append(True))
+    monkeypatch.setattr(pygame.display, "update", updates.append)
+    flip = pygame.display.flip
+
+    app = App(dirty_rects=True, seed=1)
+    assert pygame.display.flip is flip
+    app.change_screen("play")
+    assert pygame.display.flip == app.present
+
+    rects = [pygame.Rect(10, 20, 30, 40)]
+    app._screen.draw = lambda screen: rects
+    app.draw(None)
+    pygame.display.flip()
+    assert updates == [rects] and flips == []
+
+    app._screen.draw = lambda screen: None   # a full redraw
+    app.draw(None)
+    pygame.display.flip()
+    assert flips == [True]
+
+    app.change_screen("game_over", score=0)
+    assert pygame.display.flip is flip
+
+
+def test_flip_is_left_alone_without_dirty_rects(monkeypatch):
+    monkeypatch.setattr(pygame.display, "flip", lambda: None)
+    flip = pygame.display.flip
+    app = App(seed=1)
+    app.change_screen("play")
+    assert pygame.display.flip is flip
+
+
+class _Bank:
+    def __init__(self):
+        self.pending = []
+
+    def request(self, sound):
+        self.pending.append(sound)
+
+    def flush(self):
+        self.pending.clear()
+
+
+def test_the_next_play_screen_is_built_ahead_and_starts_on_entry(monkeypatch):
+    bank = _Bank()
+    monkeypatch.setattr(_audio, "bank", bank)
+    app = App(seed=1)
+    first = app._next_play
+    assert isinstance(first, PlayScreen)
+    assert bank.pending == []   # no level sound until it is played
+
+    app.change_screen("play")
+    assert app._screen is first and app._next_play is None
+    assert bank.pending == [SOUND_LEVEL]
+
+    app.change_screen("game_over", score=0)
+    second = app._next_play
+    assert second is not None and second is not first
+    app.change_screen("menu")
+    assert app._next_play is second   # built once per session
+    app.change_screen("play")
+    assert app._screen is second
+
+
+def test_prebuilt_netplay_screens_number_their_matches_in_order():
+    app = App(seed=10, netplay=(0, None))
+    matches = []
+    for _ in range(3):
+        app.change_screen("play")
+        matches.append((app._screen._session.match, app._screen.game.seed))
+        app.change_screen("game_over", score=0)
+        app.change_screen("menu")
+    assert matches == [(0, 10), (1, 11), (2, 12)]
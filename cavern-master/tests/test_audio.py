@@ -0,0 +1,119 @@
+"""SoundBank against a stub mixer: per-tick dedupe, voice caps and channel
+reservation."""
+
+import pygame
+import pytest
+
+from src.audio import (
+    FREE_CHANNELS,
+    SOUND_JUMP,
+    SOUND_LASER,
+    SOUND_NAMES,
+    SOUND_OVER,
+    VOICES,
+    SoundBank,
+)
+
+
+class _Channel:
+    """A mixer channel that stays busy until the test frees it."""
+
+    def __init__(self, mixer, index):
+        self.index = index
+        self.playing = None
+        mixer.channels[index] = self
+
+    def get_busy(self) -> bool:
+        return self.playing is not None
+
+    def play(self, sound) -> None:
+        self.playing = sound
+
+
+class _Mixer:
+    def __init__(self):
+        self.num_channels = 8
+        self.reserved = 0
+        self.channels = {}
+
+    def set_num_channels(self, count) -> None:
+        self.num_channels = count
+
+    def set_reserved(self, count) -> None:
+        self.reserved = count
+
+    def busy(self) -> dict:
+        """channel index → the sound path it is playing"""
+        return {i: c.playing for i, c in self.channels.items() if c.playing}
+
+
+@pytest.fixture
+def mixer(monkeypatch):
+    mixer = _Mixer()
+    monkeypatch.setattr(pygame.mixer, "Sound", lambda path: path)
+    monkeypatch.setattr(pygame.mixer, "Channel", lambda index: _Channel(mixer, index))
+    monkeypatch.setattr(pygame.mixer, "get_num_channels", lambda: mixer.num_channels)
+    monkeypatch.setattr(pygame.mixer, "set_num_channels", mixer.set_num_channels)
+    monkeypatch.setattr(pygame.mixer, "set_reserved", mixer.set_reserved)
+    return mixer
+
+
+@pytest.fixture
+def bank(mixer, tmp_path):
+    for name in ("laser0", "laser1", "jump0"):
+        (tmp_path / f"{name}.ogg").write_bytes(b"")
+    return SoundBank(str(tmp_path))
+
+
+def test_channels_are_reserved_per_sound(mixer, bank):
+    assert mixer.reserved == len(SOUND_NAMES) * VOICES
+    assert mixer.num_channels == mixer.reserved + FREE_CHANNELS
+    assert [c.index for c in bank._channels[SOUND_LASER]] == [
+        SOUND_LASER * VOICES + v for v in range(VOICES)]
+
+
+def test_a_sound_plays_once_per_tick_however_often_requested(mixer, bank):
+    for _ in range(8):
+        bank.request(SOUND_LASER)
+    bank.request(SOUND_JUMP)
+    bank.flush()
+    assert bank.requested == 9
+    assert bank.played == 2
+    laser = [i for i in mixer.busy() if i // VOICES == SOUND_LASER]
+    assert len(laser) == 1
+
+    bank.flush()   # nothing new was requested
+    assert bank.played == 2
+
+
+def test_a_third_voice_takes_over_the_oldest(mixer, bank):
+    voices = bank._channels[SOUND_LASER]
+    for _ in range(VOICES):
+        bank.request(SOUND_LASER)
+        bank.flush()
+    assert all(channel.get_busy() for channel in voices)
+
+    # Both voices are still busy: the next play cuts off the older one
+    # instead of taking a channel from another sound
+    voices[0].playing = "older"
+    voices[1].playing = "newer"
+    bank.request(SOUND_LASER)
+    bank.flush()
+    assert voices[0].playing != "older"
+    assert voices[1].playing == "newer"
+    assert len(mixer.busy()) == VOICES
+
+    # A free voice is preferred to cutting one off
+    voices[0].playing = None
+    voices[1].playing = "newer"
+    bank.request(SOUND_LASER)
+    bank.flush()
+    assert voices[1].playing == "newer"
+    assert voices[0].get_busy()
+
+
+def test_sounds_with_no_files_are_skipped(mixer, bank):
+    bank.request(SOUND_OVER)
+    bank.flush()
+    assert bank.played == 0
+    assert mixer.busy() == {}
@@ -0,0 +1,101 @@
+"""Level packs: parsing, the compiled cache and level lookup."""
+
+import os
+
+import pytest
+
+from src.constants import LEVELS, NUM_COLUMNS
+from src.level import CompiledLevel
+from src.levelpack import (
+    LEVEL_ROWS,
+    LevelPack,
+    LevelPackError,
+    builtin_pack,
+    compile_pack,
+    load_pack,
+    parse_pack,
+)
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _level(title="Level", rows=LEVEL_ROWS):
+    return [f"= {title}", "X" * NUM_COLUMNS] + ["." * NUM_COLUMNS] * (rows - 1)
+
+
+def _pack(*levels):
+    return "\n".join(line for level in levels for line in level) + "\n"
+
+
+def test_parse_pads_rows_and_skips_comments():
+    text = "# a comment\n\n" + _pack(_level("One"), ["# between", ""], _level("Two"))
+    layouts = parse_pack(text.replace("." * NUM_COLUMNS, "..", 1))
+    assert len(layouts) == 2
+    assert all(len(layout) == LEVEL_ROWS for layout in layouts)
+    assert layouts[0][1] == " " * NUM_COLUMNS
+
+
+def test_short_level_before_the_next_header_reports_its_rows():
+    text = _pack(_level("One", rows=LEVEL_ROWS - 3), _level("Two"))
+    with pytest.raises(LevelPackError, match=r"pack>:1: level has 14 rows, expected 17"):
+        parse_pack(text)
+
+
+def test_short_last_level_reports_its_rows():
+    text = _pack(_level("One"), _level("Two", rows=5))
+    with pytest.raises(LevelPackError, match=rf":{LEVEL_ROWS + 2}: level has 5 rows"):
+        parse_pack(text)
+
+
+@pytest.mark.parametrize("line, message", [
+    ("X" * (NUM_COLUMNS + 1), "row is wider than"),
+    ("XXO", "unexpected 'O'"),
+])
+def test_bad_rows_name_their_line(line, message):
+    text = _pack(_level()).splitlines()
+    text[4] = line
+    with pytest.raises(LevelPackError, match=rf"pack>:5: {message}"):
+        parse_pack("\n".join(text))
+
+
+def test_text_outside_a_level_is_rejected():
+    with pytest.raises(LevelPackError, match="expected '='"):
+        parse_pack("XXXX\n" + _pack(_level()))
+    with pytest.raises(LevelPackError, match="no levels"):
+        parse_pack("# nothing\n")
+
+
+def test_level_numbers_wrap_past_the_end():
+    pack = builtin_pack()
+    assert len(pack) == len(LEVELS)
+    for level in range(3 * len(LEVELS)):
+        assert pack[level] is pack[level % len(LEVELS)]
+    assert pack[-1] is pack[len(LEVELS) - 1]
+    assert len(list(pack)) == len(LEVELS)
+
+
+def test_builtin_pack_matches_compiling_the_layouts():
+    for level, layout in zip(builtin_pack(), LEVELS):
+        fresh = CompiledLevel([row.ljust(NUM_COLUMNS) for row in layout])
+        assert bytes(level.cells) == bytes(fresh.cells)
+        assert level.spawn_columns == fresh.spawn_columns
+        assert level.key == fresh.key
+
+
+def test_cache_is_written_and_mapped(tmp_path):
+    path = os.path.join(ROOT, "levels", "classic.txt")
+    first = load_pack(path, str(tmp_path))
+    assert len(os.listdir(tmp_path)) == 1
+    second = load_pack(path, str(tmp_path))
+    assert len(second) == len(first)
+    for a, b in zip(first, second):
+        assert (a.key, a.layout, bytes(a.cells)) == (b.key, b.layout, bytes(b.cells))
+
+
+def test_truncated_pack_is_rejected():
+    data = compile_pack(LEVELS)
+    for end in (0, 5, len(data) // 2, len(data) - 1):
+        with pytest.raises(ValueError, match="Truncated"):
+            LevelPack(data[:end])
+    with pytest.raises(ValueError, match="Not a Cavern"):
+        LevelPack(b"ABCD" + data[4:])
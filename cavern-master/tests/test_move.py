@@ -0,0 +1,78 @@
+"""
+CollideActor.move (swept) against _move_stepwise (one pixel per step).
+
+Every start pixel along the axis of movement is tried, for every speed the
+game uses, on every built-in layout.  Along the other axis a collision only
+depends on the grid cell, so one pixel per cell is enough, plus positions
+left/right of the level and above/below the screen (where actors wrap).
+"""
+
+import pytest
+
+from src.constants import (
+    GRID_BLOCK_SIZE,
+    HEIGHT,
+    LEVEL_X_OFFSET,
+    NUM_COLUMNS,
+    NUM_ROWS,
+    WIDTH,
+)
+from src.entities.base import CollideActor
+from src.levelpack import builtin_pack
+from src.scripted import LevelOnly
+
+# Player walk 4, robots 1-3, bolts 7, falls up to 10, jumps 16
+SPEEDS = tuple(range(0, 11)) + (16,)
+
+# One x per column, plus either side of the grid
+COLUMN_XS = [LEVEL_X_OFFSET + c * GRID_BLOCK_SIZE + 12 for c in range(-2, NUM_COLUMNS + 2)]
+
+# One y per row, plus above the screen and below it (before wrapping)
+ROW_YS = [r * GRID_BLOCK_SIZE + 12 for r in range(-2, NUM_ROWS + 2)] + [HEIGHT + 20]
+
+
+def _mismatches(game, starts, dx, dy):
+    swept = CollideActor((0, 0))
+    stepwise = CollideActor((0, 0))
+    bad = []
+    for pos in starts:
+        for speed in SPEEDS:
+            swept.pos = stepwise.pos = pos
+            result = swept.move(game, dx, dy, speed), swept.pos
+            expected = stepwise._move_stepwise(game, dx, dy, speed), stepwise.pos
+            if result != expected:
+                bad.append((pos, speed, result, expected))
+    return bad
+
+
+@pytest.mark.parametrize("level", range(len(builtin_pack())))
+@pytest.mark.parametrize("dx", (-1, 1))
+def test_horizontal_moves_match_stepwise(level, dx):
+    starts = [(x, y) for y in ROW_YS for x in range(WIDTH)]
+    assert _mismatches(LevelOnly(builtin_pack()[level]), starts, dx, 0) == []
+
+
+@pytest.mark.parametrize("level", range(len(builtin_pack())))
+@pytest.mark.parametrize("dy", (-1, 1))
+def test_vertical_moves_match_stepwise(level, dy):
+    starts = [(x, y) for x in COLUMN_XS for y in range(-HEIGHT // 2, HEIGHT + HEIGHT // 2)]
+    assert _mismatches(LevelOnly(builtin_pack()[level]), starts, 0, dy) == []
+
+
+@pytest.mark.parametrize("dx, dy", [(-1, 0), (1, 0), (0, -1), (0, 1)])
+def test_fractional_starts_match_stepwise(dx, dy):
+    # A move blocked on its first pixel leaves the position untouched,
+    # fraction and all; any other move snaps it to whole pixels
+    if dx:
+        starts = [(x + 0.5, y + 0.25) for y in ROW_YS for x in range(0, WIDTH, 3)]
+    else:
+        starts = [(x + 0.5, y + 0.25) for x in COLUMN_XS for y in range(-20, HEIGHT + 20)]
+    assert _mismatches(LevelOnly(builtin_pack()[0]), starts, dx, dy) == []
+
+
+def test_diagonal_moves_use_stepwise():
+    game = LevelOnly(builtin_pack()[0])
+    starts = [(x, y) for x in COLUMN_XS for y in ROW_YS]
+    for dx in (-1, 1):
+        for dy in (-1, 1):
+            assert _mismatches(game, starts, dx, dy) == []
@@ -0,0 +1,169 @@
+"""Navigation graphs of the built-in levels, checked against real movement.
+
+A test body is a GravityActor the size of a robot, moved with the game's
+own collision code: it falls, walks and wraps exactly as a robot does.
+"""
+
+import pytest
+
+from src.constants import GRID_BLOCK_SIZE, LEVEL_X_OFFSET, NUM_COLUMNS, NUM_ROWS
+from src.entities.base import GravityActor
+from src.level import STRIDE
+from src.levelpack import builtin_pack
+from src.navigation import LEFT, NO_SPAN, RIGHT, STAY, build_navigation
+from src.scripted import LevelOnly
+from src.sprites import frame
+
+LEVELS = range(len(builtin_pack()))
+ROBOT_FRAME = frame("robot000")
+WALK_SPEED = 2
+
+
+def _spans(nav):
+    return [tuple(nav.spans[3 * i:3 * i + 3]) for i in range(nav.count)]
+
+
+def _x(column):
+    return LEVEL_X_OFFSET + column * GRID_BLOCK_SIZE + GRID_BLOCK_SIZE // 2
+
+
+def _body(x, y):
+    body = GravityActor((x, y))
+    body.frame = ROBOT_FRAME
+    return body
+
+
+def _settle(game, body, frames=200):
+    """Let *body* fall until it stands on something; False if it never does."""
+    for _ in range(frames):
+        body.update(game)
+        if body.vel_y == 0:
+            return True
+    return False
+
+
+def _exits(nav, span):
+    """(step, landing span) for each end of *span* a robot can walk off."""
+    row, first, last = _spans(nav)[span]
+    exits = []
+    for step, column in ((LEFT, first - 1), (RIGHT, last + 1)):
+        if 0 <= column < NUM_COLUMNS:
+            landing = nav.land[row * STRIDE + column]
+            if landing != NO_SPAN and landing != span:
+                exits.append((step, landing))
+    return exits
+
+
+def _reachable(nav, source):
+    seen = {source}
+    frontier = [source]
+    while frontier:
+        span = frontier.pop()
+        for _, landing in _exits(nav, span):
+            if landing not in seen:
+                seen.add(landing)
+                frontier.append(landing)
+    return seen
+
+
+@pytest.mark.parametrize("index", LEVELS)
+def test_spans_are_walkable_ground(index):
+    level = builtin_pack()[index]
+    nav = level.nav
+    assert nav.count > 0
+    for span, (row, first, last) in enumerate(_spans(nav)):
+        assert 0 <= row < NUM_ROWS - 1 and 0 <= first <= last < NUM_COLUMNS
+        for column in range(first, last + 1):
+            assert not level.cells[row * STRIDE + column]
+            assert level.cells[(row + 1) * STRIDE + column]
+            assert nav.land[row * STRIDE + column] == span
+        # Spans are maximal: the cells either side aren't ground in this row
+        for column in (first - 1, last + 1):
+            if 0 <= column < NUM_COLUMNS:
+                assert nav.land[row * STRIDE + column] != span
+
+
+@pytest.mark.parametrize("index", LEVELS)
+def test_land_table_matches_falling(index):
+    level = builtin_pack()[index]
+    game = LevelOnly(level)
+    nav = level.nav
+    for row in range(NUM_ROWS):
+        for column in range(NUM_COLUMNS):
+            if level.cells[row * STRIDE + column]:
+                continue
+            # Start at the bottom pixel of the cell, as a standing body is
+            body = _body(_x(column), (row + 1) * GRID_BLOCK_SIZE - 1)
+            expected = nav.land[row * STRIDE + column]
+            if _settle(game, body):
+                assert nav.span_at(body.x, body.y) == expected, (row, column)
+            else:
+                assert expected == NO_SPAN, (row, column)
+
+
+@pytest.mark.parametrize("index", LEVELS)
+def test_robots_spawn_onto_ground_they_can_leave(index):
+    level = builtin_pack()[index]
+    nav = level.nav
+    for x in set(level.spawn_x):
+        body = _body(x, -30)   # where Game spawns robots
+        assert _settle(LevelOnly(level), body, frames=400)
+        span = nav.span_at(body.x, body.y)
+        assert span != NO_SPAN
+        assert len(_reachable(nav, span)) > 1
+
+
+@pytest.mark.parametrize("index", LEVELS)
+def test_next_hops_agree_with_reachability(index):
+    nav = builtin_pack()[index].nav
+    for source in range(nav.count):
+        reachable = _reachable(nav, source)
+        for target in range(nav.count):
+            step = nav.next_hop[source * nav.count + target]
+            if source == target or target not in reachable:
+                assert step == STAY
+                continue
+            # Following the hops gets there without going round in circles
+            span, hops = source, 0
+            while span != target:
+                step = nav.next_hop[span * nav.count + target]
+                landing = dict(_exits(nav, span)).get(step)
+                assert landing is not None, (source, target, span)
+                span, hops = landing, hops + 1
+                assert hops <= nav.count
+
+
+@pytest.mark.parametrize("index", LEVELS)
+def test_bodies_following_directions_reach_their_target(index):
+    level = builtin_pack()[index]
+    game = LevelOnly(level)
+    nav = level.nav
+    spans = _spans(nav)
+    for source, (row, first, last) in enumerate(spans):
+        for target in _reachable(nav, source) - {source}:
+            t_row, t_first, t_last = spans[target]
+            target_x = _x((t_first + t_last) // 2)
+            target_y = (t_row + 1) * GRID_BLOCK_SIZE - 1
+            body = _body(_x((first + last) // 2), (row + 1) * GRID_BLOCK_SIZE - 1)
+            for _ in range(2000):
+                body.update(game)
+                if body.vel_y == 0:
+                    if nav.span_at(body.x, body.y) == target:
+                        break
+                    direction = nav.direction(body.x, body.y, target_x, target_y)
+                    assert direction in (-1, 1)
+                    body.move(game, direction, 0, WALK_SPEED)
+            else:
+                pytest.fail(f"span {source} never reached span {target}")
+
+
+def test_rebuilding_matches_the_packed_tables():
+    for level in builtin_pack():
+        built = build_navigation(level.cells)
+        assert (built.spans, built.land, built.next_hop) == \
+            (level.nav.spans, level.nav.land, level.nav.next_hop)
+
+
+def test_direction_outside_the_level_is_zero():
+    nav = builtin_pack()[0].nav
+    assert nav.direction(10, 200, 400, 200) == 0   # left of the grid
@@ -0,0 +1,143 @@
+"""RollbackSession over an in-memory transport, co-op PlayScreens and
+two-player game over."""
+
+from src.entities.player import Player
+from src.game import Game
+from src.input import InputState
+from src.netplay import START_X, RollbackSession
+from src.replay import pack_input
+from src.screens.play import PlayScreen
+
+IDLE = InputState()
+JUMP = InputState(up=True, jump_pressed=True)
+FIRE = InputState(fire_pressed=True, fire_held=True)
+
+
+class _Pipe:
+    """One end of a lossless, instant in-memory link."""
+
+    def __init__(self):
+        self.inbox = []
+        self.peer = None
+
+    def send(self, data: bytes) -> None:
+        self.peer.inbox.append(data)
+
+    def receive(self) -> list:
+        datagrams, self.inbox = self.inbox, []
+        return datagrams
+
+    def close(self) -> None:
+        pass
+
+
+def _pipes():
+    a, b = _Pipe(), _Pipe()
+    a.peer, b.peer = b, a
+    return a, b
+
+
+class _App:
+    """Records the screen changes a PlayScreen asks for."""
+
+    def __init__(self):
+        self.changes = []
+
+    def change_screen(self, name, **kwargs):
+        self.changes.append((name, kwargs))
+
+
+def _sessions(seed=1, **kwargs):
+    a, b = _pipes()
+    return [
+        RollbackSession(Game(Player(START_X[0]), seed, Player(START_X[1])), i, pipe, **kwargs)
+        for i, pipe in enumerate((a, b))
+    ]
+
+
+def _settle(*sessions):
+    """Exchange until every simulated frame is confirmed on both sides."""
+    for _ in range(4):
+        for session in sessions:
+            session.poll()
+    for session in sessions:
+        assert session.confirmed_frame >= session.frame
+
+
+def test_presses_made_while_stalled_are_sent_on_resume():
+    one, two = _sessions(max_rollback=4)
+    # Player two is silent, so player one runs ahead until it stalls
+    while one.advance(IDLE):
+        pass
+    stalled_at = one.frame
+    assert not one.advance(JUMP)
+    assert not one.advance(FIRE)
+    assert one.stalls == 3
+
+    # Player two catches up; player one resumes with both presses
+    for _ in range(stalled_at):
+        assert two.advance(IDLE)
+    assert one.advance(IDLE)
+    sent = one._local[stalled_at + 2]   # local input runs input_delay frames late
+    assert sent == pack_input(InputState(jump_pressed=True, fire_pressed=True))
+
+    for _ in range(one.frame - two.frame):
+        two.advance(IDLE)
+    _settle(one, two)
+    assert one.checksum() == two.checksum()
+
+
+def test_peers_agree_under_rollback():
+    one, two = _sessions(seed=4)
+    for frame in range(300):
+        one.advance(FIRE if frame % 23 == 0 else InputState(left=frame % 90 < 45))
+        if frame % 3:   # player two lags and bunches its inputs
+            two.advance(JUMP if frame % 31 == 0 else InputState(right=True))
+    while two.frame < one.frame:
+        two.advance(IDLE)
+    _settle(one, two)
+    assert one.rollbacks > 0
+    assert one.checksum() == two.checksum()
+
+
+def test_game_is_over_only_when_both_players_are_out():
+    game = Game(Player(START_X[0]), 1, Player(START_X[1]))
+    game.players[0].lives = -1
+    assert not game.game_over
+    game.players[1].lives = -1
+    assert game.game_over
+    assert not Game(seed=1).game_over   # playerless demo game
+
+
+def test_packets_from_another_match_are_ignored():
+    a, b = _pipes()
+    old = RollbackSession(Game(Player(START_X[0]), 1, Player(START_X[1])), 0, a, match=0)
+    new = RollbackSession(Game(Player(START_X[0]), 1, Player(START_X[1])), 1, b, match=1)
+    for _ in range(3):
+        old.advance(JUMP)
+    new.poll()
+    assert new.confirmed_frame == 0
+
+
+def test_coop_play_screens_stay_in_step_until_game_over():
+    screens = [PlayScreen(seed=5, netplay=(i, pipe, 0)) for i, pipe in enumerate(_pipes())]
+    for screen in screens:
+        screen.enter()
+    apps = [_App(), _App()]
+    pause = InputState(pause_pressed=True)
+    for frame in range(200):
+        screens[0].update(FIRE if frame % 17 == 0 else InputState(right=frame % 60 < 30), apps[0])
+        screens[1].update(pause if frame == 50 else InputState(left=True), apps[1])
+    sessions = [screen._session for screen in screens]
+    _settle(*sessions)
+    assert not screens[1]._paused   # a shared game can't be paused
+    assert sessions[0].checksum() == sessions[1].checksum()
+    assert len(screens[0]._status_key()) == 2   # a HUD entry for each player
+
+    for screen in screens:
+        for player in screen.game.players:
+            player.lives = -1
+    for screen, app in zip(screens, apps):
+        screen.update(IDLE, app)
+    score = sum(player.score for player in screens[0].game.players)
+    assert [app.changes for app in apps] == [[("game_over", {"score": score})]] * 2
@@ -0,0 +1,76 @@
+"""Pool reuse and in-place compaction."""
+
+from src.pool import Pool, compact
+
+
+class _Thing:
+    created = 0
+
+    def __init__(self, value):
+        _Thing.created += 1
+        self.value = value
+        self.extra = None
+
+
+def test_released_objects_are_reused_and_reinitialised():
+    pool = Pool(_Thing)
+    first = pool.acquire(1)
+    first.extra = "left over"
+    pool.release(first)
+    assert len(pool) == 1
+
+    again = pool.acquire(2)
+    assert again is first
+    assert (again.value, again.extra) == (2, None)   # as if newly built
+    assert len(pool) == 0
+    assert pool.acquire(3) is not first   # an empty pool builds new ones
+
+
+def test_the_most_recently_released_object_is_reused_first():
+    pool = Pool(_Thing)
+    a, b = pool.acquire(0), pool.acquire(0)
+    pool.release(a)
+    pool.release(b)
+    assert pool.acquire(0) is b
+    assert pool.acquire(0) is a
+
+
+def test_take_skips_init():
+    pool = Pool(_Thing)
+    thing = pool.acquire(1)
+    pool.release(thing)
+    created = _Thing.created
+    assert pool.take() is thing
+    assert thing.value == 1   # left for the caller to overwrite
+    fresh = pool.take()
+    assert isinstance(fresh, _Thing) and not hasattr(fresh, "value")
+    assert _Thing.created == created
+
+
+def test_reissued_records_recycled_objects_only():
+    pool = Pool(_Thing)
+    a = pool.acquire(0)
+    assert pool.reissued == set()
+    pool.release(a)
+    pool.acquire(0)
+    assert pool.reissued == {a}
+
+
+def test_compact_keeps_order_in_place_and_releases_the_rest():
+    pool = Pool(_Thing)
+    items = [_Thing(v) for v in range(10)]
+    kept = [t for t in items if t.value % 3]
+    dropped = [t for t in items if not t.value % 3]
+    same_list = items
+    compact(items, lambda t: t.value % 3, pool)
+    assert items is same_list
+    assert items == kept
+    assert pool._free == dropped   # released in list order
+
+
+def test_compact_without_a_pool_just_drops():
+    items = [_Thing(v) for v in range(4)]
+    compact(items, lambda t: t.value >= 2)
+    assert [t.value for t in items] == [2, 3]
+    compact(items, lambda t: False)
+    assert items == []
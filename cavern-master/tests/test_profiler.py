@@ -0,0 +1,90 @@
+"""Profiler series: update sections per tick, draw sections per drawn frame."""
+
+import json
+
+import pytest
+
+from src import profiler
+from src.app import App
+from src.input import InputState
+from src.profiler import SECTIONS, Profiler
+
+
+def _tick(prof, ns):
+    prof.add("update.enemies", ns)
+    prof.end_tick()
+
+
+def _frame(prof, ns):
+    prof.add("draw.enemies", ns)
+    prof.end_frame()
+
+
+def test_draw_time_is_filed_per_frame_not_per_tick():
+    prof = Profiler(history=8)
+    # Three ticks, one frame; then a frame with no tick; then one of each
+    for ns in (100, 200, 300):
+        _tick(prof, ns)
+    _frame(prof, 5000)
+    _frame(prof, 7000)
+    _tick(prof, 400)
+    _frame(prof, 9000)
+
+    assert (prof.ticks, prof.frames) == (4, 3)
+    assert prof._history("update.enemies") == [100, 200, 300, 400]
+    assert prof._history("draw.enemies") == [5000, 7000, 9000]
+    summary = prof.summary()
+    assert summary["update.enemies"]["mean_ms"] == pytest.approx(250 / 1e6)
+    assert summary["draw.enemies"]["mean_ms"] == pytest.approx(7000 / 1e6)
+
+
+def test_rings_keep_the_latest_entries_oldest_first():
+    prof = Profiler(history=4)
+    for ns in range(1, 7):
+        _tick(prof, ns)
+    _frame(prof, 50)
+    assert prof._history("update.enemies") == [3, 4, 5, 6]
+    assert prof._history("draw.enemies") == [50]
+
+
+def test_dump_writes_each_series_with_its_own_index(tmp_path):
+    prof = Profiler(history=8)
+    _tick(prof, 100)
+    _tick(prof, 200)
+    _frame(prof, 5000)
+
+    prof.dump(str(tmp_path / "p.csv"))
+    header, *rows = (tmp_path / "p.csv").read_text().splitlines()
+    assert header.split(",") == ["series", "index", *SECTIONS]
+    cells = [row.split(",") for row in rows]
+    assert [row[:2] for row in cells] == [["tick", "0"], ["tick", "1"], ["frame", "0"]]
+    enemies = 2 + SECTIONS.index("update.enemies")
+    drawn = 2 + SECTIONS.index("draw.enemies")
+    assert [row[enemies] for row in cells] == ["100", "200", ""]
+    assert [row[drawn] for row in cells] == ["", "", "5000"]
+
+    prof.dump(str(tmp_path / "p.json"))
+    data = json.loads((tmp_path / "p.json").read_text())
+    assert (data["ticks"], data["frames"]) == (2, 1)
+    assert data["history_ns"]["draw.enemies"] == [5000]
+    assert set(data["summary"]) == set(SECTIONS)
+
+
+def test_app_files_a_tick_per_update_and_a_frame_per_draw():
+    prof = profiler.enable()
+    try:
+        app = App(seed=1)
+        app.change_screen("play")
+        app._screen.update = lambda input_state, app: prof.add("update.player", 10)
+        app._screen.draw = lambda screen: prof.add("draw.hud", 1000)
+        for _ in range(3):
+            app.update(InputState())
+        app.draw(None)
+        app.draw(None)
+    finally:
+        profiler.disable()
+    assert (prof.ticks, prof.frames) == (3, 2)
+    assert prof._history("update.player") == [10, 10, 10]
+    assert prof._history("draw.hud") == [1000, 1000]
+    assert min(prof._history("app.update")) > 0
+    assert min(prof._history("app.draw")) > 0
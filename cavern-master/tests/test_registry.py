@@ -0,0 +1,98 @@
+"""EntityRegistry: update order, staged spawns, pruning and recycling."""
+
+import random
+
+from src.game import Game
+from src.registry import EntityRegistry
+
+
+class _Enemy:
+    """Logs its updates; may spawn another enemy while updating."""
+
+    def __init__(self, name, log, spawns=()):
+        self.name = name
+        self.log = log
+        self.spawns = list(spawns)
+        self.alive = True
+
+    def update(self, game) -> None:
+        self.log.append(self.name)
+        for child in self.spawns:
+            game.entities.add_enemy(_Enemy(child, self.log))
+        self.spawns = []
+
+
+class _Game:
+    def __init__(self):
+        self.entities = EntityRegistry(random.Random(0))
+
+
+def test_spawns_during_a_pass_wait_for_the_next_tick():
+    game = _Game()
+    log = []
+    game.entities.add_enemy(_Enemy("a", log, spawns=["a1", "a2"]))
+    game.entities.add_enemy(_Enemy("b", log, spawns=["b1"]))
+
+    game.entities.update_all(game)
+    assert log == ["a", "b"]
+    # Appended when the pass ended, in the order they were spawned
+    assert [e.name for e in game.entities.enemies] == ["a", "b", "a1", "a2", "b1"]
+
+    log.clear()
+    game.entities.update_all(game)
+    assert log == ["a", "b", "a1", "a2", "b1"]
+
+
+def test_a_pop_from_an_expiring_fruit_is_not_updated_in_the_same_pass():
+    # Pops update after fruits, so without staging the new pop would be
+    # updated straight away
+    game = Game(seed=1)
+    game.entities.clear()
+    fruit = game.entities.spawn_fruit((400, 100))
+    fruit.time_to_live = 1
+
+    game.entities.update_all(game)
+    [pop] = game.pops
+    assert pop.timer == -1   # spawned, not yet updated
+    game.entities.prune()
+    assert game.fruits == []
+
+    game.entities.update_all(game)
+    assert pop.timer == 0
+
+
+def test_entities_update_and_iterate_in_bucket_order():
+    game = Game(seed=1)
+    entities = game.entities
+    entities.clear()
+    orb = entities.spawn_orb((300, 200), 1)
+    pop = entities.spawn_pop((300, 200), 0)
+    bolt = entities.spawn_bolt((300, 300), 1)
+    fruit = entities.spawn_fruit((300, 100))
+    assert list(entities) == [fruit, bolt, pop, orb]
+    assert len(entities) == 4
+
+
+def test_prune_recycles_pooled_entities():
+    game = _Game()
+    entities = game.entities
+    pops = [entities.spawn_pop((0, 0), 0) for _ in range(3)]
+    pops[1].timer = 12   # expired
+    entities.prune()
+    assert entities.pops == [pops[0], pops[2]]
+    assert entities.spawn_pop((5, 5), 1) is pops[1]
+
+    entities.clear()
+    assert len(entities) == 0
+    assert len(entities.pop_pool) == 3
+
+
+def test_orb_serials_follow_spawn_order_across_recycling():
+    entities = _Game().entities
+    a = entities.spawn_orb((100, 100), 1)
+    b = entities.spawn_orb((200, 100), 1)
+    a.timer = 10 ** 6   # expired
+    entities.prune()
+    c = entities.spawn_orb((300, 100), 1)
+    assert c is a   # recycled
+    assert (b.serial, c.serial) == (1, 2)
@@ -0,0 +1,112 @@
+"""Input recordings: encoding round trips and rejection of bad files."""
+
+import struct
+
+import pytest
+
+from src.input import InputState
+from src.replay import (
+    MAGIC,
+    VERSION,
+    InputRecorder,
+    Recording,
+    pack_input,
+    unpack_input,
+)
+
+IDLE = InputState()
+LEFT = InputState(left=True)
+JUMP = InputState(up=True, jump_pressed=True)
+HOLD_UP = InputState(up=True)
+FIRE = InputState(fire_pressed=True, fire_held=True)
+BLOW = InputState(fire_held=True)
+
+
+def _record(states, seed=7):
+    recorder = InputRecorder(seed)
+    for state in states:
+        recorder.record(state)
+    return recorder
+
+
+def _round_trip(states, seed=7):
+    data = _record(states, seed).to_bytes()
+    recording = Recording.from_bytes(data)
+    assert recording.seed == seed
+    assert len(recording) == len(states)
+    assert list(recording) == list(states)
+    return data
+
+
+def test_every_input_state_packs_and_unpacks():
+    for bits in range(1 << 7):
+        assert pack_input(unpack_input(bits)) == bits
+
+
+def test_long_runs_of_one_input_stay_small():
+    data = _round_trip([LEFT] * 100_000)
+    # header, run byte, three LEB128 bytes
+    assert len(data) == struct.calcsize("<4sBQI") + 1 + 3
+
+
+def test_edge_triggered_presses_survive():
+    # A press lasts a single frame between held frames, as InputHandler makes it
+    states = ([IDLE] * 5 + [JUMP] + [HOLD_UP] * 9 + [FIRE] + [BLOW] * 30) * 20
+    data = _round_trip(states)
+    recording = Recording.from_bytes(data)
+    assert sum(state.jump_pressed for state in recording) == 20
+    assert sum(state.fire_pressed for state in recording) == 20
+
+
+def test_presses_on_consecutive_frames_stay_separate():
+    _round_trip([JUMP, IDLE, JUMP, JUMP, FIRE, IDLE, FIRE])
+
+
+@pytest.mark.parametrize("length, varint_bytes", [
+    (2, 1), (126, 1), (127, 1), (128, 2), (129, 2), (255, 2),
+    (16383, 2), (16384, 3), (2_097_152, 4),
+])
+def test_run_lengths_encode_as_leb128(length, varint_bytes):
+    data = _round_trip([IDLE] + [LEFT] * length + [IDLE])
+    header = struct.calcsize("<4sBQI")
+    # the IDLE single-frame runs take one byte each
+    assert len(data) == header + 1 + (1 + varint_bytes) + 1
+
+
+def test_every_truncation_is_rejected():
+    data = _record([IDLE] * 3 + [JUMP] + [LEFT] * 300 + [FIRE] + [BLOW] * 200).to_bytes()
+    for end in range(len(data)):
+        with pytest.raises(ValueError):
+            Recording.from_bytes(data[:end])
+
+
+def test_extra_frames_are_rejected():
+    data = _record([LEFT] * 10).to_bytes()
+    with pytest.raises(ValueError, match="frames"):
+        Recording.from_bytes(data + bytes([0x80]))
+
+
+def test_wrong_version_is_rejected():
+    data = bytearray(_record([LEFT] * 10).to_bytes())
+    data[len(MAGIC)] = VERSION + 1
+    with pytest.raises(ValueError, match="version"):
+        Recording.from_bytes(bytes(data))
+
+
+def test_other_files_are_rejected():
+    with pytest.raises(ValueError, match="Not a Cavern"):
+        Recording.from_bytes(b"PNG\x00" + bytes(40))
+
+
+def test_seeds_must_fit_the_header():
+    with pytest.raises(ValueError):
+        InputRecorder(1 << 64)
+
+
+def test_save_and_load(tmp_path):
+    states = [IDLE] * 40 + [FIRE] + [BLOW] * 12 + [LEFT] * 500
+    path = tmp_path / "session.cavrec"
+    _record(states, seed=1 << 63).save(str(path))
+    recording = Recording.load(str(path))
+    assert recording.seed == 1 << 63
+    assert list(recording) == states
@@ -0,0 +1,122 @@
+"""Game.snapshot() / Game.restore(): restored games play on identically."""
+
+from itertools import islice
+
+import pytest
+
+from src.entities.player import Player
+from src.game import Game
+from src.scripted import scripted_inputs
+from src.snapshot import MAGIC, VERSION
+
+# Offset of the entity counts in the header: magic, version, level, level
+# colour, timer, next orb serial, number of players
+_COUNTS = 4 + 1 + 4 + 4 + 4 + 4 + 1
+
+
+def _step(game, input_state):
+    game.player.lives = max(game.player.lives, 2)   # keep the session going
+    game.update(input_state)
+
+
+def _entity_state(entity):
+    return sorted(
+        (name, value) for name, value in vars(entity).items()
+        if isinstance(value, (int, float, bool, str, type(None)))
+    ) + [("image", entity.image)]
+
+
+def _state(game):
+    """Everything observable about *game*, without going through snapshot()."""
+    player = game.player
+    blowing = player.blowing_orb
+    return (
+        game.level, game.level_colour, game.timer, list(game.pending_enemies),
+        game.rng.getstate(), game.entities._next_orb_serial,
+        _entity_state(player),
+        None if blowing is None else game.orbs.index(blowing),
+        [[_entity_state(e) for e in bucket] for bucket in game.entities._lists],
+    )
+
+
+@pytest.fixture(scope="module")
+def busy_game():
+    """A game mid-level with live fruit, bolts, orbs and robots, the inputs
+    that got it there and the inputs that follow."""
+    inputs = list(islice(scripted_inputs(11), 6000))
+    game = Game(Player(), seed=3)
+    game.fire_probability = lambda: 0.05   # keep bolts in the air
+    for frame, input_state in enumerate(inputs):
+        _step(game, input_state)
+        if frame > 100 and game.fruits and game.bolts and game.orbs and game.enemies:
+            return game, inputs[frame + 1:frame + 601]
+    pytest.fail("the scripted session never had every entity type alive at once")
+
+
+def _future(game, inputs):
+    states = []
+    for input_state in inputs:
+        _step(game, input_state)
+        states.append(_state(game))
+    return states
+
+
+def test_restore_into_the_same_game(busy_game):
+    game, inputs = busy_game
+    blob = game.snapshot()
+    before = _state(game)
+    expected = _future(game, inputs)
+
+    game.restore(blob)
+    assert _state(game) == before
+    assert _future(game, inputs) == expected
+
+
+def test_restore_into_a_fresh_game(busy_game):
+    game, inputs = busy_game
+    blob = game.snapshot()
+    fresh = Game(Player(), seed=999)
+    fresh.fire_probability = game.fire_probability
+    fresh.restore(blob)
+    assert _state(fresh) == _state(game)
+    assert _future(fresh, inputs) == _future(game, inputs)
+
+
+def test_snapshots_are_stable(busy_game):
+    game, _ = busy_game
+    blob = game.snapshot()
+    game.restore(blob)
+    assert game.snapshot() == blob
+
+
+@pytest.mark.parametrize("cut", (0, 4, 20, -1, -100))
+def test_truncated_snapshot_is_rejected(busy_game, cut):
+    game, _ = busy_game
+    blob = game.snapshot()
+    before = _state(game)
+    with pytest.raises(ValueError):
+        game.restore(blob[:cut])
+    assert _state(game) == before
+
+
+def test_padded_snapshot_is_rejected(busy_game):
+    game, _ = busy_game
+    with pytest.raises(ValueError, match="bytes"):
+        game.restore(game.snapshot() + b"\0")
+
+
+def test_corrupt_snapshot_is_rejected(busy_game):
+    game, _ = busy_game
+    blob = game.snapshot()
+    with pytest.raises(ValueError, match="Not a Cavern"):
+        game.restore(b"XXXX" + blob[len(MAGIC):])
+    wrong_version = bytearray(blob)
+    wrong_version[len(MAGIC)] = VERSION + 1
+    with pytest.raises(ValueError, match="version"):
+        game.restore(bytes(wrong_version))
+    # A fruit count (the first of the entity counts) that disagrees with
+    # the records that follow
+    miscounted = bytearray(blob)
+    miscounted[_COUNTS] += 1
+    with pytest.raises(ValueError, match="bytes"):
+        game.restore(bytes(miscounted))
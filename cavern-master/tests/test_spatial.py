@@ -0,0 +1,105 @@
+"""Orb indexes against brute-force scans."""
+
+import random
+
+import pytest
+
+from src.entities.robot import Robot
+from src.registry import SCAN_ORBS, EntityRegistry
+from src.spatial import BandIndex, SpatialHash, rect_extent
+
+
+class _Point:
+    def __init__(self, x, y):
+        self.x = x
+        self.y = y
+
+
+def _random_coordinate(rng, low, high):
+    # Whole pixels (as most entities sit on), fractions, and band edges
+    return rng.choice((rng.randint(low, high), rng.uniform(low, high), 25 * rng.randint(-2, 20)))
+
+
+def test_band_index_finds_exactly_the_points_in_a_box():
+    rng = random.Random(1)
+    index = BandIndex()
+    for _ in range(300):
+        points = [
+            _Point(_random_coordinate(rng, -50, 850), _random_coordinate(rng, -50, 530))
+            for _ in range(rng.randint(0, 80))
+        ]
+        index.refresh(points)
+        for _ in range(20):
+            left = _random_coordinate(rng, -60, 860)
+            top = _random_coordinate(rng, -60, 540)
+            right = left + rng.choice((0, rng.uniform(0, 400)))
+            bottom = top + rng.choice((0, rng.uniform(0, 120)))
+            found = [p for items in index.within(left, top, right, bottom) for p in items]
+            assert len(found) == len(set(map(id, found)))
+            # Every point in the box is found; anything else found is only
+            # outside it vertically, within the bands the box touches
+            inside = {id(p) for p in points
+                      if left <= p.x <= right and top <= p.y <= bottom}
+            assert inside <= set(map(id, found))
+            for p in found:
+                assert left <= p.x <= right
+                assert int(top // 25) <= int(p.y // 25) <= int(bottom // 25)
+
+
+def test_band_index_keeps_input_order_for_equal_x():
+    index = BandIndex()
+    points = [_Point(100, 10 + i) for i in range(5)]
+    index.refresh(points)
+    assert [p for items in index.within(100, 0, 100, 24) for p in items] == points
+
+
+def test_band_index_forgets_removed_points():
+    index = BandIndex()
+    index.refresh([_Point(100, 100)])
+    index.refresh([])
+    assert list(index.within(0, 0, 800, 480)) == []
+
+
+@pytest.mark.parametrize("count", (0, 1, SCAN_ORBS, SCAN_ORBS + 1, 30, 150))
+def test_registry_queries_match_linear_scans(count):
+    rng = random.Random(count)
+    registry = EntityRegistry(rng)
+    for trial in range(40):
+        registry.clear()
+        for i in range(count):
+            orb = registry.spawn_orb(
+                (_random_coordinate(rng, 60, 740), _random_coordinate(rng, -40, 500)), 1)
+            orb.frame = orb.FLOAT_FRAMES[i % 4]
+            if rng.random() < 0.3:
+                orb.trapped_enemy_type = rng.randint(0, 1)
+        registry.refresh_indexes()
+        orbs = registry.orbs
+        for k in range(40):
+            robot = Robot((rng.randint(70, 730), rng.randint(0, 480)), k % 2, rng)
+            assert registry.orb_in_band(robot.top, robot.bottom, robot.x, 200) is next(
+                (o for o in orbs
+                 if robot.top <= o.y < robot.bottom and abs(o.x - robot.x) < 200),
+                None)
+            assert registry.free_orb_centred_in(robot) is next(
+                (o for o in orbs
+                 if o.trapped_enemy_type is None and robot.collidepoint(o.center)),
+                None)
+            point = (rng.randint(60, 740), rng.randint(0, 480))
+            assert registry.orb_at(point) is next(
+                (o for o in orbs if o.collidepoint(point)), None)
+
+
+def test_spatial_hash_refiles_moved_items():
+    rng = random.Random(2)
+    registry = EntityRegistry(rng)
+    orbs = [registry.spawn_orb((rng.randint(80, 720), rng.randint(40, 440)), 1)
+            for _ in range(20)]
+    index = SpatialHash(rect_extent)
+    for tick in range(50):
+        for orb in orbs:
+            orb.y -= rng.randint(0, 30)
+        live = orbs[:20 - tick % 7]
+        index.refresh(live)
+        for orb in orbs:
+            filed = any(orb in items for items in index.within(*rect_extent(orb)))
+            assert filed == (orb in live)
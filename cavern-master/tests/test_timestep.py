@@ -0,0 +1,168 @@
+"""FixedTimestep: tick accounting, the catch-up cap, turbo and interpolation."""
+
+import random
+
+import pytest
+
+from src.registry import EntityRegistry
+from src.timestep import MAX_INTERPOLATE, FixedTimestep
+
+TICK = 0.25   # exact in binary, so tick counts don't hinge on rounding
+
+
+class _Body:
+    def __init__(self, x, y):
+        self.x = x
+        self.y = y
+
+
+class _Game:
+    """Bodies to draw, plus a registry for pooled entities."""
+
+    def __init__(self, *bodies):
+        self.bodies = list(bodies)
+        self.entities = EntityRegistry(random.Random(0))
+
+    def drawables(self):
+        yield from self.entities
+        yield from self.bodies
+
+
+class _App:
+    """Runs *step(app)* each tick and records what each draw saw."""
+
+    def __init__(self, game, step=None):
+        self.game = game
+        self.step = step
+        self.inputs = []
+        self.drawn = []
+
+    def update(self, input_state):
+        self.inputs.append(input_state)
+        if self.step:
+            self.step(self)
+
+    def draw(self, screen):
+        self.drawn.append([(body.x, body.y) for body in self.game.drawables()])
+        return screen
+
+
+def _driver(app, **kwargs):
+    inputs = iter(range(1000))
+    return FixedTimestep(app, lambda: next(inputs), tick=TICK, **kwargs)
+
+
+def _walk(dx):
+    """A tick step that moves every plain body *dx* pixels right."""
+    def step(app):
+        for body in app.game.bodies:
+            body.x += dx
+    return step
+
+
+def test_ticks_follow_real_time_and_keep_the_remainder():
+    app = _App(_Game())
+    driver = _driver(app)
+    assert driver.update(0.125) == 0
+    assert driver.alpha == 0.5
+    assert driver.update(0.125) == 1
+    assert driver.alpha == 0.0
+    assert driver.update(0.625) == 2
+    assert driver.alpha == 0.5
+    assert driver.ticks == 3
+    assert app.inputs == [0, 1, 2]   # one input read per tick
+    assert driver.dropped == 0.0
+
+
+def test_catch_up_is_capped_and_the_excess_dropped():
+    app = _App(_Game())
+    driver = _driver(app, max_ticks=5)
+    driver.update(0.125)
+    assert driver.update(3.0) == 5   # 12 ticks were due
+    assert driver.dropped == 7 * TICK
+    assert driver.alpha == 0.0       # the leftover went with them
+    assert driver.update(0.125) == 0
+    assert driver.ticks == 5
+
+
+def test_turbo_ignores_the_clock_and_never_interpolates():
+    body = _Body(0, 0)
+    app = _App(_Game(body), _walk(4))
+    driver = _driver(app, turbo=8, interpolate=True)
+    assert driver.update(0.0) == 8
+    assert driver.update(10.0) == 8
+    assert driver.dropped == 0.0
+    driver.draw("screen")
+    assert app.drawn == [[(64, 0)]]
+
+
+def test_draw_blends_by_alpha_and_restores_positions():
+    body = _Body(100, 50)
+    app = _App(_Game(body), _walk(4))
+    driver = _driver(app, interpolate=True)
+    driver.update(TICK + TICK / 2)   # one tick, then half of the next
+    assert driver.draw("screen") == "screen"
+    assert app.drawn == [[(102.0, 50.0)]]
+    assert (body.x, body.y) == (104, 50)
+
+    driver.update(TICK / 4)   # no tick: the same pair, further along
+    driver.draw("screen")
+    assert app.drawn[-1] == [(103.0, 50.0)]
+    assert (body.x, body.y) == (104, 50)
+
+
+def test_long_jumps_are_drawn_where_they_land():
+    body = _Body(100, 50)
+
+    def jump(app):
+        body.x += MAX_INTERPOLATE + 1
+
+    app = _App(_Game(body), jump)
+    driver = _driver(app, interpolate=True)
+    driver.update(TICK + TICK / 2)
+    driver.draw("screen")
+    assert app.drawn == [[(100 + MAX_INTERPOLATE + 1, 50)]]
+
+
+def test_entities_recycled_during_the_tick_are_not_blended():
+    game = _Game()
+    old = game.entities.spawn_bolt((100, 200), 1)
+
+    def recycle(app):
+        # The bolt expires and its object comes straight back as a new bolt
+        # 10 pixels away, which must not be drawn gliding from the old one
+        old.active = False
+        game.entities.prune()
+        new = game.entities.spawn_bolt((110, 200), 1)
+        assert new is old
+
+    app = _App(game, recycle)
+    driver = _driver(app, interpolate=True)
+    driver.update(TICK + TICK / 2)
+    driver.draw("screen")
+    assert app.drawn == [[(110, 200)]]
+
+
+def test_nothing_is_blended_across_a_change_of_game():
+    body = _Body(100, 50)
+    app = _App(_Game(body))
+
+    def switch(app):
+        app.game = _Game(body)
+        body.x += 4
+
+    app.step = switch
+    driver = _driver(app, interpolate=True)
+    driver.update(TICK + TICK / 2)
+    driver.draw("screen")
+    assert app.drawn == [[(104, 50)]]
+
+
+@pytest.mark.parametrize("interpolate", [False, True])
+def test_without_ticks_draw_shows_the_simulation_as_is(interpolate):
+    body = _Body(100, 50)
+    app = _App(_Game(body), _walk(4))
+    driver = _driver(app, interpolate=interpolate)
+    driver.update(TICK / 2)
+    driver.draw("screen")
+    assert app.drawn == [[(100, 50)]]
@@ -0,0 +1,82 @@
+"""VecCavern episode boundaries and call order."""
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from src.constants import MAX_ORBS  # noqa: E402
+from src.vecenv import (  # noqa: E402
+    _GLOBALS,
+    _ORB,
+    _PLAYER,
+    _ROBOT,
+    MAX_ROBOTS,
+    OBS_SIZE,
+    VecCavern,
+    observe,
+)
+
+
+def _clear_level(game) -> None:
+    """Remove everything that keeps the level going, so the next update
+    moves on to the next level."""
+    game.pending_enemies.clear()
+    game.entities.clear()
+
+
+def test_episode_ends_at_max_frames_across_a_level_change():
+    env = VecCavern(1, max_frames=50)
+    env.reset()
+    game = env._chunks[0]._games[0]
+    idle = np.zeros(1, np.uint8)
+    for step in range(1, 50):
+        if step == 10:
+            _clear_level(game)
+        _, _, dones = env.step(idle)
+        assert not dones[0], f"episode ended early, at step {step}"
+        if step == 10:
+            assert game.level == 1   # the level changed, resetting game.timer
+    _, _, dones = env.step(idle)
+    assert dones[0]
+    assert env._chunks[0]._games[0] is not game   # reset to a new episode
+    env.close()
+
+
+def test_each_episode_gets_the_full_limit():
+    env = VecCavern(2, max_frames=20)
+    env.reset()
+    idle = np.zeros(2, np.uint8)
+    ends = []
+    for step in range(1, 61):
+        _, _, dones = env.step(idle)
+        if dones.all():
+            ends.append(step)
+    assert ends == [20, 40, 60]
+    env.close()
+
+
+@pytest.mark.parametrize("backend", ["sync", "thread", "process"])
+def test_step_before_reset_is_refused(backend):
+    with VecCavern(2, backend=backend, workers=2) as env:
+        with pytest.raises(RuntimeError, match="before reset"):
+            env.step(np.zeros(2, np.uint8))
+        env.reset()
+        observations, _, _ = env.step(np.zeros(2, np.uint8))
+        assert observations.shape == (2, OBS_SIZE)
+
+
+def test_every_orb_the_player_can_have_out_is_observed():
+    env = VecCavern(1)
+    env.reset()
+    game = env._chunks[0]._games[0]
+    game.entities.clear()
+    for k in range(game.max_orbs):
+        game.entities.spawn_orb((100 + 50 * k, 200), 1)
+    observation = np.zeros(OBS_SIZE, np.float32)
+    observe(game, observation)
+    orbs = _GLOBALS + _PLAYER + MAX_ROBOTS * _ROBOT
+    present = observation[orbs:orbs + MAX_ORBS * _ORB:_ORB]
+    assert list(present) == [1] * game.max_orbs
+    assert list(observation[orbs + 1:orbs + MAX_ORBS * _ORB:_ORB]) == [
+        100 + 50 * k for k in range(game.max_orbs)]
+    env.close()